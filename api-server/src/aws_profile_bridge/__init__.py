@@ -6,6 +6,13 @@ A refactored implementation following SOLID, DRY, and KISS principles.
 
 __version__ = "2.0.0"
 
-from .core.bridge import AWSProfileBridge, main
-
 __all__ = ["AWSProfileBridge", "main"]
+
+
+def __getattr__(name: str):
+    """Load the bridge lazily so light entry points avoid importing boto3."""
+    if name in __all__:
+        from .core import bridge
+
+        return getattr(bridge, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,21 +5,33 @@ Main entry point for aws_profile_bridge package - Python 3.12+
 
 import sys
 
-# CRITICAL: Import logging configuration FIRST, before any other modules
-# This prevents boto3 and other libraries from writing to stderr
-from .config import logging  # noqa: F401
-from .app import main as app_main
-from .auth.token_manager import TokenManager
-from .config import settings
-from .core.bridge import main as bridge_main
+# Server modules (fastapi, uvicorn, boto3) and the logging configuration are
+# imported where they are used so --version and --help return without them.
 
 
 def main() -> int:
     """Main entry point with subcommand support."""
+    args = sys.argv[1:]
+
+    # Informational flags never touch logging, settings or the server stack
+    if args in (["--version"], ["-v"]):
+        print("AWS Profile Bridge v2.0.0 (Python 3.12+)")
+        return 0
+
+    if args in (["--help"], ["-h"], []):
+        print_help()
+        return 0
+
+    # CRITICAL: Import logging configuration before any other modules.
+    # Native messaging callers land on the default arm below and boto3 must
+    # not write to stderr there.
+    from .config import logging  # noqa: F401
 
     # Python 3.12 match statement for clean command routing
-    match sys.argv[1:]:
+    match args:
         case ["api"] | ["server"] | ["api-server"]:
+            from .app import main as app_main
+
             app_main()
             return 0
 
@@ -27,22 +39,19 @@ def main() -> int:
             rotate_token()
             return 0
 
-        case ["--version"] | ["-v"]:
-            print("AWS Profile Bridge v2.0.0 (Python 3.12+)")
-            return 0
-
-        case ["--help"] | ["-h"] | []:
-            print_help()
-            return 0
-
         case _:
             # Original native messaging functionality
+            from .core.bridge import main as bridge_main
+
             bridge_main()
             return 0
 
 
 def rotate_token() -> None:
     """Rotate API token."""
+    from .auth.token_manager import TokenManager
+    from .config import settings
+
     token_manager = TokenManager(settings.CONFIG_FILE)
     token_manager.load_or_create()
     new_token = token_manager.rotate()
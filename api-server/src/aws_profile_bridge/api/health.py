@@ -1,30 +1,29 @@
-"""Health and version API routes."""
+"""Health and version payloads (served by HealthCheckInterceptor)."""
 
 import sys
 import time
+from functools import cache
 
-from fastapi import APIRouter
+start_time: float = time.monotonic()
 
-router = APIRouter()
-start_time: float = time.time()
+# Static part of the /health payload; only the uptime changes between calls.
+HEALTH_FIELDS: dict[str, str] = {
+    "status": "healthy",
+    "version": "2.0.0",
+    "python_version": sys.version.split()[0],
+}
 
 
-@router.get("/health")
-@router.options("/health")
-async def health_check():
-    """Health check endpoint for monitoring."""
-    return {
-        "status": "healthy",
-        "version": "2.0.0",
-        "uptime_seconds": time.time() - start_time,
-        "python_version": sys.version.split()[0],
-    }
-
+@cache
+def version_payload() -> dict[str, str]:
+    """
+    The /version payload, built on first request.
 
-@router.get("/version")
-async def version_info():
-    """Get detailed version information."""
+    It never changes during the process lifetime, but platform.platform()
+    shells out on some systems, so it is kept off the import path.
+    """
     import platform
+
     import fastapi
 
     return {
@@ -34,3 +33,8 @@ async def version_info():
         "platform": platform.platform(),
         "fastapi_version": fastapi.__version__,
     }
+
+
+def uptime_seconds() -> float:
+    """Seconds elapsed since the API module was loaded."""
+    return time.monotonic() - start_time
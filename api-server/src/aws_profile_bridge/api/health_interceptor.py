@@ -0,0 +1,132 @@
+"""Pure ASGI interceptor answering health probes and CORS preflights."""
+
+import re
+
+import orjson
+from starlette.routing import Match
+
+from ..config import settings
+from . import health
+
+HEALTH_PATH = "/health"
+VERSION_PATH = "/version"
+INTERCEPTED_PATHS = frozenset({HEALTH_PATH, VERSION_PATH})
+
+JSON_HEADERS = [(b"content-type", b"application/json")]
+METHOD_NOT_ALLOWED_BODY = b'{"detail":"Method Not Allowed"}'
+PREFLIGHT_BODY = b"{}"
+
+
+class HealthCheckInterceptor:
+    """
+    Serves /health, /version and CORS preflights ahead of the FastAPI app.
+
+    Monitoring probes and CORS preflights fire constantly and never need
+    authentication, so they are matched directly on the ASGI scope and
+    answered without touching middleware or routing. Only genuine preflights
+    (Origin and Access-Control-Request-Method set, allowed origin) for a path
+    the app routes are answered here; every other request, including plain
+    OPTIONS, and the lifespan protocol is passed through.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        # Everything but the uptime is fixed, so serialize it once up front
+        self._health_prefix = orjson.dumps(health.HEALTH_FIELDS)[:-1] + b',"uptime_seconds":'
+        self._version_body: bytes | None = None
+
+        self._allow_any_origin = "*" in settings.CORS_ORIGINS
+        self._allowed_origins = frozenset(o.encode() for o in settings.CORS_ORIGINS)
+        # Compiled once; matched against the raw header bytes per preflight
+        self._origin_regex = (
+            re.compile(settings.CORS_ORIGIN_REGEX.encode())
+            if settings.CORS_ORIGIN_REGEX
+            else None
+        )
+        # Preflights are answered here only for paths the wrapped app routes
+        self._routes = tuple(getattr(app, "routes", ()))
+        self._preflight_headers = [
+            (b"access-control-allow-methods", ", ".join(settings.CORS_ALLOW_METHODS).encode()),
+            (b"access-control-allow-headers", ", ".join(settings.CORS_ALLOW_HEADERS).encode()),
+            (b"access-control-max-age", str(settings.CORS_MAX_AGE).encode()),
+        ]
+        if self._allow_any_origin:
+            self._preflight_headers.append((b"access-control-allow-origin", b"*"))
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and self._is_routed_preflight(scope):
+            await self._respond(send, 200, PREFLIGHT_BODY, self._preflight_for(scope))
+            return
+
+        if scope["path"] not in INTERCEPTED_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] != "GET":
+            await self._respond(
+                send, 405, METHOD_NOT_ALLOWED_BODY, [(b"allow", b"GET")]
+            )
+            return
+
+        if scope["path"] == HEALTH_PATH:
+            body = self._health_prefix + orjson.dumps(health.uptime_seconds()) + b"}"
+        else:
+            if self._version_body is None:
+                self._version_body = orjson.dumps(health.version_payload())
+            body = self._version_body
+
+        await self._respond(send, 200, body, self._cors_for(scope))
+
+    def _is_routed_preflight(self, scope) -> bool:
+        """Whether an OPTIONS request is a preflight from an allowed origin to a routed path."""
+        origin = None
+        has_request_method = False
+        for key, value in scope["headers"]:
+            if key == b"origin":
+                origin = value
+            elif key == b"access-control-request-method":
+                has_request_method = True
+
+        if origin is None or not has_request_method:
+            return False
+        if not (self._allow_any_origin or self._origin_allowed(origin)):
+            return False
+        return any(route.matches(scope)[0] is not Match.NONE for route in self._routes)
+
+    def _cors_for(self, scope) -> list[tuple[bytes, bytes]]:
+        """Access-Control-Allow-Origin for a simple cross-origin GET, as CORSMiddleware adds it."""
+        origin = next((v for k, v in scope["headers"] if k == b"origin"), None)
+        if origin is None:
+            return []
+        if self._allow_any_origin:
+            return [(b"access-control-allow-origin", b"*")]
+        if self._origin_allowed(origin):
+            return [(b"access-control-allow-origin", origin), (b"vary", b"Origin")]
+        return []
+
+    def _preflight_for(self, scope) -> list[tuple[bytes, bytes]]:
+        """CORS headers for a preflight; echo the origin when it is allow-listed."""
+        if self._allow_any_origin:
+            return self._preflight_headers
+        return [*self._preflight_headers, *self._cors_for(scope)]
+
+    def _origin_allowed(self, origin: bytes) -> bool:
+        """Whether an Origin is listed in CORS_ORIGINS or matches CORS_ORIGIN_REGEX."""
+        if origin in self._allowed_origins:
+            return True
+        return self._origin_regex is not None and self._origin_regex.fullmatch(origin) is not None
+
+    @staticmethod
+    async def _respond(send, status_code: int, body: bytes, extra_headers=()) -> None:
+        """Send a complete JSON response in two ASGI messages."""
+        headers = [
+            *JSON_HEADERS,
+            (b"content-length", str(len(body)).encode()),
+            *extra_headers,
+        ]
+        await send({"type": "http.response.start", "status": status_code, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
@@ -1,18 +1,28 @@
 """Profile-related API routes."""
 
 import asyncio
+import functools
 import logging
+from concurrent.futures import Executor
+from typing import TYPE_CHECKING
 
-from fastapi import APIRouter, Header, Request
+from fastapi import APIRouter, Header, HTTPException
 
 from ..auth.authenticator import Authenticator
-from ..core.bridge import AWSProfileBridge
 from ..utils.validators import validate_profile_name
 
+if TYPE_CHECKING:
+    from ..core.bridge import AWSProfileBridge
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 authenticator: Authenticator | None = None
+bridge: "AWSProfileBridge | None" = None
+# Separate pools keep slow SSO/console-URL calls from starving /profiles.
+# None falls back to the event loop's default executor.
+fast_executor: Executor | None = None
+slow_executor: Executor | None = None
 
 
 def set_authenticator(auth: Authenticator) -> None:
@@ -21,98 +31,92 @@ def set_authenticator(auth: Authenticator) -> None:
     authenticator = auth
 
 
-@router.get("/profiles")
-@router.post("/profiles")
-@router.options("/profiles")
-async def get_profiles(request: Request, x_api_token: str | None = Header(None, alias="X-API-Token")):
-    """Get all AWS profiles (fast mode)."""
-    if request.method == "OPTIONS":
-        return {}
-    
-    authenticator.authenticate(x_api_token)
+def set_bridge(instance: "AWSProfileBridge") -> None:
+    """Set the shared bridge instance (built once at startup)."""
+    global bridge
+    bridge = instance
 
-    try:
-        bridge = AWSProfileBridge()
-        handler = bridge.message_handler
 
-        result = await asyncio.wait_for(
-            asyncio.to_thread(handler._handle_get_profiles), timeout=5.0
-        )
+def set_executors(fast: Executor, slow: Executor) -> None:
+    """Set the thread pools for fast (profile list) and slow (SSO/AWS) work."""
+    global fast_executor, slow_executor
+    fast_executor = fast
+    slow_executor = slow
 
-        return result
 
-    except asyncio.TimeoutError:
-        logger.error("Profile list request timed out")
-        return {"action": "error", "message": "Request timed out after 5 seconds"}
-    except Exception as e:
-        logger.exception("Error getting profiles")
-        return {"action": "error", "message": f"Failed to get profiles: {e!s}"}
+async def run_in_executor(executor: Executor | None, func, *args):
+    """Run a blocking handler method in the given thread pool."""
+    return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
 
 
-@router.get("/profiles/enrich")
-@router.post("/profiles/enrich")
-@router.options("/profiles/enrich")
-async def get_profiles_enriched(
-    request: Request, x_api_token: str | None = Header(None, alias="X-API-Token")
-):
-    """Get all AWS profiles with SSO enrichment."""
-    if request.method == "OPTIONS":
-        return {}
-    
-    authenticator.authenticate(x_api_token)
+def timed_handler(timeout: float, op_name: str):
+    """
+    Bound a route by ``timeout`` seconds and turn failures into error payloads.
 
-    try:
-        bridge = AWSProfileBridge()
-        handler = bridge.message_handler
+    HTTP errors (authentication, validation) are re-raised so FastAPI still
+    answers them with the proper status code.
+    """
 
-        result = await asyncio.wait_for(
-            asyncio.to_thread(handler._handle_enrich_sso_profiles, {}), timeout=30.0
-        )
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                async with asyncio.timeout(timeout):
+                    return await func(*args, **kwargs)
+            except HTTPException:
+                raise
+            except TimeoutError:
+                logger.error(f"{op_name} timed out")
+                return {
+                    "action": "error",
+                    "message": f"Request to {op_name} timed out after {timeout:g} seconds",
+                }
+            except Exception as e:
+                logger.exception(f"Failed to {op_name}")
+                return {"action": "error", "message": f"Failed to {op_name}: {e!s}"}
 
-        return result
+        return wrapper
 
-    except asyncio.TimeoutError:
-        logger.error("Profile enrichment timed out")
-        return {
-            "action": "error",
-            "message": "SSO enrichment timed out after 30 seconds",
-        }
-    except Exception as e:
-        logger.exception("Error enriching profiles")
-        return {"action": "error", "message": f"Failed to enrich profiles: {e!s}"}
+    return decorator
+
+
+@router.get("/profiles")
+@router.post("/profiles")
+@timed_handler(5.0, "get profiles")
+async def get_profiles(x_api_token: str | None = Header(None, alias="X-API-Token")):
+    """Get all AWS profiles (fast mode)."""
+    authenticator.authenticate(x_api_token)
+    handler = bridge.message_handler
+    return await run_in_executor(fast_executor, handler._handle_get_profiles)
+
+
+@router.get("/profiles/enrich")
+@router.post("/profiles/enrich")
+@timed_handler(30.0, "enrich profiles")
+async def get_profiles_enriched(x_api_token: str | None = Header(None, alias="X-API-Token")):
+    """Get all AWS profiles with SSO enrichment."""
+    authenticator.authenticate(x_api_token)
+    handler = bridge.message_handler
+    return await run_in_executor(slow_executor, handler._handle_enrich_sso_profiles, {})
 
 
 @router.post("/profiles/{profile_name}/console-url")
-@router.options("/profiles/{profile_name}/console-url")
+@timed_handler(15.0, "generate console URL")
 async def get_console_url(
-    profile_name: str, request: Request, x_api_token: str | None = Header(None, alias="X-API-Token")
+    profile_name: str, x_api_token: str | None = Header(None, alias="X-API-Token")
 ):
     """Generate AWS Console URL for specified profile."""
-    if request.method == "OPTIONS":
-        return {}
-    
     authenticator.authenticate(x_api_token)
     profile_name = validate_profile_name(profile_name)
+    handler = bridge.message_handler
+    return await run_in_executor(
+        slow_executor, handler._handle_open_profile, {"profileName": profile_name}
+    )
+
 
-    try:
-        bridge = AWSProfileBridge()
-        handler = bridge.message_handler
-
-        result = await asyncio.wait_for(
-            asyncio.to_thread(
-                handler._handle_open_profile, {"profileName": profile_name}
-            ),
-            timeout=15.0,
-        )
-
-        return result
-
-    except asyncio.TimeoutError:
-        logger.error(f"Console URL generation timed out for {profile_name}")
-        return {
-            "action": "error",
-            "message": f"Console URL generation timed out for {profile_name}",
-        }
-    except Exception as e:
-        logger.exception(f"Error generating console URL for {profile_name}")
-        return {"action": "error", "message": f"Failed to generate console URL: {e!s}"}
+@router.options("/profiles")
+@router.options("/profiles/enrich")
+@router.options("/profiles/{profile_name}/console-url")
+async def profiles_options():
+    """Answer plain OPTIONS requests; CORS preflights are served by HealthCheckInterceptor."""
+    return {}
@@ -1,18 +1,29 @@
 """Region-related API routes."""
 
+import asyncio
+import json
 import logging
-from functools import lru_cache
 
-import boto3
-from fastapi import APIRouter, Header, Request
+from fastapi import APIRouter, Header
 
 from ..auth.authenticator import Authenticator
+from ..config import settings
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 authenticator: Authenticator | None = None
 
+# Stale-while-revalidate cache: requests always read this list, a background
+# task replaces it only when a refresh succeeds.
+regions_cache: list[dict[str, str]] = []
+
+# EC2 client reused across refreshes (botocore model loading is expensive)
+_ec2_client = None
+
+# Serializes the one-off synchronous fill used while nothing is cached yet
+_cold_fill_lock = asyncio.Lock()
+
 
 def set_authenticator(auth: Authenticator) -> None:
     """Set the authenticator instance."""
@@ -20,17 +31,26 @@ def set_authenticator(auth: Authenticator) -> None:
     authenticator = auth
 
 
-@lru_cache(maxsize=1)
-def get_aws_regions() -> list[dict[str, str]]:
+def get_ec2_client():
+    """Return the shared us-east-1 EC2 client, creating it on first use."""
+    global _ec2_client
+    if _ec2_client is None:
+        import boto3
+
+        _ec2_client = boto3.client("ec2", region_name="us-east-1")
+    return _ec2_client
+
+
+def fetch_aws_regions() -> list[dict[str, str]] | None:
     """Fetch all AWS regions from EC2 service.
-    
+
     Returns:
-        List of region dictionaries with 'code' and 'name' keys
+        List of region dictionaries with 'code' and 'name' keys,
+        or None if the regions could not be fetched
     """
     try:
-        ec2 = boto3.client('ec2', region_name='us-east-1')
-        response = ec2.describe_regions(AllRegions=False)
-        
+        response = get_ec2_client().describe_regions(AllRegions=False)
+
         regions = []
         for region in response['Regions']:
             region_code = region['RegionName']
@@ -40,28 +60,78 @@ def get_aws_regions() -> list[dict[str, str]]:
                 'code': region_code,
                 'name': region_name
             })
-        
+
         # Sort by region code
         regions.sort(key=lambda x: x['code'])
         return regions
     except Exception as e:
         logger.error(f"Failed to fetch AWS regions: {e}")
-        # Return empty list on error
-        return []
+        return None
+
+
+def load_cached_regions() -> None:
+    """Seed the cache from the last regions saved to disk (offline startup)."""
+    global regions_cache
+    try:
+        regions_cache = json.loads(settings.REGIONS_CACHE_FILE.read_text())
+        logger.info(f"Loaded {len(regions_cache)} regions from {settings.REGIONS_CACHE_FILE}")
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable regions cache: {e}")
+
+
+def refresh_regions() -> bool:
+    """Fetch regions and replace the cache; keep serving stale data on failure."""
+    global regions_cache
+    regions = fetch_aws_regions()
+    if not regions:
+        return False
+
+    regions_cache = regions
+    try:
+        settings.REGIONS_CACHE_FILE.write_text(json.dumps(regions))
+    except Exception as e:
+        logger.warning(f"Failed to persist regions cache: {e}")
+    return True
+
+
+async def refresh_regions_loop() -> None:
+    """Refresh the regions cache in the background every REGIONS_REFRESH_SECONDS."""
+    while True:
+        await asyncio.to_thread(refresh_regions)
+        await asyncio.sleep(settings.REGIONS_REFRESH_SECONDS)
+
+
+async def fill_cold_cache() -> None:
+    """Fetch regions in-request when nothing is cached, bounded by REGIONS_COLD_FILL_TIMEOUT.
+
+    Only needed on a first start without regions.json; concurrent requests
+    share one fetch. A fetch that times out keeps running and fills the
+    cache when it completes.
+    """
+    async with _cold_fill_lock:
+        if regions_cache:
+            return
+        try:
+            await asyncio.wait_for(
+                asyncio.to_thread(refresh_regions), settings.REGIONS_COLD_FILL_TIMEOUT
+            )
+        except TimeoutError:
+            logger.warning("Timed out fetching regions for an empty cache")
 
 
 @router.get("/regions")
-@router.options("/regions")
-async def list_regions(request: Request, x_api_token: str | None = Header(None, alias="X-API-Token")):
+async def list_regions(x_api_token: str | None = Header(None, alias="X-API-Token")):
     """Get list of all AWS regions."""
-    if request.method == "OPTIONS":
-        return {}
-    
     authenticator.authenticate(x_api_token)
-    
-    try:
-        regions = get_aws_regions()
-        return {"regions": regions}
-    except Exception as e:
-        logger.exception("Error fetching regions")
-        return {"action": "error", "message": f"Failed to fetch regions: {e!s}"}
+
+    if not regions_cache:
+        await fill_cold_cache()
+    return {"regions": regions_cache}
+
+
+@router.options("/regions")
+async def regions_options():
+    """Answer plain OPTIONS requests; CORS preflights are served by HealthCheckInterceptor."""
+    return {}
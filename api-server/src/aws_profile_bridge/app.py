@@ -3,16 +3,19 @@
 import asyncio
 import logging
 import os
+import queue
 import signal
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
+import orjson
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-import uvicorn
+from fastapi.responses import JSONResponse
 
-from .api import health, profiles, regions
+from .api.health_interceptor import HealthCheckInterceptor
 from .auth.authenticator import Authenticator
 from .auth.rate_limiter import RateLimiter
 from .auth.token_manager import TokenManager
@@ -20,8 +23,50 @@ from .config import settings
 from .middleware.logging import log_requests
 
 
+log_listener: QueueListener | None = None
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    FastAPI's own ORJSONResponse is deprecated in current releases and warns
+    on every response; this keeps the same rendering without the warning.
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders ``asctime`` at most once per second.
+
+    Only suitable for second-resolution date formats (no milliseconds).
+    The cache is a single (second, text) tuple swapped atomically, so it stays
+    consistent even if records are ever formatted from more than one thread.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_time: tuple[int, str] = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        second = int(record.created)
+        cached_second, cached_text = self._cached_time
+        if second == cached_second:
+            return cached_text
+
+        text = super().formatTime(record, datefmt)
+        self._cached_time = (second, text)
+        return text
+
+
 def setup_logging() -> logging.Logger:
-    """Configure rotating file logger."""
+    """Configure rotating file logger.
+
+    Records are handed to a queue and written by a QueueListener thread, so
+    request handlers never block on file I/O or rotation.
+    """
+    global log_listener
     settings.LOG_DIR.mkdir(parents=True, exist_ok=True)
 
     logger = logging.getLogger("aws_profile_bridge")
@@ -34,23 +79,62 @@ def setup_logging() -> logging.Logger:
         encoding="utf-8",
     )
 
-    formatter = logging.Formatter(
+    formatter = CachedTimeFormatter(
         fmt="{asctime} | {levelname:8} | {name} | {message}",
         style="{",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
     handler.setFormatter(formatter)
-    logger.addHandler(handler)
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+    log_listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    start_log_listener()
 
     return logger
 
 
+def start_log_listener() -> None:
+    """Start draining the log queue, unless the listener is already running."""
+    if log_listener is not None and log_listener._thread is None:
+        log_listener.start()
+
+
+def stop_log_listener() -> None:
+    """Flush queued records to the log file and stop; a no-op when already stopped."""
+    if log_listener is not None and log_listener._thread is not None:
+        log_listener.stop()
+
+
 logger = setup_logging()
 
 
+def signal_ready() -> None:
+    """Notify a launching CLI (server start --daemon / restart) that startup is done.
+
+    The CLI passes the write end of a pipe via SERVER_READY_FD_ENV and waits on
+    the read end instead of sleeping and scanning for the process. Called once
+    the server is listening, so a failed bind is never reported as ready.
+    """
+    fd = os.environ.pop(settings.SERVER_READY_FD_ENV, None)
+    if fd is None:
+        return
+    try:
+        os.write(int(fd), b"1")
+        os.close(int(fd))
+    except (OSError, ValueError):
+        pass
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifecycle."""
+    from .api import profiles, regions
+    from .core.bridge import AWSProfileBridge
+
+    # Stopped by a previous shutdown when the app is started again in-process
+    start_log_listener()
+
     logger.info("Starting AWS Profile Bridge API v2.0.0")
     logger.info(f"Python {sys.version}")
     logger.info(f"PID: {__import__('os').getpid()}")
@@ -71,6 +155,19 @@ async def lifespan(app: FastAPI):
     profiles.set_authenticator(authenticator)
     regions.set_authenticator(authenticator)
 
+    # Build the bridge once; routes reuse its message handler
+    profiles.set_bridge(AWSProfileBridge())
+    logger.info("AWS profile bridge initialized")
+
+    # Dedicated pools so slow SSO/AWS calls can't starve the profile list
+    fast_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="fast")
+    slow_executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix="sso")
+    profiles.set_executors(fast_executor, slow_executor)
+
+    # Serve regions from cache; refresh them in the background
+    regions.load_cached_regions()
+    regions_task = asyncio.create_task(regions.refresh_regions_loop())
+
     # Setup graceful shutdown
     loop = asyncio.get_running_loop()
 
@@ -83,41 +180,76 @@ async def lifespan(app: FastAPI):
 
     yield
 
+    regions_task.cancel()
+    fast_executor.shutdown(wait=False, cancel_futures=True)
+    slow_executor.shutdown(wait=False, cancel_futures=True)
     logger.info("Shutting down AWS Profile Bridge API")
+    stop_log_listener()
 
 
 def create_app() -> FastAPI:
     """Create and configure FastAPI application."""
-    app = FastAPI(title="AWS Profile Bridge API", version="2.0.0", lifespan=lifespan)
+    # Route modules pull in boto3 via the core package; import them on demand
+    from .api import profiles, regions
+
+    app = FastAPI(
+        title="AWS Profile Bridge API",
+        version="2.0.0",
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
+    )
 
     # CORS middleware
     app.add_middleware(
         CORSMiddleware,
         allow_origins=settings.CORS_ORIGINS,
-        allow_methods=["POST", "GET", "OPTIONS"],
-        allow_headers=["Content-Type", "X-API-Token"],
+        allow_origin_regex=settings.CORS_ORIGIN_REGEX,
+        allow_methods=settings.CORS_ALLOW_METHODS,
+        allow_headers=settings.CORS_ALLOW_HEADERS,
         allow_credentials=False,
     )
 
     # Logging middleware
     app.middleware("http")(log_requests)
 
-    # Register routes
-    app.include_router(health.router)
+    # Register routes (/health, /version and preflights are served by HealthCheckInterceptor)
     app.include_router(profiles.router)
     app.include_router(regions.router)
 
     return app
 
 
-app = create_app()
+fastapi_app = create_app()
+app = HealthCheckInterceptor(fastapi_app)
+
+
+def _serve(config) -> None:
+    """Run a uvicorn server, signalling readiness only once it is listening.
+
+    Lifespan startup runs before uvicorn binds its socket, so readiness is
+    reported after Server.startup() has completed; a bind failure exits there
+    without signalling and the launching CLI sees the pipe close instead.
+    """
+    import uvicorn
+
+    class ReadySignallingServer(uvicorn.Server):
+        async def startup(self, sockets=None) -> None:
+            await super().startup(sockets=sockets)
+            if self.started:
+                signal_ready()
+
+    ReadySignallingServer(config).run()
 
 
 def start_server() -> None:
     """Run the API server."""
+    import uvicorn
+
     match os.getenv("ENV", "production").lower():
         case "development" | "dev":
-            uvicorn.run(
+            from uvicorn.supervisors import ChangeReload
+
+            config = uvicorn.Config(
                 "aws_profile_bridge.app:app",
                 host=settings.HOST,
                 port=settings.PORT,
@@ -126,15 +258,29 @@ def start_server() -> None:
                 timeout_keep_alive=5,
                 limit_concurrency=10,
             )
+            # What uvicorn.run does for reload, split so readiness can be
+            # reported here: the socket is bound in this process, while the
+            # worker that serves it is spawned without the ready fd
+            sock = config.bind_socket()
+            signal_ready()
+            ChangeReload(config, target=uvicorn.Server(config).run, sockets=[sock]).run()
         case "production" | "prod":
-            uvicorn.run(
-                app,
-                host=settings.HOST,
-                port=settings.PORT,
-                log_level="warning",
-                access_log=False,
-                timeout_keep_alive=5,
-                limit_concurrency=10,
+            # uvloop/httptools ship with uvicorn[standard] except on Windows.
+            # Single worker on purpose: token, rate-limit and cache state is
+            # per-process.
+            fast_io = sys.platform != "win32"
+            _serve(
+                uvicorn.Config(
+                    app,
+                    host=settings.HOST,
+                    port=settings.PORT,
+                    loop="uvloop" if fast_io else "auto",
+                    http="httptools" if fast_io else "auto",
+                    log_level="warning",
+                    access_log=False,
+                    timeout_keep_alive=5,
+                    limit_concurrency=10,
+                )
             )
         case _:
             logger.error(f"Unknown environment: {os.getenv('ENV')}")
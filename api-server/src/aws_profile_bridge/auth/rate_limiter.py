@@ -3,7 +3,7 @@
 import time
 import hashlib
 import logging
-from collections import defaultdict
+from collections import defaultdict, deque
 
 logger = logging.getLogger(__name__)
 
@@ -14,25 +14,38 @@ class RateLimiter:
     def __init__(self, max_attempts: int, window_seconds: int):
         self.max_attempts = max_attempts
         self.window_seconds = window_seconds
-        self._attempts: dict[str, list[float]] = defaultdict(list)
+        # Only the newest max_attempts timestamps can decide a rate limit
+        self._attempts: dict[bytes, deque[float]] = defaultdict(
+            lambda: deque(maxlen=self.max_attempts)
+        )
 
     def is_rate_limited(self, token: str | None) -> bool:
         """Check if token is rate limited."""
         token_id = self._hash_token(token)
         self._cleanup_old_attempts(token_id)
-        return len(self._attempts[token_id]) >= self.max_attempts
+        attempts = self._attempts.get(token_id)
+        return attempts is not None and len(attempts) >= self.max_attempts
 
     def record_failure(self, token: str | None) -> None:
         """Record a failed attempt."""
         token_id = self._hash_token(token)
         self._attempts[token_id].append(time.time())
-        logger.warning(f"Failed attempt for token hash {token_id[:8]}")
+        logger.warning(f"Failed attempt for token hash {token_id.hex()[:8]}")
 
-    def _hash_token(self, token: str | None) -> str:
-        """Hash token for rate limiting."""
-        return hashlib.sha256((token or "").encode()).hexdigest()
+    def _hash_token(self, token: str | None) -> bytes:
+        """Hash token into a compact bucket key (BLAKE2b, 128-bit digest)."""
+        return hashlib.blake2b((token or "").encode(), digest_size=16).digest()
 
-    def _cleanup_old_attempts(self, token_id: str) -> None:
-        """Remove attempts outside the time window."""
+    def _cleanup_old_attempts(self, token_id: bytes) -> None:
+        """Remove attempts outside the time window, dropping empty buckets."""
+        attempts = self._attempts.get(token_id)
+        if attempts is None:
+            return
+
+        # Timestamps are appended in order, so expired ones sit at the left
         cutoff = time.time() - self.window_seconds
-        self._attempts[token_id] = [t for t in self._attempts[token_id] if t > cutoff]
+        while attempts and attempts[0] <= cutoff:
+            attempts.popleft()
+
+        if not attempts:
+            del self._attempts[token_id]
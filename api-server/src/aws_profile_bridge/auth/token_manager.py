@@ -1,11 +1,14 @@
 """Token generation and validation."""
 
-import json
 import re
 import secrets
 import logging
 import zlib
+from functools import lru_cache
 from pathlib import Path
+from typing import Literal
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -16,71 +19,83 @@ class TokenManager:
     TOKEN_PREFIX = "awspc"
     RANDOM_BYTES = 32
     BASE62_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+    _BASE62_BYTES = BASE62_ALPHABET.encode("ascii")
 
     # Legacy pattern for backward compatibility (base64url-like, no multiple underscores)
-    LEGACY_PATTERN = re.compile(r"^(?!.*__)[A-Za-z0-9_-]{32,64}$")
+    LEGACY_PATTERN = re.compile(r"^(?!.*__)[A-Za-z0-9_-]{32,64}$", re.ASCII)
     # New pattern with prefix and checksum
-    NEW_PATTERN = re.compile(r"^awspc_[A-Za-z0-9]{43}_[A-Za-z0-9]{6}$")
+    NEW_PATTERN = re.compile(r"^awspc_[A-Za-z0-9]{43}_[A-Za-z0-9]{6}$", re.ASCII)
 
     def __init__(self, config_file: Path):
         self.config_file = config_file
         self._token: str | None = None
+        self._token_bytes: bytes | None = None
 
     @staticmethod
-    def _encode_base62(data: bytes) -> str:
-        """Encode bytes to Base62 (alphanumeric only)."""
-        if not data:
-            return TokenManager.BASE62_ALPHABET[0]
-
+    def _encode_base62_32(data: bytes) -> bytearray:
+        """Encode 32 random bytes as exactly 43 Base62 characters (ASCII bytes)."""
         num = int.from_bytes(data, byteorder="big")
-        if num == 0:
-            return TokenManager.BASE62_ALPHABET[0]
+        buf = bytearray(43)
+        for i in range(42, -1, -1):
+            num, remainder = divmod(num, 62)
+            buf[i] = TokenManager._BASE62_BYTES[remainder]
+        return buf
 
-        result = []
-        base = len(TokenManager.BASE62_ALPHABET)
-        while num:
-            num, remainder = divmod(num, base)
-            result.append(TokenManager.BASE62_ALPHABET[remainder])
-
-        return "".join(reversed(result))
+    @staticmethod
+    def _encode_base62_4(crc: int) -> str:
+        """Encode a 32-bit CRC as exactly 6 Base62 characters."""
+        buf = bytearray(6)
+        for i in range(5, -1, -1):
+            crc, remainder = divmod(crc, 62)
+            buf[i] = TokenManager._BASE62_BYTES[remainder]
+        return buf.decode("ascii")
 
     @staticmethod
-    def _calculate_checksum(data: str) -> str:
-        """Calculate CRC32 checksum and encode as Base62 (6 chars)."""
-        crc = zlib.crc32(data.encode("utf-8")) & 0xFFFFFFFF
-        checksum_bytes = crc.to_bytes(4, byteorder="big")
-        checksum = TokenManager._encode_base62(checksum_bytes)
-        # Pad to 6 characters with leading zeros
-        return checksum.zfill(6)
+    def _calculate_checksum(data: str | bytes | bytearray) -> str:
+        """Calculate CRC32 checksum and encode as Base62 (6 chars).
+
+        The checksum is defined over the ASCII random part (the extension
+        verifies it the same way), so callers holding those bytes pass them
+        directly instead of round-tripping through str.
+        """
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        crc = zlib.crc32(data) & 0xFFFFFFFF
+        return TokenManager._encode_base62_4(crc)
 
     @staticmethod
     def generate_token() -> str:
         """Generate new token with format: awspc_{random}_{checksum}"""
-        # Generate random data
+        # 62**43 > 2**256, so 32 random bytes always fit in 43 characters
         random_bytes = secrets.token_bytes(TokenManager.RANDOM_BYTES)
-        random_part = TokenManager._encode_base62(random_bytes)
+        random_ascii = TokenManager._encode_base62_32(random_bytes)
 
-        # Ensure consistent length (pad or truncate to 43 chars)
-        random_part = random_part[:43].ljust(43, "0")
-
-        # Calculate checksum
-        checksum = TokenManager._calculate_checksum(random_part)
+        # Checksum the encoded bytes before decoding them for the token string
+        checksum = TokenManager._calculate_checksum(random_ascii)
 
         # Construct token
-        token = f"{TokenManager.TOKEN_PREFIX}_{random_part}_{checksum}"
+        token = f"{TokenManager.TOKEN_PREFIX}_{random_ascii.decode('ascii')}_{checksum}"
         return token
 
     @staticmethod
-    def validate_format(token: str) -> bool:
-        """Validate token format and checksum without checking against stored value."""
+    @lru_cache(maxsize=128)
+    def classify(token: str) -> Literal["new", "legacy", "invalid"]:
+        """Classify a token as new-format, legacy or invalid in a single pass.
+
+        Results are a pure function of the token, so they are memoized.
+        """
         if not token:
-            return False
+            return "invalid"
+
+        # Only prefixed tokens can be new-format, so the prefix decides which
+        # pattern to try and at most one regex runs
+        if token.startswith(f"{TokenManager.TOKEN_PREFIX}_"):
+            if not TokenManager.NEW_PATTERN.match(token):
+                return "invalid"
 
-        # Check new format
-        if TokenManager.NEW_PATTERN.match(token):
             parts = token.split("_")
             if len(parts) != 3:
-                return False
+                return "invalid"
 
             random_part = parts[1]
             claimed_checksum = parts[2]
@@ -88,51 +103,50 @@ class TokenManager:
 
             if claimed_checksum != calculated_checksum:
                 logger.warning("Token checksum validation failed")
-                return False
+                return "invalid"
 
-            return True
-
-        # Reject tokens that start with awspc_ but don't match new format
-        if token.startswith(f"{TokenManager.TOKEN_PREFIX}_"):
-            return False
+            return "new"
 
         # Reject tokens that look like new format but have wrong prefix
-        if "_" in token:
-            parts = token.split("_")
-            if len(parts) == 3:
-                return False
+        if token.count("_") == 2:
+            return "invalid"
 
         # Check legacy format for backward compatibility
         if TokenManager.LEGACY_PATTERN.match(token):
             logger.warning("Legacy token format detected - please rotate to new format")
-            return True
+            return "legacy"
 
-        return False
+        return "invalid"
+
+    @staticmethod
+    def validate_format(token: str) -> bool:
+        """Validate token format and checksum without checking against stored value."""
+        return TokenManager.classify(token) != "invalid"
 
     def load_or_create(self) -> str:
         """Load token from config or create new one."""
         self.config_file.parent.mkdir(parents=True, exist_ok=True)
 
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, "r") as f:
-                    config = json.load(f)
-                    token = config.get("api_token")
-                    if token:
-                        # Validate format of loaded token
-                        if self.validate_format(token):
-                            logger.info("Loaded API token from config")
-                            self._token = token
-                            return token
-                        else:
-                            logger.warning("Invalid token format in config, generating new token")
-            except Exception as e:
-                logger.warning(f"Failed to load config: {e}")
+        try:
+            config = orjson.loads(self.config_file.read_bytes())
+            token = config.get("api_token")
+            if token:
+                # Validate format of loaded token
+                if self.validate_format(token):
+                    logger.info("Loaded API token from config")
+                    self._set_token(token)
+                    return token
+                else:
+                    logger.warning("Invalid token format in config, generating new token")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Failed to load config: {e}")
 
         # Generate new token with new format
         token = self.generate_token()
         self._save_token(token)
-        self._token = token
+        self._set_token(token)
         logger.info("Generated new API token with format: awspc_..._...")
         return token
 
@@ -140,15 +154,21 @@ class TokenManager:
         """Generate and save new token."""
         token = self.generate_token()
         self._save_token(token)
-        self._token = token
+        self._set_token(token)
         logger.info("Rotated API token")
         return token
 
+    def _set_token(self, token: str) -> None:
+        """Store the active token and its encoded form for comparisons."""
+        self._token = token
+        self._token_bytes = token.encode()
+
     def _save_token(self, token: str) -> None:
         """Save token to config file."""
         try:
-            with open(self.config_file, "w") as f:
-                json.dump({"api_token": token}, f, indent=2)
+            self.config_file.write_bytes(
+                orjson.dumps({"api_token": token}, option=orjson.OPT_INDENT_2)
+            )
             self.config_file.chmod(0o600)
             logger.info(f"Saved API token to {self.config_file}")
         except Exception as e:
@@ -156,13 +176,12 @@ class TokenManager:
             raise
 
     def validate(self, token: str | None) -> bool:
-        """Validate token format and value."""
-        if not token:
-            return False
+        """Validate token against the stored value in constant time.
 
-        # First validate format and checksum
-        if not self.validate_format(token):
+        The stored token was format-checked when loaded or generated, so an
+        exact match implies a valid format and no checksum work is needed.
+        """
+        if not token or self._token_bytes is None:
             return False
 
-        # Then check against stored token
-        return token == self._token
+        return secrets.compare_digest(token.encode(), self._token_bytes)
@@ -1,9 +1,34 @@
 """Cache management commands."""
 
+import os
 import shutil
+from collections.abc import Iterator
+from itertools import islice
 from pathlib import Path
 
 import click
+import orjson
+
+
+def _json_entries(directory: Path) -> list[os.DirEntry]:
+    """List *.json entries of a directory in a single scandir pass."""
+    with os.scandir(directory) as it:
+        return [entry for entry in it if entry.name.endswith(".json")]
+
+
+def _unlink_entries(directory: Path, entries: list[os.DirEntry]) -> None:
+    """Delete scandir entries relative to an open directory fd where supported."""
+    if os.unlink not in os.supports_dir_fd:
+        for entry in entries:
+            os.unlink(entry.path)
+        return
+
+    dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        for entry in entries:
+            os.unlink(entry.name, dir_fd=dir_fd)
+    finally:
+        os.close(dir_fd)
 
 
 @click.group()
@@ -42,9 +67,16 @@ def clear(sso, clear_all, force):
     # Clear SSO cache
     if sso or clear_all:
         if sso_cache.exists():
-            count = len(list(sso_cache.glob("*.json")))
-            for file in sso_cache.glob("*.json"):
-                file.unlink()
+            if clear_all:
+                # Everything goes, so drop the tree instead of unlinking per file;
+                # the count stays the *.json files that cache show reports
+                count = len(_json_entries(sso_cache))
+                shutil.rmtree(sso_cache)
+                sso_cache.mkdir(parents=True)
+            else:
+                entries = _json_entries(sso_cache)
+                _unlink_entries(sso_cache, entries)
+                count = len(entries)
             cleared.append(f"SSO cache ({count} file(s))")
 
     # Clear CLI cache
@@ -61,75 +93,68 @@ def clear(sso, clear_all, force):
         click.echo(f"ℹ️  No cache files found to clear")
 
 
+def _iter_sso_files(entries: list[os.DirEntry]) -> Iterator[dict]:
+    """Yield details for each readable SSO cache file, parsing lazily."""
+    from datetime import datetime
+
+    for entry in entries:
+        try:
+            with open(entry.path, "rb") as f:
+                data = orjson.loads(f.read())
+            stat = entry.stat()
+
+            yield {
+                "name": entry.name,
+                "size": stat.st_size,
+                "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                "expires": data.get("expiresAt"),
+            }
+        except Exception:
+            pass
+
+
 @cache.command()
 @click.option("--json", "output_json", is_flag=True, help="Output as JSON")
 def show(output_json):
     """Show cache information."""
-    import json
-    from datetime import datetime
-
     sso_cache = Path.home() / ".aws" / "sso" / "cache"
     cli_cache = Path.home() / ".aws" / "cli" / "cache"
 
-    cache_info = {"sso": {}, "cli": {}}
-
-    # Check SSO cache
-    if sso_cache.exists():
-        sso_files = list(sso_cache.glob("*.json"))
-        cache_info["sso"]["count"] = len(sso_files)
-        cache_info["sso"]["files"] = []
-
-        for file in sso_files:
-            try:
-                with open(file) as f:
-                    data = json.load(f)
-
-                cache_info["sso"]["files"].append(
-                    {
-                        "name": file.name,
-                        "size": file.stat().st_size,
-                        "modified": datetime.fromtimestamp(file.stat().st_mtime).isoformat(),
-                        "expires": data.get("expiresAt"),
-                    }
-                )
-            except Exception:
-                pass
-    else:
-        cache_info["sso"]["count"] = 0
-
-    # Check CLI cache
-    if cli_cache.exists():
-        cli_files = list(cli_cache.glob("*.json"))
-        cache_info["cli"]["count"] = len(cli_files)
-        cache_info["cli"]["path"] = str(cli_cache)
-    else:
-        cache_info["cli"]["count"] = 0
+    sso_entries = _json_entries(sso_cache) if sso_cache.exists() else []
+    cli_count = len(_json_entries(cli_cache)) if cli_cache.exists() else 0
 
     if output_json:
-        click.echo(json.dumps(cache_info, indent=2))
+        cache_info = {"sso": {"count": len(sso_entries)}, "cli": {"count": cli_count}}
+        if sso_cache.exists():
+            cache_info["sso"]["files"] = list(_iter_sso_files(sso_entries))
+        if cli_cache.exists():
+            cache_info["cli"]["path"] = str(cli_cache)
+
+        click.echo(orjson.dumps(cache_info, option=orjson.OPT_INDENT_2).decode())
     else:
         click.echo("\n📦 Cache Information")
         click.echo("=" * 60)
 
         # SSO Cache
         click.echo(f"\nSSO Cache:")
-        if cache_info["sso"]["count"] > 0:
-            click.echo(f"   Files: {cache_info['sso']['count']}")
+        if sso_entries:
+            click.echo(f"   Files: {len(sso_entries)}")
             click.echo(f"   Location: {sso_cache}")
 
-            for file in cache_info["sso"]["files"][:5]:  # Show first 5
+            # Only the first 5 files are shown, so only those are parsed
+            for file in islice(_iter_sso_files(sso_entries), 5):
                 status = "❌ Expired" if file.get("expires") else "✅ Active"
                 click.echo(f"      • {file['name'][:30]:<30} {status}")
 
-            if len(cache_info["sso"]["files"]) > 5:
-                click.echo(f"      ...and {len(cache_info['sso']['files']) - 5} more")
+            if len(sso_entries) > 5:
+                click.echo(f"      ...and {len(sso_entries) - 5} more")
         else:
             click.echo(f"   ℹ️  No SSO cache files")
 
         # CLI Cache
         click.echo(f"\nCLI Cache:")
-        if cache_info["cli"]["count"] > 0:
-            click.echo(f"   Files: {cache_info['cli']['count']}")
+        if cli_count > 0:
+            click.echo(f"   Files: {cli_count}")
             click.echo(f"   Location: {cli_cache}")
         else:
             click.echo(f"   ℹ️  No CLI cache files")
@@ -0,0 +1,144 @@
+"""Shared, mtime-keyed file readers and optional-module lookups for CLI commands.
+
+A single command often inspects the same file several times (the token
+wizard re-reads the config through ``show``, profile commands re-read
+~/.aws/config per profile). The parsed result is memoized per file and
+modification time and size so each file is read at most once while unchanged.
+"""
+
+import configparser
+import hashlib
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+import orjson
+
+from ..config import settings
+
+
+def _stat_key(path: Path) -> tuple[int, int]:
+    """(mtime_ns, size) of ``path``; size catches edits within the mtime granularity."""
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+@lru_cache(maxsize=8)
+def _parse_ini(path: str, key: tuple[int, int]) -> configparser.RawConfigParser:
+    """Parse an INI file; the stat key is part of the cache key so edits invalidate it."""
+    parser = configparser.RawConfigParser(strict=False)
+    parser.read(path)
+    return parser
+
+
+@lru_cache(maxsize=8)
+def _parse_json(path: str, key: tuple[int, int]) -> dict:
+    """Parse a JSON file; the stat key is part of the cache key so edits invalidate it."""
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
+
+
+def read_ini(path: Path) -> configparser.RawConfigParser:
+    """Load an AWS INI file, empty if it is missing. Treat the result as read-only."""
+    try:
+        key = _stat_key(path)
+    except OSError:
+        return configparser.RawConfigParser()
+    return _parse_ini(str(path), key)
+
+
+def read_ini_files(*paths: Path) -> list[configparser.RawConfigParser]:
+    """Load several INI files concurrently so slow (network/encrypted) homes overlap I/O."""
+    if len(paths) < 2:
+        return [read_ini(path) for path in paths]
+    with ThreadPoolExecutor(max_workers=len(paths)) as pool:
+        return list(pool.map(read_ini, paths))
+
+
+def read_json(path: Path) -> dict:
+    """Load a JSON file; raises OSError if it cannot be read."""
+    return dict(_parse_json(str(path), _stat_key(path)))
+
+
+class TokenNotFoundError(LookupError):
+    """No API token is stored; ``config_missing`` is True when the config file itself is absent."""
+
+    def __init__(self, message: str, config_missing: bool):
+        super().__init__(message)
+        self.config_missing = config_missing
+
+
+def load_token() -> str:
+    """
+    Return the stored API token or raise TokenNotFoundError.
+
+    The config is read through the mtime-keyed cache, so commands that chain
+    (the setup wizard showing the token) do not re-read the file.
+    """
+    try:
+        token = read_json(settings.CONFIG_FILE).get("api_token")
+    except FileNotFoundError:
+        raise TokenNotFoundError(
+            "No token found. Start the API server to generate one.", config_missing=True
+        ) from None
+
+    if not token:
+        raise TokenNotFoundError("Token not found in config file.", config_missing=False)
+    return token
+
+
+@lru_cache(maxsize=1)
+def get_clipboard():
+    """
+    The ``pyperclip`` module, or None if it is not installed.
+
+    A failed import is not recorded in ``sys.modules``, so without this cache
+    each copy attempt in a chained flow (setup -> rotate) would search the
+    import path again.
+    """
+    try:
+        import pyperclip
+    except ImportError:
+        return None
+    return pyperclip
+
+
+def render_qr(token: str) -> str | None:
+    """
+    ASCII QR code for ``token``, or None if ``qrcode`` is not installed.
+
+    The render is cached in ``settings.QR_CACHE_FILE`` under a blake2b digest of
+    the token, so repeated ``qr`` calls skip encoding until the token rotates.
+    The art encodes the token itself, so the cache is written owner-only.
+    """
+    cache_file = settings.QR_CACHE_FILE
+    digest = hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+    try:
+        cached_digest, _, art = cache_file.read_text(encoding="utf-8").partition("\n")
+        if cached_digest == digest:
+            return art
+    except OSError:
+        pass
+
+    try:
+        import qrcode
+    except ImportError:
+        return None
+
+    # version=None lets fit pick the smallest symbol that holds the token
+    qr = qrcode.QRCode(version=None, box_size=10, border=4)
+    qr.add_data(token)
+    qr.make(fit=True)
+    buf = io.StringIO()
+    qr.print_ascii(out=buf, invert=True)
+    art = buf.getvalue()
+
+    try:
+        fd = os.open(cache_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(f"{digest}\n{art}")
+    except OSError:
+        pass
+    return art
@@ -1,10 +1,11 @@
 """Configuration management commands."""
 
-import json
 import sys
 
 import click
+import orjson
 
+from ..auth.token_manager import TokenManager
 from ..config import settings
 
 
@@ -27,15 +28,14 @@ def show(output_json, show_token):
         return
 
     try:
-        with open(config_file) as f:
-            config_data = json.load(f)
+        config_data = orjson.loads(config_file.read_bytes())
 
         if output_json:
             if not show_token and "api_token" in config_data:
                 token = config_data["api_token"]
                 config_data["api_token"] = f"{token[:10]}...{token[-6:]}"
 
-            click.echo(json.dumps(config_data, indent=2))
+            click.echo(orjson.dumps(config_data, option=orjson.OPT_INDENT_2).decode())
         else:
             click.echo(f"\n⚙️  Configuration")
             click.echo("=" * 60)
@@ -54,15 +54,13 @@ def show(output_json, show_token):
                     click.echo(f"   (Use --show-token to reveal full token)")
 
                 # Validate token format
-                from ..auth.token_manager import TokenManager
-
-                if TokenManager.validate_format(token):
-                    if TokenManager.NEW_PATTERN.match(token):
+                match TokenManager.classify(token):
+                    case "new":
                         click.echo(f"   Format: ✅ New (awspc_...)")
-                    else:
+                    case "legacy":
                         click.echo(f"   Format: ⚠️  Legacy (should rotate)")
-                else:
-                    click.echo(f"   Format: ❌ Invalid")
+                    case _:
+                        click.echo(f"   Format: ❌ Invalid")
 
             # Show other config options
             other_config = {k: v for k, v in config_data.items() if k != "api_token"}
@@ -126,18 +124,16 @@ def set(key, value):
 
     try:
         # Load existing config
-        if config_file.exists():
-            with open(config_file) as f:
-                config_data = json.load(f)
-        else:
+        try:
+            config_data = orjson.loads(config_file.read_bytes())
+        except FileNotFoundError:
             config_data = {}
 
         # Set new value
         config_data[key] = value
 
         # Save
-        with open(config_file, "w") as f:
-            json.dump(config_data, f, indent=2)
+        config_file.write_bytes(orjson.dumps(config_data, option=orjson.OPT_INDENT_2))
 
         config_file.chmod(0o600)
 
@@ -159,8 +155,7 @@ def get(key):
         sys.exit(1)
 
     try:
-        with open(config_file) as f:
-            config_data = json.load(f)
+        config_data = orjson.loads(config_file.read_bytes())
 
         if key in config_data:
             value = config_data[key]
@@ -1,14 +1,19 @@
 """Diagnostic and troubleshooting commands."""
 
-import json
+import asyncio
 import sys
 from pathlib import Path
 
 import click
 import httpx
+import orjson
 
+from ..auth.token_manager import TokenManager
 from ..config import settings
 
+_STATUS_ICON = {"ok": "✅", "warning": "⚠️ ", "error": "❌", "skipped": "⏭️ "}
+_DIV = "=" * 60
+
 
 @click.group()
 def diagnose():
@@ -16,130 +21,136 @@ def diagnose():
     pass
 
 
-@diagnose.command()
-@click.option("--json", "output_json", is_flag=True, help="Output as JSON")
-def health(output_json):
-    """Check overall system health."""
-    results = {
-        "server": {"status": "unknown"},
-        "config": {"status": "unknown"},
-        "profiles": {"status": "unknown"},
-        "extension": {"status": "unknown"},
-    }
+def _make_client(client_cls: type[httpx.Client] | type[httpx.AsyncClient] = httpx.Client):
+    """Create an HTTP client bound to the local API server."""
+    return client_cls(base_url=f"http://127.0.0.1:{settings.PORT}", timeout=5)
+
 
-    # 1. Check server
+def _check_config(config_file: Path) -> tuple[dict, str | None]:
+    """Check the config file; returns the result and the API token, if any.
+
+    The file is read and parsed exactly once; the token is handed on to the
+    extension check rather than re-read.
+    """
     try:
-        response = httpx.get(f"http://127.0.0.1:{settings.PORT}/health", timeout=2)
-        if response.status_code == 200:
-            results["server"]["status"] = "ok"
-            results["server"]["message"] = "Server is running"
-        else:
-            results["server"]["status"] = "error"
-            results["server"]["message"] = f"Server returned status {response.status_code}"
-    except httpx.ConnectError:
-        results["server"]["status"] = "error"
-        results["server"]["message"] = "Server is not running"
+        token = orjson.loads(config_file.read_bytes()).get("api_token")
+    except FileNotFoundError:
+        return {
+            "status": "warning",
+            "message": "Config file not found (run server to create)",
+        }, None
     except Exception as e:
-        results["server"]["status"] = "error"
-        results["server"]["message"] = str(e)
+        return {"status": "error", "message": f"Config file error: {e}"}, None
 
-    # 2. Check config file
-    config_file = settings.CONFIG_FILE
-    if config_file.exists():
-        try:
-            with open(config_file) as f:
-                config = json.load(f)
-                if config.get("api_token"):
-                    results["config"]["status"] = "ok"
-                    results["config"]["message"] = "Token configured"
-                else:
-                    results["config"]["status"] = "warning"
-                    results["config"]["message"] = "No token in config"
-        except Exception as e:
-            results["config"]["status"] = "error"
-            results["config"]["message"] = f"Config file error: {e}"
-    else:
-        results["config"]["status"] = "warning"
-        results["config"]["message"] = "Config file not found (run server to create)"
+    if token:
+        return {"status": "ok", "message": "Token configured"}, token
+    return {"status": "warning", "message": "No token in config"}, None
 
-    # 3. Check AWS profiles
+
+def _check_profiles() -> dict:
+    """Check that AWS profiles can be listed."""
     from ..core.credentials import CredentialProvider
 
     try:
         cred_provider = CredentialProvider()
         profiles = cred_provider.list_profiles()
+    except Exception as e:
+        return {"status": "error", "message": str(e)}
+
+    if profiles:
+        return {
+            "status": "ok",
+            "message": f"{len(profiles)} profile(s) found",
+            "count": len(profiles),
+        }
+    return {"status": "warning", "message": "No AWS profiles found"}
 
-        if profiles:
-            results["profiles"]["status"] = "ok"
-            results["profiles"]["message"] = f"{len(profiles)} profile(s) found"
-            results["profiles"]["count"] = len(profiles)
-        else:
-            results["profiles"]["status"] = "warning"
-            results["profiles"]["message"] = "No AWS profiles found"
 
+async def _check_server(client: httpx.AsyncClient) -> dict:
+    """Check that the API server answers /health."""
+    try:
+        response = await client.get("/health", timeout=2)
+    except httpx.ConnectError:
+        return {"status": "error", "message": "Server is not running"}
     except Exception as e:
-        results["profiles"]["status"] = "error"
-        results["profiles"]["message"] = str(e)
+        return {"status": "error", "message": str(e)}
 
-    # 4. Check if extension can connect
-    if results["server"]["status"] == "ok" and results["config"]["status"] == "ok":
-        try:
-            with open(config_file) as f:
-                config = json.load(f)
-                token = config.get("api_token")
-
-            response = httpx.post(
-                f"http://127.0.0.1:{settings.PORT}/profiles",
-                headers={"X-API-Token": token},
-                timeout=5,
-            )
-
-            if response.status_code == 200:
-                results["extension"]["status"] = "ok"
-                results["extension"]["message"] = "Extension can connect"
-            else:
-                results["extension"]["status"] = "error"
-                results["extension"]["message"] = f"Auth failed: {response.status_code}"
+    if response.status_code == 200:
+        return {"status": "ok", "message": "Server is running"}
+    return {"status": "error", "message": f"Server returned status {response.status_code}"}
 
-        except Exception as e:
-            results["extension"]["status"] = "error"
-            results["extension"]["message"] = str(e)
-    else:
-        results["extension"]["status"] = "skipped"
-        results["extension"]["message"] = "Server or config not ready"
+
+async def _check_extension(client: httpx.AsyncClient, token: str | None) -> dict:
+    """Check that an authenticated profile request succeeds."""
+    if not token:
+        return {"status": "skipped", "message": "Server or config not ready"}
+
+    try:
+        response = await client.post("/profiles", headers={"X-API-Token": token}, timeout=5)
+    except Exception as e:
+        return {"status": "error", "message": str(e)}
+
+    if response.status_code == 200:
+        return {"status": "ok", "message": "Extension can connect"}
+    return {"status": "error", "message": f"Auth failed: {response.status_code}"}
+
+
+async def _run_health_checks() -> dict:
+    """Run the independent health checks concurrently."""
+    # Reading the config is a tiny local read and yields the token the
+    # extension check needs, so it goes first
+    config_result, token = _check_config(settings.CONFIG_FILE)
+
+    async with _make_client(httpx.AsyncClient) as client:
+        server_result, profiles_result, extension_result = await asyncio.gather(
+            _check_server(client),
+            asyncio.to_thread(_check_profiles),
+            _check_extension(client, token),
+        )
+
+    # The extension check only counts when both the server and config are ready
+    if server_result["status"] != "ok" or config_result["status"] != "ok":
+        extension_result = {"status": "skipped", "message": "Server or config not ready"}
+
+    return {
+        "server": server_result,
+        "config": config_result,
+        "profiles": profiles_result,
+        "extension": extension_result,
+    }
+
+
+@diagnose.command()
+@click.option("--json", "output_json", is_flag=True, help="Output as JSON")
+def health(output_json):
+    """Check overall system health."""
+    results = asyncio.run(_run_health_checks())
+    overall_status = all(r["status"] in ["ok", "skipped"] for r in results.values())
 
     # Output results
     if output_json:
-        click.echo(json.dumps(results, indent=2))
+        click.echo(orjson.dumps(results, option=orjson.OPT_INDENT_2).decode())
     else:
         click.echo("\n🔍 AWS Profile Bridge - Health Check")
-        click.echo("=" * 60)
-
-        overall_status = all(
-            r["status"] in ["ok", "skipped"] for r in results.values()
-        )
+        click.echo(_DIV)
 
         # Server
-        status_icon = {"ok": "✅", "warning": "⚠️ ", "error": "❌", "skipped": "⏭️ "}[
-            results["server"]["status"]
-        ]
+        status_icon = _STATUS_ICON[results["server"]["status"]]
         click.echo(f"\n{status_icon} Server: {results['server']['message']}")
 
         # Config
-        status_icon = {"ok": "✅", "warning": "⚠️ ", "error": "❌"}[results["config"]["status"]]
+        status_icon = _STATUS_ICON[results["config"]["status"]]
         click.echo(f"{status_icon} Config: {results['config']['message']}")
 
         # Profiles
-        status_icon = {"ok": "✅", "warning": "⚠️ ", "error": "❌"}[results["profiles"]["status"]]
+        status_icon = _STATUS_ICON[results["profiles"]["status"]]
         click.echo(f"{status_icon} Profiles: {results['profiles']['message']}")
 
         # Extension
-        status_icon = {"ok": "✅", "warning": "⚠️ ", "error": "❌", "skipped": "⏭️ "}[
-            results["extension"]["status"]
-        ]
+        status_icon = _STATUS_ICON[results["extension"]["status"]]
         click.echo(f"{status_icon} Extension: {results['extension']['message']}")
 
-        click.echo("\n" + "=" * 60)
+        click.echo("\n" + _DIV)
 
         if overall_status:
             click.echo("✅ All systems operational!")
@@ -167,7 +178,7 @@ def health(output_json):
 def verify():
     """Verify complete setup (interactive)."""
     click.echo("\n🔍 AWS Profile Bridge - Setup Verification")
-    click.echo("=" * 60)
+    click.echo(_DIV)
 
     all_ok = True
 
@@ -215,29 +226,26 @@ def verify():
 
     if config_file.exists():
         try:
-            with open(config_file) as f:
-                config = json.load(f)
-                token = config.get("api_token")
-
-                if token:
-                    token_preview = f"{token[:10]}...{token[-6:]}"
-                    click.echo(f"   ✅ Token configured: {token_preview}")
-
-                    # Validate format
-                    from ..auth.token_manager import TokenManager
-
-                    if TokenManager.validate_format(token):
-                        if TokenManager.NEW_PATTERN.match(token):
-                            click.echo(f"      Format: New (awspc_..._...) ✓")
-                        else:
-                            click.echo(f"      Format: Legacy (should rotate)")
-                    else:
+            config = orjson.loads(config_file.read_bytes())
+            token = config.get("api_token")
+
+            if token:
+                token_preview = f"{token[:10]}...{token[-6:]}"
+                click.echo(f"   ✅ Token configured: {token_preview}")
+
+                # Validate format
+                match TokenManager.classify(token):
+                    case "new":
+                        click.echo(f"      Format: New (awspc_..._...) ✓")
+                    case "legacy":
+                        click.echo(f"      Format: Legacy (should rotate)")
+                    case _:
                         click.echo(f"      ⚠️  Invalid format")
 
-                else:
-                    click.echo(f"   ❌ No token in config")
-                    click.echo(f"      Run: aws-profile-bridge token setup")
-                    all_ok = False
+            else:
+                click.echo(f"   ❌ No token in config")
+                click.echo(f"      Run: aws-profile-bridge token setup")
+                all_ok = False
 
         except Exception as e:
             click.echo(f"   ❌ Config error: {e}")
@@ -248,7 +256,8 @@ def verify():
     # Step 4: Server
     click.echo("\n4️⃣  Checking API server...")
     try:
-        response = httpx.get(f"http://127.0.0.1:{settings.PORT}/health", timeout=2)
+        with _make_client() as client:
+            response = client.get("/health", timeout=2)
         if response.status_code == 200:
             data = response.json()
             click.echo(f"   ✅ Server running: {data.get('status', 'ok')}")
@@ -271,7 +280,7 @@ def verify():
     click.echo(f"      3. Test opening a profile")
 
     # Summary
-    click.echo("\n" + "=" * 60)
+    click.echo("\n" + _DIV)
 
     if all_ok:
         click.echo("✅ Setup verification complete - all systems ready!")
@@ -302,7 +311,7 @@ def env():
     import sys as python_sys
 
     click.echo("\n🔍 Environment Information")
-    click.echo("=" * 60)
+    click.echo(_DIV)
 
     click.echo(f"\nSystem:")
     click.echo(f"   OS: {platform.system()} {platform.release()}")
@@ -329,11 +338,13 @@ def env():
         ("AWS config", Path.home() / ".aws" / "config"),
         ("AWS credentials", Path.home() / ".aws" / "credentials"),
     ]:
-        if path.exists():
+        try:
             size = path.stat().st_size
-            size_str = f"{size:,} bytes" if size < 1024 else f"{size/1024:.1f} KB"
-            click.echo(f"   {path_name}: ✅ ({size_str})")
-        else:
+        except OSError:
             click.echo(f"   {path_name}: ❌ Not found")
+            continue
+
+        size_str = f"{size:,} bytes" if size < 1024 else f"{size/1024:.1f} KB"
+        click.echo(f"   {path_name}: ✅ ({size_str})")
 
     click.echo()
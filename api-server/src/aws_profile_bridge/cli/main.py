@@ -1,16 +1,36 @@
 """Main CLI entry point using Click."""
 
+import importlib
+
 import click
 
-from . import server_commands
-from . import token_commands_click
-from . import profile_commands
-from . import config_commands
-from . import diagnose_commands
-from . import cache_commands
+# Command group name -> (module, attribute). Modules are imported only when
+# their group is invoked, so startup does not pay for httpx, boto3, etc.
+LAZY_COMMANDS = {
+    "server": ("server_commands", "server"),
+    "token": ("token_commands_click", "token"),
+    "profile": ("profile_commands", "profile"),
+    "config": ("config_commands", "config"),
+    "diagnose": ("diagnose_commands", "diagnose"),
+    "cache": ("cache_commands", "cache"),
+}
+
+
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules on first use."""
+
+    def list_commands(self, ctx):
+        return sorted(LAZY_COMMANDS)
 
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in LAZY_COMMANDS:
+            return None
+        module_name, attr = LAZY_COMMANDS[cmd_name]
+        module = importlib.import_module(f".{module_name}", __package__)
+        return getattr(module, attr)
 
-@click.group()
+
+@click.group(cls=LazyGroup)
 @click.version_option(version="2.0.0", prog_name="aws-profile-bridge")
 @click.pass_context
 def cli(ctx):
@@ -22,15 +42,6 @@ def cli(ctx):
     ctx.ensure_object(dict)
 
 
-# Register command groups
-cli.add_command(server_commands.server)
-cli.add_command(token_commands_click.token)
-cli.add_command(profile_commands.profile)
-cli.add_command(config_commands.config)
-cli.add_command(diagnose_commands.diagnose)
-cli.add_command(cache_commands.cache)
-
-
 def main():
     """Main entry point."""
     cli(obj={})
@@ -1,13 +1,50 @@
 """Profile management commands."""
 
-import json
+import os
 import sys
 from pathlib import Path
 
 import click
+import orjson
 
+from ..config import settings
 from ..core.credentials import CredentialProvider
 from ..services.sso import SSOCredentialsProvider
+from .common import read_ini_files
+
+
+def _aws_dir_names() -> set[str]:
+    """Names of the regular files in ~/.aws, from one directory scan."""
+    try:
+        with os.scandir(settings.AWS_DIR) as it:
+            return {entry.name for entry in it if entry.is_file()}
+    except FileNotFoundError:
+        return set()
+
+
+def _sso_profile_names(config_path: Path) -> set[str]:
+    """Names of profiles in ~/.aws/config that carry sso_* settings.
+
+    A single streaming pass over the lines; no parser state or section
+    substrings are built since only the section/key names matter here.
+    """
+    sso_profiles = set()
+    current = None
+
+    try:
+        with open(config_path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line.startswith("["):
+                    # Up to the closing bracket, so trailing comments are dropped
+                    header = line.partition("]")[0]
+                    current = header[9:].strip() if header.startswith("[profile ") else None
+                elif current and current not in sso_profiles and line.startswith("sso_"):
+                    sso_profiles.add(current)
+    except OSError:
+        pass
+
+    return sso_profiles
 
 
 @click.group()
@@ -24,14 +61,15 @@ def list(sso, output_json, count):
     """List all AWS profiles."""
     try:
         cred_provider = CredentialProvider()
-        profiles = cred_provider.list_profiles()
+        # Sorted once up front; both the JSON and text renderings use it
+        profiles = sorted(cred_provider.list_profiles())
 
         if count:
             click.echo(len(profiles))
             return
 
         if output_json:
-            click.echo(json.dumps(profiles, indent=2))
+            click.echo(orjson.dumps(profiles, option=orjson.OPT_INDENT_2).decode())
         else:
             if not profiles:
                 click.echo("ℹ️  No AWS profiles found")
@@ -41,22 +79,11 @@ def list(sso, output_json, count):
 
             click.echo(f"📋 Found {len(profiles)} AWS profile(s):\n")
 
-            for profile_name in sorted(profiles):
-                # Check if SSO profile
-                config_path = Path.home() / ".aws" / "config"
-                is_sso = False
-
-                if config_path.exists():
-                    with open(config_path) as f:
-                        content = f.read()
-                        if f"[profile {profile_name}]" in content:
-                            section_start = content.find(f"[profile {profile_name}]")
-                            next_section = content.find("[", section_start + 1)
-                            section = content[
-                                section_start : next_section if next_section != -1 else None
-                            ]
-                            is_sso = "sso_" in section
+            # Parse the config once instead of re-reading it per profile
+            sso_profiles = _sso_profile_names(settings.AWS_CONFIG_FILE)
 
+            for profile_name in profiles:
+                is_sso = profile_name in sso_profiles
                 icon = "🔐" if is_sso else "🔑"
                 profile_type = "SSO" if is_sso else "Static"
                 click.echo(f"   {icon} {profile_name:<30} ({profile_type})")
@@ -83,43 +110,25 @@ def info(profile_name, output_json):
             sys.exit(1)
 
         # Read config and credentials
-        config_path = Path.home() / ".aws" / "config"
-        creds_path = Path.home() / ".aws" / "credentials"
-
         info_data = {"name": profile_name, "type": "static", "config": {}, "has_credentials": False}
 
-        # Check config file
-        if config_path.exists():
-            with open(config_path) as f:
-                content = f.read()
-
-                # Find profile section
-                for prefix in [f"[profile {profile_name}]", f"[{profile_name}]"]:
-                    if prefix in content:
-                        section_start = content.find(prefix)
-                        next_section = content.find("[", section_start + 1)
-                        section = content[section_start : next_section if next_section != -1 else None]
-
-                        # Parse section
-                        for line in section.split("\n")[1:]:
-                            line = line.strip()
-                            if "=" in line and not line.startswith("#"):
-                                key, value = line.split("=", 1)
-                                info_data["config"][key.strip()] = value.strip()
-
-                        # Check if SSO
-                        if any(k.startswith("sso_") for k in info_data["config"].keys()):
-                            info_data["type"] = "sso"
-
-        # Check credentials file
-        if creds_path.exists():
-            with open(creds_path) as f:
-                content = f.read()
-                if f"[{profile_name}]" in content:
-                    info_data["has_credentials"] = True
+        config, credentials = read_ini_files(
+            settings.AWS_CONFIG_FILE, settings.AWS_CREDENTIALS_FILE
+        )
+
+        # Config sections are "[profile name]" except for the default profile
+        for section in (f"profile {profile_name}", profile_name):
+            if config.has_section(section):
+                info_data["config"] = dict(config[section])
+                break
+
+        if any(k.startswith("sso_") for k in info_data["config"]):
+            info_data["type"] = "sso"
+
+        info_data["has_credentials"] = credentials.has_section(profile_name)
 
         if output_json:
-            click.echo(json.dumps(info_data, indent=2))
+            click.echo(orjson.dumps(info_data, option=orjson.OPT_INDENT_2).decode())
         else:
             click.echo(f"\n📋 Profile: {profile_name}")
             click.echo("=" * 60)
@@ -185,17 +194,7 @@ def test(profile_name):
         click.echo(f"   ✅ Credential format valid")
 
         # Check if SSO and whether token is valid
-        config_path = Path.home() / ".aws" / "config"
-        is_sso = False
-
-        if config_path.exists():
-            with open(config_path) as f:
-                content = f.read()
-                if f"[profile {profile_name}]" in content:
-                    section_start = content.find(f"[profile {profile_name}]")
-                    next_section = content.find("[", section_start + 1)
-                    section = content[section_start : next_section if next_section != -1 else None]
-                    is_sso = "sso_" in section
+        is_sso = profile_name in _sso_profile_names(settings.AWS_CONFIG_FILE)
 
         if is_sso:
             click.echo(f"   3. Checking SSO session...")
@@ -223,18 +222,16 @@ def validate():
     """Validate all AWS profiles for common issues."""
     click.echo("🔍 Validating AWS profiles...\n")
 
-    config_path = Path.home() / ".aws" / "config"
-    creds_path = Path.home() / ".aws" / "credentials"
-
     issues = []
     warnings = []
 
     # Check if files exist
-    if not config_path.exists():
-        issues.append(f"Config file not found: {config_path}")
+    present = _aws_dir_names()
+    if settings.AWS_CONFIG_FILE.name not in present:
+        issues.append(f"Config file not found: {settings.AWS_CONFIG_FILE}")
 
-    if not creds_path.exists():
-        warnings.append(f"Credentials file not found: {creds_path}")
+    if settings.AWS_CREDENTIALS_FILE.name not in present:
+        warnings.append(f"Credentials file not found: {settings.AWS_CREDENTIALS_FILE}")
 
     try:
         cred_provider = CredentialProvider()
@@ -245,20 +242,14 @@ def validate():
         else:
             click.echo(f"   Found {len(profiles)} profile(s)")
 
-            # Check each profile
-            for profile_name in profiles:
-                try:
-                    credentials = cred_provider.get_credentials(profile_name)
-
-                    if not credentials:
-                        warnings.append(f"Profile '{profile_name}': Could not load credentials")
-                    elif "AccessKeyId" not in credentials:
-                        warnings.append(
-                            f"Profile '{profile_name}': Missing AccessKeyId (might need SSO login)"
-                        )
-
-                except Exception as e:
-                    warnings.append(f"Profile '{profile_name}': {str(e)}")
+            # Check each profile; the credentials file is parsed only once
+            for profile_name, credentials in cred_provider.iter_profiles_with_creds(profiles):
+                if not credentials:
+                    warnings.append(f"Profile '{profile_name}': Could not load credentials")
+                elif "AccessKeyId" not in credentials:
+                    warnings.append(
+                        f"Profile '{profile_name}': Missing AccessKeyId (might need SSO login)"
+                    )
 
     except Exception as e:
         issues.append(f"Error reading profiles: {e}")
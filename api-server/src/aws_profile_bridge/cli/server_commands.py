@@ -1,6 +1,10 @@
 """Server management commands."""
 
+import mmap
 import os
+import re
+import select
+import shutil
 import signal
 import subprocess
 import sys
@@ -8,8 +12,10 @@ import time
 from pathlib import Path
 
 import click
-import psutil
+import orjson
 
+# psutil loads a native extension, so it is imported only by the commands that
+# inspect processes ("server logs" never needs it).
 from ..config import settings
 
 
@@ -19,19 +25,151 @@ def server():
     pass
 
 
-def find_server_process():
-    """Find the running API server process."""
-    for proc in psutil.process_iter(["pid", "name", "cmdline"]):
+# Arguments that identify the server entry point ("-m aws_profile_bridge.app"
+# is how start/restart launch it)
+SERVER_ENTRY_MARKERS = ("aws_profile_bridge.app", "app.py", "app:main")
+
+
+def _is_server_cmdline(cmdline: list[str] | None) -> bool:
+    """Whether a process command line belongs to the API server."""
+    if not cmdline:
+        return False
+
+    has_bridge = has_entry = False
+    for arg in cmdline:
+        has_bridge = has_bridge or "aws_profile_bridge" in arg
+        has_entry = has_entry or any(marker in arg for marker in SERVER_ENTRY_MARKERS)
+        if has_bridge and has_entry:
+            return True
+    return False
+
+
+def _write_pid_file(pid: int) -> None:
+    """Record the PID of a server we launched so later lookups skip the scan."""
+    try:
+        settings.SERVER_PID_FILE.write_text(str(pid))
+    except OSError:
+        pass  # Best effort; find_server_process falls back to scanning
+
+
+def _process_from_pid_file():
+    """Return the server process named in the PID file, if it is still ours."""
+    import psutil
+
+    try:
+        pid = int(settings.SERVER_PID_FILE.read_text())
+        proc = psutil.Process(pid)
+        if proc.is_running() and _is_server_cmdline(proc.cmdline()):
+            return proc
+    except (OSError, ValueError, psutil.Error):
+        pass
+    return None
+
+
+def _scan_for_server():
+    """Scan all processes for the server."""
+    import psutil
+
+    # Only cmdline is needed; pid is always available without extra /proc reads
+    for proc in psutil.process_iter(["cmdline"]):
         try:
-            cmdline = proc.info["cmdline"]
-            if cmdline and "aws_profile_bridge" in " ".join(cmdline):
-                if "app.py" in " ".join(cmdline) or "app:main" in " ".join(cmdline):
-                    return proc
+            if _is_server_cmdline(proc.info["cmdline"]):
+                return proc
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             continue
     return None
 
 
+def find_server_process():
+    """Find the running API server process."""
+    return _process_from_pid_file() or _scan_for_server()
+
+
+def _spawn_detached(command: list[str], env: dict[str, str], pass_fd: int) -> int:
+    """
+    Start ``command`` in a new session with output discarded; returns its PID.
+
+    Uses ``os.posix_spawn`` so the kernel can start the child without first
+    copying this process's page tables, as fork+exec in ``subprocess.Popen``
+    does. Falls back to ``Popen`` where posix_spawn or its setsid flag is not
+    supported (e.g. older macOS).
+    """
+    try:
+        os.set_inheritable(pass_fd, True)
+        try:
+            return os.posix_spawn(
+                command[0],
+                command,
+                env,
+                file_actions=[
+                    (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+                    (os.POSIX_SPAWN_DUP2, 1, 2),
+                ],
+                setsid=True,
+                setsigdef=(signal.SIGPIPE,),
+            )
+        finally:
+            os.set_inheritable(pass_fd, False)
+    except (AttributeError, NotImplementedError):
+        return subprocess.Popen(
+            command,
+            env=env,
+            pass_fds=(pass_fd,),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        ).pid
+
+
+def _launch_server(env: dict[str, str]) -> int | None:
+    """
+    Start the server in the background and wait until it is ready.
+
+    On POSIX the server writes to an inherited pipe once startup completes
+    (or the pipe closes if it dies), so there is no fixed sleep or process
+    scan. Returns the server PID, or None if it failed to start; a server
+    that is not ready within SERVER_READY_TIMEOUT is terminated rather than
+    left running unrecorded.
+    """
+    command = [sys.executable, "-m", "aws_profile_bridge.app"]
+
+    if sys.platform == "win32":
+        server_proc = subprocess.Popen(
+            command,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        _write_pid_file(server_proc.pid)
+        time.sleep(2)  # Give it time to start
+        proc = find_server_process()
+        return proc.pid if proc else None
+
+    read_fd, write_fd = os.pipe()
+    try:
+        pid = _spawn_detached(
+            command, {**env, settings.SERVER_READY_FD_ENV: str(write_fd)}, write_fd
+        )
+    finally:
+        os.close(write_fd)
+
+    try:
+        readable, _, _ = select.select([read_fd], [], [], settings.SERVER_READY_TIMEOUT)
+        ready = bool(readable) and os.read(read_fd, 1) == b"1"
+    finally:
+        os.close(read_fd)
+
+    if not ready:
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+        return None
+    _write_pid_file(pid)
+    return pid
+
+
 @server.command()
 @click.option("--port", default=10999, help="Port to run on (default: 10999)")
 @click.option("--host", default="127.0.0.1", help="Host to bind to (default: 127.0.0.1)")
@@ -53,17 +191,9 @@ def start(port, host, reload, daemon):
     if daemon:
         click.echo(f"   Mode: Background (daemon)")
         # Start as background process
-        subprocess.Popen(
-            [sys.executable, "-m", "aws_profile_bridge.app"],
-            env={**os.environ, "HOST": host, "PORT": str(port)},
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            start_new_session=True,
-        )
-        time.sleep(2)  # Give it time to start
-        proc = find_server_process()
-        if proc:
-            click.echo(f"\n✅ Server started successfully (PID: {proc.pid})")
+        pid = _launch_server({**os.environ, "HOST": host, "PORT": str(port)})
+        if pid:
+            click.echo(f"\n✅ Server started successfully (PID: {pid})")
             click.echo(f"   View logs: aws-profile-bridge server logs")
         else:
             click.echo("\n❌ Failed to start server")
@@ -91,6 +221,8 @@ def start(port, host, reload, daemon):
 @click.option("--force", is_flag=True, help="Force stop (SIGKILL)")
 def stop(force):
     """Stop the API server."""
+    import psutil
+
     proc = find_server_process()
 
     if not proc:
@@ -109,12 +241,14 @@ def stop(force):
 
         # Wait for process to stop
         proc.wait(timeout=5)
+        settings.SERVER_PID_FILE.unlink(missing_ok=True)
         click.echo("✅ Server stopped successfully")
 
     except psutil.TimeoutExpired:
         click.echo("⚠️  Server didn't stop gracefully, forcing...")
         proc.kill()
         proc.wait(timeout=5)
+        settings.SERVER_PID_FILE.unlink(missing_ok=True)
         click.echo("✅ Server stopped (forced)")
     except Exception as e:
         click.echo(f"❌ Error stopping server: {e}")
@@ -124,6 +258,8 @@ def stop(force):
 @server.command()
 def restart():
     """Restart the API server."""
+    import psutil
+
     click.echo("🔄 Restarting server...")
 
     # Stop if running
@@ -138,17 +274,9 @@ def restart():
 
     # Start new server
     click.echo("   Starting new server...")
-    subprocess.Popen(
-        [sys.executable, "-m", "aws_profile_bridge.app"],
-        stdout=subprocess.DEVNULL,
-        stderr=subprocess.DEVNULL,
-        start_new_session=True,
-    )
-
-    time.sleep(2)
-    proc = find_server_process()
-    if proc:
-        click.echo(f"\n✅ Server restarted successfully (PID: {proc.pid})")
+    pid = _launch_server(dict(os.environ))
+    if pid:
+        click.echo(f"\n✅ Server restarted successfully (PID: {pid})")
     else:
         click.echo("\n❌ Failed to restart server")
         sys.exit(1)
@@ -156,33 +284,35 @@ def restart():
 
 @server.command()
 @click.option("--json", "output_json", is_flag=True, help="Output as JSON")
-def status(output_json):
+@click.option("--cpu", "show_cpu", is_flag=True, help="Sample CPU usage (takes 0.1s)")
+def status(output_json, show_cpu):
     """Check server status."""
     proc = find_server_process()
 
-    if output_json:
-        import json
+    if proc:
+        mem_mb = proc.memory_info().rss / 1024 / 1024
+        # The first non-blocking cpu_percent() call always reports 0.0, so
+        # sample over a short interval, and only when asked to
+        cpu = proc.cpu_percent(interval=0.1) if show_cpu else None
 
+    if output_json:
         if proc:
             status_data = {
                 "running": True,
                 "pid": proc.pid,
-                "memory_mb": proc.memory_info().rss / 1024 / 1024,
-                "cpu_percent": proc.cpu_percent(),
+                "memory_mb": mem_mb,
+                "cpu_percent": cpu,
             }
         else:
             status_data = {"running": False}
 
-        click.echo(json.dumps(status_data, indent=2))
+        click.echo(orjson.dumps(status_data, option=orjson.OPT_INDENT_2).decode())
     else:
         if proc:
-            mem_mb = proc.memory_info().rss / 1024 / 1024
-            cpu = proc.cpu_percent()
-
             click.echo("✅ Server Status: RUNNING")
             click.echo(f"   PID: {proc.pid}")
             click.echo(f"   Memory: {mem_mb:.1f} MB")
-            click.echo(f"   CPU: {cpu:.1f}%")
+            click.echo(f"   CPU: {f'{cpu:.1f}%' if cpu is not None else 'N/A (use --cpu)'}")
             click.echo(f"   Endpoint: http://127.0.0.1:{settings.PORT}")
             click.echo(f"   Logs: {settings.LOG_FILE}")
         else:
@@ -190,6 +320,130 @@ def status(output_json):
             click.echo(f"   Start with: aws-profile-bridge server start")
 
 
+def _tail_lines(path: Path, count: int, block_size: int = 65536) -> list[str]:
+    """
+    Return the last ``count`` lines of a file, reading backwards in blocks
+    instead of loading the whole file.
+    """
+    found: list[bytes] = []
+    remainder = b""
+    at_end = True
+
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        while pos > 0 and len(found) < count:
+            read_size = min(block_size, pos)
+            pos -= read_size
+            f.seek(pos)
+            chunk = f.read(read_size) + remainder
+
+            # The first piece may be a partial line; keep it for the next block
+            pieces = chunk.split(b"\n")
+            remainder = pieces[0] if pos > 0 else b""
+            complete = pieces[1:] if pos > 0 else pieces
+
+            # A trailing newline does not start another line
+            if at_end and complete and complete[-1] == b"":
+                complete.pop()
+            at_end = False
+
+            for line in reversed(complete):
+                found.append(line)
+                if len(found) == count:
+                    break
+
+    return [line.decode("utf-8", errors="replace") for line in reversed(found)]
+
+
+def _level_pattern(level: str) -> str:
+    """
+    Regex matching log lines whose level column is ``level``.
+
+    Lines are written as ``asctime | levelname:8 | name | message``, so the
+    level is the second field followed by padding. Anchoring on the first
+    ``|`` keeps "| ERROR" inside a message from matching. The pattern is
+    valid both as a Python regex and as a POSIX ERE for ``grep -E``.
+    """
+    return rf"^[^|]*\| {level} "
+
+
+def _tail_matching_lines(path: Path, level: str, count: int) -> list[str]:
+    """
+    Last ``count`` lines logged at ``level``.
+
+    Candidates are found by jumping between occurrences of the level column
+    with ``mmap.rfind``; each candidate line is then confirmed with a
+    precompiled bytes regex, so only lines near a hit are ever examined.
+    """
+    needle = f"| {level} ".encode()
+    is_level_line = re.compile(_level_pattern(level).encode()).match
+    found: list[bytes] = []
+
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty file
+            return []
+
+        with mm:
+            pos = len(mm)
+            while len(found) < count:
+                hit = mm.rfind(needle, 0, pos)
+                if hit == -1:
+                    break
+                start = mm.rfind(b"\n", 0, hit) + 1
+                end = mm.find(b"\n", hit)
+                line = mm[start : end if end != -1 else len(mm)]
+                if is_level_line(line):
+                    found.append(line)
+                pos = start
+
+    return [line.decode("utf-8", errors="replace") for line in reversed(found)]
+
+
+def _grep_tail(path: Path, pattern: str, count: int) -> list[str] | None:
+    """
+    Last ``count`` lines matching the ERE ``pattern`` via ``grep -E | tail``.
+
+    Returns None when grep/tail are unavailable (e.g. Windows) so callers can
+    fall back to the Python reader.
+    """
+    grep, tail = shutil.which("grep"), shutil.which("tail")
+    if not grep or not tail:
+        return None
+
+    grep_proc = subprocess.Popen(
+        [grep, "-E", "--", pattern, str(path)], stdout=subprocess.PIPE
+    )
+    try:
+        tail_proc = subprocess.run(
+            [tail, "-n", str(count)], stdin=grep_proc.stdout, capture_output=True
+        )
+    finally:
+        grep_proc.stdout.close()
+        grep_proc.wait()
+
+    return tail_proc.stdout.decode("utf-8", errors="replace").splitlines()
+
+
+def _follow_file(path: Path, poll_interval: float = 0.5) -> None:
+    """Print the last lines of ``path`` and then new lines as they arrive.
+
+    Fallback for ``server logs -f`` where no ``tail`` binary exists.
+    """
+    for line in _tail_lines(path, 10):
+        click.echo(line.rstrip())
+
+    with open(path, encoding="utf-8", errors="replace") as f:
+        f.seek(0, os.SEEK_END)
+        while True:
+            line = f.readline()
+            if line:
+                click.echo(line.rstrip())
+            else:
+                time.sleep(poll_interval)
+
+
 @server.command()
 @click.option("-f", "--follow", is_flag=True, help="Follow log output (tail -f)")
 @click.option("-n", "--lines", default=50, help="Number of lines to show (default: 50)")
@@ -206,21 +460,27 @@ def logs(follow, lines, level):
     if follow:
         click.echo(f"📝 Following logs from {log_file} (Ctrl+C to stop)...")
         click.echo()
+        tail = shutil.which("tail")
+        if tail:
+            # Replace this process rather than keeping Python resident
+            # alongside a tail child for the whole session
+            sys.stdout.flush()
+            os.execv(tail, [tail, "-f", str(log_file)])
         try:
-            subprocess.run(["tail", "-f", str(log_file)])
+            _follow_file(log_file)
         except KeyboardInterrupt:
             click.echo("\n\n⏹️  Stopped following logs")
     else:
         click.echo(f"📝 Last {lines} lines from {log_file}:")
         click.echo()
 
-        with open(log_file, "r") as f:
-            all_lines = f.readlines()
-
-        # Filter by level if specified
+        # Filter by level if specified, then show the last N lines
         if level:
-            all_lines = [line for line in all_lines if f"| {level}" in line]
+            tail = _grep_tail(log_file, _level_pattern(level), lines)
+            if tail is None:
+                tail = _tail_matching_lines(log_file, level, lines)
+        else:
+            tail = _tail_lines(log_file, lines)
 
-        # Show last N lines
-        for line in all_lines[-lines:]:
+        for line in tail:
             click.echo(line.rstrip())
@@ -1,50 +1,44 @@
 """CLI commands for token management."""
 
-import json
 import sys
-from pathlib import Path
 
 from ..auth.token_manager import TokenManager
 from ..config import settings
+from .common import TokenNotFoundError, get_clipboard, load_token, read_json, render_qr
 
 
-def show_token() -> None:
-    """Display the current API token."""
-    config_file = settings.CONFIG_FILE
-
-    if not config_file.exists():
-        print("❌ No token found. Start the API server to generate one.")
-        print(f"\nRun: aws-profile-bridge-api")
-        sys.exit(1)
-
+def _load_token(hint: str | None = None) -> str:
+    """Return the stored API token, exiting with a message if there is none."""
     try:
-        with open(config_file, "r") as f:
-            config = json.load(f)
-            token = config.get("api_token")
+        return load_token()
+    except TokenNotFoundError as e:
+        print(f"❌ {e}")
+        if hint and e.config_missing:
+            print(hint)
+        sys.exit(1)
 
-            if not token:
-                print("❌ Token not found in config file.")
-                sys.exit(1)
 
-            # Check if legacy format
-            is_legacy = TokenManager.LEGACY_PATTERN.match(token) is not None
-            is_new = TokenManager.NEW_PATTERN.match(token) is not None
+def show_token() -> None:
+    """Display the current API token."""
+    try:
+        token = _load_token(hint="\nRun: aws-profile-bridge-api")
 
-            print("✅ Current API Token:")
-            print(f"\n{token}\n")
+        print("✅ Current API Token:")
+        print(f"\n{token}\n")
 
-            if is_new:
+        match TokenManager.classify(token):
+            case "new":
                 print("✓ Format: New (awspc_...)")
                 print("✓ Checksum: Valid")
-            elif is_legacy:
+            case "legacy":
                 print("⚠️  Format: Legacy (deprecated)")
                 print("⚠️  Recommendation: Run 'aws-profile-bridge-api token rotate' to upgrade")
 
-            print(f"\nStored in: {config_file}")
-            print("\nNext steps:")
-            print("1. Copy the token above")
-            print("2. Open your browser extension settings")
-            print("3. Paste the token and click 'Save'")
+        print(f"\nStored in: {settings.CONFIG_FILE}")
+        print("\nNext steps:")
+        print("1. Copy the token above")
+        print("2. Open your browser extension settings")
+        print("3. Paste the token and click 'Save'")
 
     except Exception as e:
         print(f"❌ Error reading token: {e}")
@@ -53,33 +47,19 @@ def show_token() -> None:
 
 def copy_token() -> None:
     """Copy the current API token to clipboard."""
-    config_file = settings.CONFIG_FILE
-
-    if not config_file.exists():
-        print("❌ No token found. Start the API server to generate one.")
-        sys.exit(1)
-
     try:
-        with open(config_file, "r") as f:
-            config = json.load(f)
-            token = config.get("api_token")
-
-            if not token:
-                print("❌ Token not found in config file.")
-                sys.exit(1)
+        token = _load_token()
 
         # Try to copy to clipboard
-        try:
-            import pyperclip
-
-            pyperclip.copy(token)
+        clipboard = get_clipboard()
+        if clipboard:
+            clipboard.copy(token)
             print("✅ Token copied to clipboard!")
             print("\nNext steps:")
             print("1. Open your browser extension settings")
             print("2. Paste (Ctrl+V / Cmd+V) the token")
             print("3. Click 'Save'")
-
-        except ImportError:
+        else:
             print("⚠️  pyperclip not installed. Showing token instead:\n")
             print(token)
             print("\nTo enable clipboard support:")
@@ -97,29 +77,28 @@ def rotate_token() -> None:
     try:
         manager = TokenManager(config_file)
 
-        # Load existing token (if any)
-        if config_file.exists():
-            manager.load_or_create()
-            old_token = manager._token
+        # Load existing token (if any); an unreadable config is simply replaced
+        try:
+            old_token = read_json(config_file).get("api_token")
+        except (FileNotFoundError, ValueError):
+            old_token = None
+
+        if old_token:
             print(f"Current token: {old_token[:10]}...{old_token[-6:]}")
         else:
-            old_token = None
             print("No existing token found.")
 
         # Generate new token
         new_token = manager.rotate()
 
-        print(f"\n✅ New token generated!")
+        print("\n✅ New token generated!")
         print(f"\n{new_token}\n")
 
         # Try to copy to clipboard
-        try:
-            import pyperclip
-
-            pyperclip.copy(new_token)
+        clipboard = get_clipboard()
+        if clipboard:
+            clipboard.copy(new_token)
             print("✅ Token copied to clipboard!")
-        except ImportError:
-            pass
 
         print("\n⚠️  IMPORTANT: Update your browser extension with the new token!")
         print("\nSteps:")
@@ -137,35 +116,15 @@ def rotate_token() -> None:
 
 def show_qr_code() -> None:
     """Display token as QR code for easy mobile/remote transfer."""
-    config_file = settings.CONFIG_FILE
-
-    if not config_file.exists():
-        print("❌ No token found. Start the API server to generate one.")
-        sys.exit(1)
-
     try:
-        with open(config_file, "r") as f:
-            config = json.load(f)
-            token = config.get("api_token")
-
-            if not token:
-                print("❌ Token not found in config file.")
-                sys.exit(1)
-
-        # Try to generate QR code
-        try:
-            import qrcode
-
-            qr = qrcode.QRCode(version=1, box_size=10, border=4)
-            qr.add_data(token)
-            qr.make(fit=True)
+        token = _load_token()
 
+        art = render_qr(token)
+        if art is not None:
             print("\n✅ Scan this QR code with your mobile device:\n")
-            qr.print_ascii(invert=True)
-
+            print(art, end="")
             print(f"\nToken: {token[:10]}...{token[-6:]}")
-
-        except ImportError:
+        else:
             print("⚠️  qrcode not installed. Showing token instead:\n")
             print(token)
             print("\nTo enable QR code support:")
@@ -184,34 +143,32 @@ def setup_wizard() -> None:
     print("AWS Profile Bridge - Setup Wizard")
     print("=" * 60)
 
-    # Check if already configured
-    if config_file.exists():
-        try:
-            with open(config_file, "r") as f:
-                config = json.load(f)
-                existing_token = config.get("api_token")
-
-            if existing_token:
-                print("\n⚠️  API token already exists.")
-                print(f"Current token: {existing_token[:10]}...{existing_token[-6:]}")
-                print("\nOptions:")
-                print("  1. Show existing token")
-                print("  2. Generate new token (invalidates old one)")
-                print("  3. Exit")
-
-                choice = input("\nChoice [1]: ").strip() or "1"
-
-                if choice == "1":
-                    show_token()
-                    return
-                elif choice == "2":
-                    rotate_token()
-                    return
-                else:
-                    print("Exiting.")
-                    return
-        except Exception:
-            pass
+    # Check if already configured (a missing file just falls through)
+    try:
+        config = read_json(config_file)
+        existing_token = config.get("api_token")
+
+        if existing_token:
+            print("\n⚠️  API token already exists.")
+            print(f"Current token: {existing_token[:10]}...{existing_token[-6:]}")
+            print("\nOptions:")
+            print("  1. Show existing token")
+            print("  2. Generate new token (invalidates old one)")
+            print("  3. Exit")
+
+            choice = input("\nChoice [1]: ").strip() or "1"
+
+            if choice == "1":
+                show_token()
+                return
+            elif choice == "2":
+                rotate_token()
+                return
+            else:
+                print("Exiting.")
+                return
+    except Exception:
+        pass
 
     # Generate new token
     print("\n📝 Generating API token...")
@@ -224,12 +181,11 @@ def setup_wizard() -> None:
         print(f"\n{token}\n")
 
         # Try to copy to clipboard
-        try:
-            import pyperclip
-
-            pyperclip.copy(token)
+        clipboard = get_clipboard()
+        if clipboard:
+            clipboard.copy(token)
             print("✅ Token copied to clipboard!")
-        except ImportError:
+        else:
             print("💡 Tip: Install pyperclip to auto-copy: pip install pyperclip")
 
         print("\n" + "=" * 60)
@@ -1,13 +1,23 @@
 """Token management commands (Click version)."""
 
-import json
 import sys
-from pathlib import Path
 
 import click
 
 from ..auth.token_manager import TokenManager
 from ..config import settings
+from .common import TokenNotFoundError, get_clipboard, load_token, read_json, render_qr
+
+
+def _load_token(hint: str | None = None) -> str:
+    """Return the stored API token, exiting with a message if there is none."""
+    try:
+        return load_token()
+    except TokenNotFoundError as e:
+        click.echo(f"❌ {e}")
+        if hint and e.config_missing:
+            click.echo(hint)
+        sys.exit(1)
 
 
 @click.group()
@@ -19,41 +29,25 @@ def token():
 @token.command()
 def show():
     """Display the current API token."""
-    config_file = settings.CONFIG_FILE
-
-    if not config_file.exists():
-        click.echo("❌ No token found. Start the API server to generate one.")
-        click.echo(f"\nRun: aws-profile-bridge server start")
-        sys.exit(1)
-
     try:
-        with open(config_file, "r") as f:
-            config = json.load(f)
-            token = config.get("api_token")
-
-            if not token:
-                click.echo("❌ Token not found in config file.")
-                sys.exit(1)
+        token = _load_token(hint="\nRun: aws-profile-bridge server start")
 
-            # Check if legacy format
-            is_legacy = TokenManager.LEGACY_PATTERN.match(token) is not None
-            is_new = TokenManager.NEW_PATTERN.match(token) is not None
-
-            click.echo("✅ Current API Token:")
-            click.echo(f"\n{token}\n")
+        click.echo("✅ Current API Token:")
+        click.echo(f"\n{token}\n")
 
-            if is_new:
+        match TokenManager.classify(token):
+            case "new":
                 click.echo("✓ Format: New (awspc_...)")
                 click.echo("✓ Checksum: Valid")
-            elif is_legacy:
+            case "legacy":
                 click.echo("⚠️  Format: Legacy (deprecated)")
                 click.echo("⚠️  Recommendation: Run 'aws-profile-bridge token rotate' to upgrade")
 
-            click.echo(f"\nStored in: {config_file}")
-            click.echo("\nNext steps:")
-            click.echo("1. Copy the token above")
-            click.echo("2. Open your browser extension settings")
-            click.echo("3. Paste the token and click 'Save'")
+        click.echo(f"\nStored in: {settings.CONFIG_FILE}")
+        click.echo("\nNext steps:")
+        click.echo("1. Copy the token above")
+        click.echo("2. Open your browser extension settings")
+        click.echo("3. Paste the token and click 'Save'")
 
     except Exception as e:
         click.echo(f"❌ Error reading token: {e}")
@@ -63,33 +57,19 @@ def show():
 @token.command()
 def copy():
     """Copy the current API token to clipboard."""
-    config_file = settings.CONFIG_FILE
-
-    if not config_file.exists():
-        click.echo("❌ No token found. Start the API server to generate one.")
-        sys.exit(1)
-
     try:
-        with open(config_file, "r") as f:
-            config = json.load(f)
-            token = config.get("api_token")
-
-            if not token:
-                click.echo("❌ Token not found in config file.")
-                sys.exit(1)
+        token = _load_token()
 
         # Try to copy to clipboard
-        try:
-            import pyperclip
-
-            pyperclip.copy(token)
+        clipboard = get_clipboard()
+        if clipboard:
+            clipboard.copy(token)
             click.echo("✅ Token copied to clipboard!")
             click.echo("\nNext steps:")
             click.echo("1. Open your browser extension settings")
             click.echo("2. Paste (Ctrl+V / Cmd+V) the token")
             click.echo("3. Click 'Save'")
-
-        except ImportError:
+        else:
             click.echo("⚠️  pyperclip not installed. Showing token instead:\n")
             click.echo(token)
             click.echo("\nTo enable clipboard support:")
@@ -108,29 +88,28 @@ def rotate():
     try:
         manager = TokenManager(config_file)
 
-        # Load existing token (if any)
-        if config_file.exists():
-            manager.load_or_create()
-            old_token = manager._token
+        # Load existing token (if any); an unreadable config is simply replaced
+        try:
+            old_token = read_json(config_file).get("api_token")
+        except (FileNotFoundError, ValueError):
+            old_token = None
+
+        if old_token:
             click.echo(f"Current token: {old_token[:10]}...{old_token[-6:]}")
         else:
-            old_token = None
             click.echo("No existing token found.")
 
         # Generate new token
         new_token = manager.rotate()
 
-        click.echo(f"\n✅ New token generated!")
+        click.echo("\n✅ New token generated!")
         click.echo(f"\n{new_token}\n")
 
         # Try to copy to clipboard
-        try:
-            import pyperclip
-
-            pyperclip.copy(new_token)
+        clipboard = get_clipboard()
+        if clipboard:
+            clipboard.copy(new_token)
             click.echo("✅ Token copied to clipboard!")
-        except ImportError:
-            pass
 
         click.echo("\n⚠️  IMPORTANT: Update your browser extension with the new token!")
         click.echo("\nSteps:")
@@ -149,35 +128,15 @@ def rotate():
 @token.command()
 def qr():
     """Display token as QR code for easy mobile/remote transfer."""
-    config_file = settings.CONFIG_FILE
-
-    if not config_file.exists():
-        click.echo("❌ No token found. Start the API server to generate one.")
-        sys.exit(1)
-
     try:
-        with open(config_file, "r") as f:
-            config = json.load(f)
-            token = config.get("api_token")
-
-            if not token:
-                click.echo("❌ Token not found in config file.")
-                sys.exit(1)
-
-        # Try to generate QR code
-        try:
-            import qrcode
-
-            qr = qrcode.QRCode(version=1, box_size=10, border=4)
-            qr.add_data(token)
-            qr.make(fit=True)
+        token = _load_token()
 
+        art = render_qr(token)
+        if art is not None:
             click.echo("\n✅ Scan this QR code with your mobile device:\n")
-            qr.print_ascii(invert=True)
-
+            click.echo(art, nl=False)
             click.echo(f"\nToken: {token[:10]}...{token[-6:]}")
-
-        except ImportError:
+        else:
             click.echo("⚠️  qrcode not installed. Showing token instead:\n")
             click.echo(token)
             click.echo("\nTo enable QR code support:")
@@ -197,37 +156,35 @@ def setup():
     click.echo("AWS Profile Bridge - Setup Wizard")
     click.echo("=" * 60)
 
-    # Check if already configured
-    if config_file.exists():
-        try:
-            with open(config_file, "r") as f:
-                config = json.load(f)
-                existing_token = config.get("api_token")
-
-            if existing_token:
-                click.echo("\n⚠️  API token already exists.")
-                click.echo(f"Current token: {existing_token[:10]}...{existing_token[-6:]}")
-
-                click.echo("\nOptions:")
-                click.echo("  1. Show existing token")
-                click.echo("  2. Generate new token (invalidates old one)")
-                click.echo("  3. Exit")
-
-                choice = click.prompt("\nChoice", type=int, default=1)
-
-                if choice == 1:
-                    ctx = click.get_current_context()
-                    ctx.invoke(show)
-                    return
-                elif choice == 2:
-                    ctx = click.get_current_context()
-                    ctx.invoke(rotate)
-                    return
-                else:
-                    click.echo("Exiting.")
-                    return
-        except Exception:
-            pass
+    # Check if already configured (a missing file just falls through)
+    try:
+        config = read_json(config_file)
+        existing_token = config.get("api_token")
+
+        if existing_token:
+            click.echo("\n⚠️  API token already exists.")
+            click.echo(f"Current token: {existing_token[:10]}...{existing_token[-6:]}")
+
+            click.echo("\nOptions:")
+            click.echo("  1. Show existing token")
+            click.echo("  2. Generate new token (invalidates old one)")
+            click.echo("  3. Exit")
+
+            choice = click.prompt("\nChoice", type=int, default=1)
+
+            if choice == 1:
+                ctx = click.get_current_context()
+                ctx.invoke(show)
+                return
+            elif choice == 2:
+                ctx = click.get_current_context()
+                ctx.invoke(rotate)
+                return
+            else:
+                click.echo("Exiting.")
+                return
+    except Exception:
+        pass
 
     # Generate new token
     click.echo("\n📝 Generating API token...")
@@ -240,12 +197,11 @@ def setup():
         click.echo(f"\n{token}\n")
 
         # Try to copy to clipboard
-        try:
-            import pyperclip
-
-            pyperclip.copy(token)
+        clipboard = get_clipboard()
+        if clipboard:
+            clipboard.copy(token)
             click.echo("✅ Token copied to clipboard!")
-        except ImportError:
+        else:
             click.echo("💡 Tip: Install pyperclip to auto-copy: pip install 'aws-profile-bridge[cli]'")
 
         click.echo("\n" + "=" * 60)
@@ -1,14 +1,64 @@
 """Application configuration."""
 
+from functools import cache
 from pathlib import Path
 
 HOST: str = "127.0.0.1"
 PORT: int = 10999
-LOG_DIR: Path = Path.home() / ".aws" / "logs"
-LOG_FILE: Path = LOG_DIR / "aws_profile_bridge_api.log"
+LOG_DIR: Path
+LOG_FILE: Path
 LOG_MAX_BYTES: int = 10 * 1024 * 1024
 LOG_BACKUP_COUNT: int = 5
 CORS_ORIGINS: list[str] = ["*"]
-CONFIG_FILE: Path = Path.home() / ".aws" / "profile_bridge_config.json"
+# Origins fully matching this pattern are also allowed, e.g. r"moz-extension://.*"
+CORS_ORIGIN_REGEX: str | None = None
+CORS_ALLOW_METHODS: list[str] = ["POST", "GET", "OPTIONS"]
+CORS_ALLOW_HEADERS: list[str] = ["Content-Type", "X-API-Token"]
+CORS_MAX_AGE: int = 86400
+AWS_DIR: Path
+AWS_CONFIG_FILE: Path
+AWS_CREDENTIALS_FILE: Path
+CONFIG_FILE: Path
+SERVER_PID_FILE: Path
+SERVER_READY_FD_ENV: str = "AWS_PROFILE_BRIDGE_READY_FD"
+SERVER_READY_TIMEOUT: float = 10.0
 MAX_ATTEMPTS: int = 10
 WINDOW_SECONDS: int = 60
+REGIONS_CACHE_FILE: Path
+QR_CACHE_FILE: Path
+REGIONS_REFRESH_SECONDS: int = 3600
+REGIONS_COLD_FILL_TIMEOUT: float = 5.0
+
+
+@cache
+def _aws_dir() -> Path:
+    return Path.home() / ".aws"
+
+
+def _resolved(name: str) -> Path:
+    """Current value of a path setting, keeping one that was already set or overridden."""
+    return globals().get(name) or __getattr__(name)
+
+
+# Paths under the home directory are resolved on first access (PEP 562), so
+# commands that never touch them (--help, --version) skip the home lookup
+_LAZY_PATHS = {
+    "AWS_DIR": _aws_dir,
+    "AWS_CONFIG_FILE": lambda: _resolved("AWS_DIR") / "config",
+    "AWS_CREDENTIALS_FILE": lambda: _resolved("AWS_DIR") / "credentials",
+    "LOG_DIR": lambda: _resolved("AWS_DIR") / "logs",
+    "LOG_FILE": lambda: _resolved("LOG_DIR") / "aws_profile_bridge_api.log",
+    "CONFIG_FILE": lambda: _resolved("AWS_DIR") / "profile_bridge_config.json",
+    "SERVER_PID_FILE": lambda: _resolved("CONFIG_FILE").parent / "profile_bridge_server.pid",
+    "REGIONS_CACHE_FILE": lambda: _resolved("LOG_DIR") / "regions.json",
+    "QR_CACHE_FILE": lambda: _resolved("CONFIG_FILE").parent / "profile_bridge_token.qr",
+}
+
+
+def __getattr__(name: str) -> Path:
+    try:
+        factory = _LAZY_PATHS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = globals()[name] = factory()
+    return value
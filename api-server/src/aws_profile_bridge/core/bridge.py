@@ -33,6 +33,15 @@ from .parsers import (
 )
 from .url_cache import ConsoleURLCache
 
+# Fields dropped from profiles that turn out not to be SSO profiles
+_SSO_ONLY_FIELDS = (
+    "sso_start_url",
+    "sso_session",
+    "sso_region",
+    "sso_account_id",
+    "sso_role_name",
+)
+
 
 class AWSProfileBridgeHandler:
     """
@@ -93,13 +102,7 @@ class AWSProfileBridgeHandler:
 
                 # Clean up SSO-specific fields for non-SSO profiles
                 if not profile.get("is_sso"):
-                    for key in [
-                        "sso_start_url",
-                        "sso_session",
-                        "sso_region",
-                        "sso_account_id",
-                        "sso_role_name",
-                    ]:
+                    for key in _SSO_ONLY_FIELDS:
                         profile.pop(key, None)
 
             # Count profile types
@@ -157,13 +160,7 @@ class AWSProfileBridgeHandler:
 
                 # Clean up SSO-specific fields for non-SSO profiles
                 if not profile.get("is_sso"):
-                    for key in [
-                        "sso_start_url",
-                        "sso_session",
-                        "sso_region",
-                        "sso_account_id",
-                        "sso_role_name",
-                    ]:
+                    for key in _SSO_ONLY_FIELDS:
                         profile.pop(key, None)
 
             log_result(f"Enriched {len(profiles)} profiles")
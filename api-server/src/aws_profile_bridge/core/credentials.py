@@ -6,18 +6,23 @@ Orchestrates credential retrieval from multiple sources.
 Follows Single Responsibility Principle.
 """
 
+import configparser
+import threading
+import time
+from functools import cache, partial
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 try:
     import boto3
+    from botocore.exceptions import NoCredentialsError, ProfileNotFound
 
     BOTO3_AVAILABLE = True
 except ImportError:
     BOTO3_AVAILABLE = False
 
 from ..services.sso import SSOCredentialsProvider, SSOProfileEnricher
-from ..utils.logger import log_error, log_operation, log_result, timer
+from ..utils.logger import is_debug_enabled, log_error, log_operation, log_result, timer
 from .parsers import (
     ConfigFileParser,
     CredentialsFileParser,
@@ -25,6 +30,23 @@ from .parsers import (
     ProfileConfigReader,
 )
 
+STATIC_CREDENTIAL_KEYS = ("aws_access_key_id", "aws_secret_access_key", "aws_session_token")
+
+# How long a ~/.aws/.nosso check is trusted; polling clients call
+# get_all_profiles repeatedly and the marker file rarely changes
+NOSSO_CHECK_TTL = 1.0
+
+def _files_key(*paths: Path) -> tuple:
+    """(mtime_ns, size) per file, None for missing ones; changes when any file is edited."""
+    key = []
+    for path in paths:
+        try:
+            st = path.stat()
+            key.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            key.append(None)
+    return tuple(key)
+
 
 class CredentialProvider:
     """
@@ -46,6 +68,35 @@ class CredentialProvider:
         self.config_file = config_file
         self.sso_credentials_provider = sso_credentials_provider
         self.config_reader = config_reader
+        # profile name -> (stat key of the AWS files, boto3 Session)
+        self._session_by_profile: Dict[str, Tuple[tuple, "boto3.Session"]] = {}
+        # profile name -> lock held while that profile's Session is created or used
+        self._session_locks: Dict[str, threading.Lock] = {}
+        self._session_locks_guard = threading.Lock()
+
+    def _session_lock(self, profile_name: str) -> threading.Lock:
+        """Lock serializing access to one profile's cached boto3 Session."""
+        with self._session_locks_guard:
+            lock = self._session_locks.get(profile_name)
+            if lock is None:
+                lock = self._session_locks[profile_name] = threading.Lock()
+            return lock
+
+    def _session_for(self, profile_name: str) -> "boto3.Session":
+        """
+        boto3 Session for a profile, reused while the AWS files are unchanged.
+
+        A new Session rereads and parses both files; reusing it also lets
+        botocore keep its resolved (and auto-refreshing) credentials between
+        calls for the same profile. Sessions are not thread-safe, so callers
+        must hold ``_session_lock(profile_name)`` while using the result.
+        """
+        key = _files_key(self.config_file, self.credentials_file)
+        cached = self._session_by_profile.get(profile_name)
+        if cached is None or cached[0] != key:
+            cached = (key, boto3.Session(profile_name=profile_name))
+            self._session_by_profile[profile_name] = cached
+        return cached[1]
 
     def get_credentials(self, profile_name: str) -> Optional[Dict[str, str]]:
         """
@@ -58,24 +109,28 @@ class CredentialProvider:
         # Use boto3 if available (handles SSO automatically)
         if BOTO3_AVAILABLE:
             try:
-                session = boto3.Session(profile_name=profile_name)
-                credentials = session.get_credentials()
-
-                if credentials:
-                    result = {
-                        "aws_access_key_id": credentials.access_key,
-                        "aws_secret_access_key": credentials.secret_key,
-                    }
-                    if credentials.token:
-                        result["aws_session_token"] = credentials.token
-                    
-                    # Get expiry time if available
-                    if hasattr(credentials, '_expiry_time'):
-                        result["expiry_time"] = credentials._expiry_time
-                    
-                    return result
-            except Exception:
+                # Held across resolution and the key reads, which may refresh
+                with self._session_lock(profile_name):
+                    credentials = self._session_for(profile_name).get_credentials()
+
+                    if credentials:
+                        result = {
+                            "aws_access_key_id": credentials.access_key,
+                            "aws_secret_access_key": credentials.secret_key,
+                        }
+                        if credentials.token:
+                            result["aws_session_token"] = credentials.token
+
+                        # Get expiry time if available
+                        if hasattr(credentials, '_expiry_time'):
+                            result["expiry_time"] = credentials._expiry_time
+
+                        return result
+            except (ProfileNotFound, NoCredentialsError):
+                # Expected for profiles boto3 can't resolve; fall back quietly
                 pass
+            except Exception as e:
+                log_error(e, f"boto3 failed to resolve credentials for {profile_name}")
 
         # Fallback: Try credentials file
         credentials = self.config_reader.get_credentials(profile_name)
@@ -89,6 +144,51 @@ class CredentialProvider:
 
         return None
 
+    def iter_profiles_with_creds(
+        self, profile_names: Iterable[str]
+    ) -> Iterator[Tuple[str, Optional[Dict[str, str]]]]:
+        """
+        Yield (profile_name, credentials) for each profile.
+
+        The credentials file is parsed once up front; profiles without static
+        credentials there fall back to get_credentials (boto3 / SSO).
+        """
+        static_credentials = self.get_all_credentials()
+
+        for profile_name in profile_names:
+            credentials = static_credentials.get(profile_name)
+            if credentials is None:
+                try:
+                    credentials = self.get_credentials(profile_name)
+                except Exception as e:
+                    log_error(e, f"Failed to load credentials for {profile_name}")
+            yield profile_name, credentials
+
+    def get_all_credentials(self) -> Dict[str, Dict[str, str]]:
+        """
+        Parse every profile's static keys from the credentials file in one pass.
+
+        Returns a mapping of profile name to its aws_* credential keys;
+        profiles without any of those keys are omitted.
+        """
+        parser = configparser.RawConfigParser(strict=False)
+        try:
+            parser.read(self.credentials_file, encoding="utf-8")
+        except configparser.Error as e:
+            log_error(e, "Failed to parse credentials file")
+            return {}
+
+        result = {}
+        for section in parser.sections():
+            credentials = {
+                key: parser[section][key]
+                for key in STATIC_CREDENTIAL_KEYS
+                if parser.has_option(section, key)
+            }
+            if credentials:
+                result[section] = credentials
+        return result
+
 
 class ProfileAggregator:
     """
@@ -114,15 +214,26 @@ class ProfileAggregator:
         self.config_reader = config_reader
         self.aws_dir = aws_dir
         self.nosso_file = aws_dir / ".nosso"
+        # (stat key of the AWS files, boto3's profile names)
+        self._available_profiles_cache: Optional[Tuple[tuple, List[str]]] = None
+        # (monotonic time checked, whether .nosso existed)
+        self._nosso_cache: Optional[Tuple[float, bool]] = None
 
     def _should_skip_sso_profiles(self) -> bool:
         """
         Check if SSO profiles should be skipped.
 
         Returns True if ~/.aws/.nosso file exists, indicating that
-        SSO profiles should not be enumerated.
+        SSO profiles should not be enumerated. The answer is reused for
+        NOSSO_CHECK_TTL seconds.
         """
-        skip = self.nosso_file.exists()
+        now = time.monotonic()
+        cached = self._nosso_cache
+        if cached is not None and now - cached[0] < NOSSO_CHECK_TTL:
+            skip = cached[1]
+        else:
+            skip = self.nosso_file.exists()
+            self._nosso_cache = (now, skip)
         if skip:
             log_operation("Found ~/.aws/.nosso file - skipping all SSO profiles")
         return skip
@@ -140,40 +251,51 @@ class ProfileAggregator:
             f"Getting all profiles (skip_sso_enrichment={skip_sso_enrichment})"
         )
 
-        # Check and log .nosso file status
-        if self.nosso_file.exists():
+        # Check and log .nosso file status once for the whole enumeration
+        skip_sso = self._should_skip_sso_profiles()
+        if skip_sso:
             log_result(
                 f"⚠️  ~/.aws/.nosso file detected - SSO profiles will be DISABLED"
             )
 
         if BOTO3_AVAILABLE:
             log_operation("Using boto3 for profile enumeration")
-            result = self._get_profiles_with_boto3(skip_sso_enrichment)
+            result = self._get_profiles_with_boto3(skip_sso_enrichment, skip_sso)
         else:
             log_operation(
                 "Using manual parsing for profile enumeration (boto3 not available)"
             )
-            result = self._get_profiles_manual(skip_sso_enrichment)
+            result = self._get_profiles_manual(skip_sso_enrichment, skip_sso)
 
         log_result(f"Retrieved {len(result)} profiles")
         return result
 
-    def _get_profiles_with_boto3(self, skip_sso_enrichment: bool = True) -> List[Dict]:
+    def _get_profiles_with_boto3(
+        self, skip_sso_enrichment: bool = True, skip_sso: Optional[bool] = None
+    ) -> List[Dict]:
         """Use boto3 to enumerate profiles (faster and more reliable)."""
         try:
             # Check if SSO profiles should be skipped BEFORE enumerating
-            skip_sso = self._should_skip_sso_profiles()
+            if skip_sso is None:
+                skip_sso = self._should_skip_sso_profiles()
 
-            available_profiles = boto3.Session().available_profiles
+            available_profiles = self._available_profiles()
             log_operation(
                 f"Boto3 found {len(available_profiles)} profiles: {', '.join(available_profiles)}"
             )
-            profiles = []
+            # Indexed on first use only: inventories where every profile is
+            # SSO never read the credentials file
+            cred_index = cache(self._credential_profiles_by_name)
+            build = partial(
+                self._build_profile_info,
+                skip_sso_enrichment=skip_sso_enrichment,
+                cred_index=cred_index,
+                skip_sso=skip_sso,
+            )
 
-            for profile_name in available_profiles:
-                profile = self._build_profile_info(profile_name, skip_sso_enrichment)
-                if profile:
-                    profiles.append(profile)
+            # Built serially: this already runs on an app executor thread and
+            # the per-profile work is mostly GIL-bound dict handling
+            profiles = [profile for profile in map(build, available_profiles) if profile]
 
             # Summary of classifications
             sso_profiles = [p["name"] for p in profiles if p.get("is_sso")]
@@ -192,14 +314,48 @@ class ProfileAggregator:
         except Exception as e:
             log_error(e, "Failed to get profiles with boto3")
             # Fall back to manual parsing
-            return self._get_profiles_manual(skip_sso_enrichment)
+            return self._get_profiles_manual(skip_sso_enrichment, skip_sso)
+
+    def _available_profiles(self) -> List[str]:
+        """
+        Profile names as boto3 sees them, reused while the AWS files are unchanged.
+
+        Creating a boto3 Session loads its data and plugins and rereads both
+        files, so polling callers would otherwise pay that on every request.
+        """
+        key = _files_key(self.config_parser.file_path, self.credentials_parser.file_path)
+        cached = self._available_profiles_cache
+        if cached is None or cached[0] != key:
+            cached = (key, boto3.Session().available_profiles)
+            self._available_profiles_cache = cached
+        return cached[1]
+
+    def _credential_profiles_by_name(self) -> Dict[str, Dict]:
+        """Profiles from the credentials file, keyed by name."""
+        return {p["name"]: p for p in self.credentials_parser.parse()}
 
     def _build_profile_info(
-        self, profile_name: str, skip_sso_enrichment: bool = True
+        self,
+        profile_name: str,
+        skip_sso_enrichment: bool = True,
+        cred_index: Optional[Callable[[], Dict[str, Dict]]] = None,
+        skip_sso: Optional[bool] = None,
     ) -> Optional[Dict]:
-        """Build profile information for a single profile."""
+        """
+        Build profile information for a single profile.
+
+        Callers building many profiles should pass a shared ``cred_index``
+        loader (returning ``_credential_profiles_by_name()``) and ``skip_sso``
+        so the credentials file is indexed and ~/.aws/.nosso is checked once
+        rather than per profile.
+        """
+        if cred_index is None:
+            cred_index = self._credential_profiles_by_name
+        # Per-profile tracing is formatted only when it will be written
+        verbose = is_debug_enabled()
         try:
-            log_operation(f"Building profile info for: {profile_name}")
+            if verbose:
+                log_operation(f"Building profile info for: {profile_name}")
 
             profile_data = {
                 "name": profile_name,
@@ -210,14 +366,16 @@ class ProfileAggregator:
             }
 
             # Check if this is an SSO profile
-            log_operation(f"Checking config file for SSO markers")
+            if verbose:
+                log_operation(f"Checking config file for SSO markers")
             profile_config = self.config_reader.get_config(profile_name)
 
             if profile_config:
-                log_operation(
-                    f"Found config for {profile_name}",
-                    {"config_keys": list(profile_config.keys())},
-                )
+                if verbose:
+                    log_operation(
+                        f"Found config for {profile_name}",
+                        {"config_keys": list(profile_config.keys())},
+                    )
 
                 # Check for SSO markers
                 has_sso_start_url = "sso_start_url" in profile_config
@@ -225,24 +383,27 @@ class ProfileAggregator:
 
                 if has_sso_start_url or has_sso_session:
                     # This is an SSO profile - check if we should skip it
-                    if self._should_skip_sso_profiles():
+                    if skip_sso is None:
+                        skip_sso = self._should_skip_sso_profiles()
+                    if skip_sso:
                         log_result(
                             f"⊗ SKIPPING SSO profile {profile_name} due to .nosso file"
                         )
                         return None
-                    sso_markers = []
-                    if has_sso_start_url:
-                        sso_markers.append(
-                            f"sso_start_url={profile_config['sso_start_url']}"
-                        )
-                    if has_sso_session:
-                        sso_markers.append(
-                            f"sso_session={profile_config['sso_session']}"
-                        )
+                    if verbose:
+                        sso_markers = []
+                        if has_sso_start_url:
+                            sso_markers.append(
+                                f"sso_start_url={profile_config['sso_start_url']}"
+                            )
+                        if has_sso_session:
+                            sso_markers.append(
+                                f"sso_session={profile_config['sso_session']}"
+                            )
 
-                    log_result(
-                        f"✓ CLASSIFIED AS SSO - Found markers: {', '.join(sso_markers)}"
-                    )
+                        log_result(
+                            f"✓ CLASSIFIED AS SSO - Found markers: {', '.join(sso_markers)}"
+                        )
 
                     profile_data["is_sso"] = True
                     profile_data["has_credentials"] = (
@@ -261,18 +422,19 @@ class ProfileAggregator:
                     profile_data["sso_role_name"] = profile_config.get("sso_role_name")
                     profile_data["aws_region"] = profile_config.get("region")
 
-                    log_operation(
-                        f"SSO profile details",
-                        {
-                            "sso_region": profile_data["sso_region"],
-                            "sso_account_id": profile_data.get(
-                                "sso_account_id", "not set"
-                            ),
-                            "sso_role_name": profile_data.get(
-                                "sso_role_name", "not set"
-                            ),
-                        },
-                    )
+                    if verbose:
+                        log_operation(
+                            f"SSO profile details",
+                            {
+                                "sso_region": profile_data["sso_region"],
+                                "sso_account_id": profile_data.get(
+                                    "sso_account_id", "not set"
+                                ),
+                                "sso_role_name": profile_data.get(
+                                    "sso_role_name", "not set"
+                                ),
+                            },
+                        )
 
                     # Optionally enrich with SSO token info (slow operation)
                     if not skip_sso_enrichment:
@@ -283,9 +445,7 @@ class ProfileAggregator:
                         f"Config found but NO SSO markers - checking credentials file"
                     )
                     # Has config but not SSO - check credentials
-                    cred_profiles = {
-                        p["name"]: p for p in self.credentials_parser.parse()
-                    }
+                    cred_profiles = cred_index()
                     if profile_name in cred_profiles:
                         cred_profile = cred_profiles[profile_name]
                         has_creds = cred_profile.get("has_credentials", False)
@@ -309,7 +469,7 @@ class ProfileAggregator:
             else:
                 # No config found - must be credentials-only profile
                 log_operation(f"No config found - checking credentials file only")
-                cred_profiles = {p["name"]: p for p in self.credentials_parser.parse()}
+                cred_profiles = cred_index()
                 if profile_name in cred_profiles:
                     cred_profile = cred_profiles[profile_name]
                     has_creds = cred_profile.get("has_credentials", False)
@@ -328,21 +488,28 @@ class ProfileAggregator:
                 else:
                     log_result(f"Profile not found anywhere", success=False)
 
-            log_result(
-                f"Final classification: {'SSO' if profile_data['is_sso'] else 'CREDENTIALS'} (has_credentials={profile_data['has_credentials']})"
-            )
+            if verbose:
+                kind = "SSO" if profile_data["is_sso"] else "CREDENTIALS"
+                log_result(
+                    f"Final classification: {kind} "
+                    f"(has_credentials={profile_data['has_credentials']})"
+                )
             return profile_data
 
         except Exception as e:
             log_error(e, f"Failed to build profile info for {profile_name}")
             return None
 
-    def _get_profiles_manual(self, skip_sso_enrichment: bool = True) -> List[Dict]:
+    def _get_profiles_manual(
+        self, skip_sso_enrichment: bool = True, skip_sso: Optional[bool] = None
+    ) -> List[Dict]:
         """Manual parsing when boto3 is not available."""
         cred_profiles = self.credentials_parser.parse()
 
         # Check if SSO profiles should be skipped
-        if self._should_skip_sso_profiles():
+        if skip_sso is None:
+            skip_sso = self._should_skip_sso_profiles()
+        if skip_sso:
             log_result(
                 f"Skipping SSO profiles due to .nosso file - returning only credential profiles"
             )
@@ -6,9 +6,9 @@ Provides color and icon metadata for profiles.
 Uses Strategy pattern (Open/Closed Principle) for extensibility.
 """
 
+import re
 from abc import ABC, abstractmethod
-from functools import lru_cache
-from typing import Dict, List
+from typing import Callable, Dict, List, Tuple
 
 
 class MetadataRule(ABC):
@@ -33,15 +33,29 @@ class MetadataRule(ABC):
 class KeywordMetadataRule(MetadataRule):
     """Rule that matches profiles containing specific keywords."""
 
+    # Matches nothing; used when a rule has no keywords
+    _NEVER = re.compile(r"(?!)")
+
     def __init__(self, keywords: List[str], color: str, icon: str):
-        self.keywords = [k.lower() for k in keywords]
+        # A tuple, so the keywords cannot drift from the compiled pattern below
+        self.keywords = tuple(k.lower() for k in keywords)
         self.color = color
         self.icon = icon
+        # One alternation over the lowercased keywords, scanned in C instead
+        # of a Python loop per keyword
+        self._pattern = (
+            re.compile("|".join(map(re.escape, self.keywords)))
+            if self.keywords
+            else self._NEVER
+        )
 
     def matches(self, profile_name: str) -> bool:
         """Check if profile name contains any keyword."""
-        name_lower = profile_name.lower()
-        return any(keyword in name_lower for keyword in self.keywords)
+        return self.matches_lower(profile_name.lower())
+
+    def matches_lower(self, name_lower: str) -> bool:
+        """Check an already-lowercased profile name for any keyword."""
+        return self._pattern.search(name_lower) is not None
 
     def get_color(self) -> str:
         return self.color
@@ -64,30 +78,73 @@ class ProfileMetadataProvider:
         default_color: str = "blue",
         default_icon: str = "circle",
     ):
-        self.rules = rules
+        self.rules = []
         self.default_color = default_color
         self.default_icon = default_icon
+        # Parallel arrays, one entry per rule, so a lookup iterates plain
+        # callables and tuples instead of dispatching through rule objects
+        self._rule_matchers: List[Callable[[str], object]] = []
+        self._rule_wants_lower: List[bool] = []
+        self._rule_metadata: List[Tuple[str, str]] = []
+        # profile name -> (color, icon); names form a small, bounded set, so
+        # every lookup is kept with no LRU bookkeeping or eviction
+        self._metadata_cache: Dict[str, Tuple[str, str]] = {}
+        for rule in rules:
+            self.add_rule(rule)
+
+    def add_rule(self, rule: MetadataRule) -> None:
+        """
+        Append a rule; it is checked after all existing rules.
+
+        Rules must be added through this method: ``self.rules`` is the
+        provider's own list, so changes to the list passed to ``__init__``
+        are not seen.
+        """
+        self.rules.append(rule)
+        matches_lower = getattr(rule, "matches_lower", None)
+        if matches_lower is not None:
+            # Rules offering matches_lower (keyword rules) share one lowercasing
+            self._rule_matchers.append(matches_lower)
+            self._rule_wants_lower.append(True)
+        else:
+            self._rule_matchers.append(rule.matches)
+            self._rule_wants_lower.append(False)
+        self._rule_metadata.append((rule.get_color(), rule.get_icon()))
+        self._metadata_cache.clear()
+
+    def get_metadata(self, profile_name: str) -> Tuple[str, str]:
+        """Get (color, icon) for profile from the first matching rule."""
+        try:
+            return self._metadata_cache[profile_name]
+        except KeyError:
+            pass
+
+        metadata = self._match(profile_name)
+        self._metadata_cache[profile_name] = metadata
+        return metadata
+
+    def _match(self, profile_name: str) -> Tuple[str, str]:
+        """(color, icon) of the first rule matching the profile, else the defaults."""
+        # Lowercase once for all keyword rules rather than once per rule
+        name_lower = profile_name.lower()
+        for matches, wants_lower, metadata in zip(
+            self._rule_matchers, self._rule_wants_lower, self._rule_metadata
+        ):
+            if matches(name_lower if wants_lower else profile_name):
+                return metadata
+        return self.default_color, self.default_icon
 
-    @lru_cache(maxsize=256)
     def get_color(self, profile_name: str) -> str:
         """Get color for profile based on matching rule."""
-        for rule in self.rules:
-            if rule.matches(profile_name):
-                return rule.get_color()
-        return self.default_color
+        return self.get_metadata(profile_name)[0]
 
-    @lru_cache(maxsize=256)
     def get_icon(self, profile_name: str) -> str:
         """Get icon for profile based on matching rule."""
-        for rule in self.rules:
-            if rule.matches(profile_name):
-                return rule.get_icon()
-        return self.default_icon
+        return self.get_metadata(profile_name)[1]
 
     def enrich_profile(self, profile: Dict) -> Dict:
         """Add color and icon to profile dict."""
-        profile["color"] = self.get_color(profile["name"])
-        profile["icon"] = self.get_icon(profile["name"])
+        profile["color"], profile["icon"] = self.get_metadata(profile["name"])
         return profile
 
 
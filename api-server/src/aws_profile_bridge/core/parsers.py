@@ -7,48 +7,152 @@ All parsers share common INI-style parsing logic.
 """
 
 import re
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from datetime import datetime, timezone
 from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
-from ..utils.logger import log_operation, log_result, timer
+from ..utils.logger import is_debug_enabled, log_operation, log_result, timer
+
+# Expiration comment written by credential helpers: "# Expires 2024-11-10 15:30:00 UTC"
+# Each date/time field is its own group, so no strptime format parsing is needed
+_EXPIRES_RE = re.compile(r"Expires\s+(\d{4})-(\d{2})-(\d{2})\s+(\d{2}):(\d{2}):(\d{2})")
+
+
+def _ini_line_re(fields: Optional[Tuple[str, ...]] = None) -> "re.Pattern[str]":
+    """
+    Regex for the INI lines a parser acts on: [section] headers, # comments and
+    ``key = value`` pairs whose key is one of ``fields`` (any key if None).
+
+    findall() yields (section, comment, key, value) with surrounding whitespace
+    excluded. Every other line is skipped inside the regex engine.
+    """
+    keys = r"[^=\s][^=\n]*?" if fields is None else "|".join(map(re.escape, fields))
+    return re.compile(
+        r"^[ \t]*(?:"
+        r"\[(.*)\][ \t\r]*$"
+        r"|(#.*)"
+        rf"|({keys})[ \t]*=[ \t]*(.*?)[ \t\r]*$"
+        r")",
+        re.MULTILINE,
+    )
+
+
+_ANY_KEY_LINE_RE = _ini_line_re()
+
+_CREDENTIAL_KEYS = ("aws_access_key_id", "aws_secret_access_key", "aws_session_token")
+_CREDENTIAL_KEY_SET = frozenset(_CREDENTIAL_KEYS)
+
+# ~/.aws/config key -> (profile field it fills, whether it marks an SSO profile)
+_CONFIG_FIELDS = {
+    "sso_start_url": ("sso_start_url", True),
+    "sso_session": ("sso_session", True),
+    "sso_region": ("sso_region", False),
+    "sso_account_id": ("sso_account_id", False),
+    "sso_role_name": ("sso_role_name", False),
+    "region": ("aws_region", False),
+}
 
 
 class FileCache:
-    """Simple file-based cache using mtime for invalidation."""
+    """
+    Simple file-based cache using mtime for invalidation.
+
+    Safe to share between threads (FastAPI runs sync endpoints in a pool) and
+    bounded to the ``maxsize`` most recently used files.
+    """
 
-    def __init__(self):
-        self._cache: Dict[Path, Tuple[float, any]] = {}
+    def __init__(self, maxsize: int = 64):
+        self.maxsize = maxsize
+        self._cache: "OrderedDict[Path, Tuple[Tuple[int, int], any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Serialises get_or_compute producers per file
+        self._path_locks: Dict[Path, threading.Lock] = {}
+
+    @staticmethod
+    def _stat_key(file_path: Path) -> Optional[Tuple[int, int]]:
+        """
+        (mtime_ns, size) of the file, or None if it doesn't exist.
+
+        One stat call instead of exists() + stat(); integer nanoseconds avoid
+        float rounding, and the size catches rewrites within the same tick.
+        """
+        try:
+            st = file_path.stat()
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
 
     def get(self, file_path: Path) -> Optional[any]:
         """Get cached data if file hasn't been modified."""
-        if not file_path.exists():
+        with self._lock:
+            cached = self._cache.get(file_path)
+        if cached is None:
             return None
 
-        current_mtime = file_path.stat().st_mtime
-        if file_path in self._cache:
-            cached_mtime, cached_data = self._cache[file_path]
-            if cached_mtime == current_mtime:
-                return cached_data
+        cached_key, cached_data = cached
+        if cached_key != self._stat_key(file_path):
+            return None
 
-        return None
+        with self._lock:
+            if file_path in self._cache:
+                self._cache.move_to_end(file_path)
+        return cached_data
 
     def set(self, file_path: Path, data: any):
         """Cache data with file's current mtime."""
-        if file_path.exists():
-            mtime = file_path.stat().st_mtime
-            self._cache[file_path] = (mtime, data)
+        key = self._stat_key(file_path)
+        if key is not None:
+            self._store(file_path, key, data)
+
+    def get_or_compute(self, file_path: Path, producer: Callable[[], any]) -> any:
+        """
+        Cached data for the file, or ``producer()``'s result, cached.
+
+        Concurrent misses on the same file wait for a single producer call
+        instead of each parsing the file. The stat key is taken before
+        producing, so an edit made mid-parse invalidates the stored result.
+        """
+        data = self.get(file_path)
+        if data is not None:
+            return data
+
+        with self._lock:
+            path_lock = self._path_locks.setdefault(file_path, threading.Lock())
+
+        with path_lock:
+            # Another thread may have filled the entry while we waited
+            data = self.get(file_path)
+            if data is None:
+                key = self._stat_key(file_path)
+                data = producer()
+                if key is not None and data is not None:
+                    self._store(file_path, key, data)
+        return data
+
+    def _store(self, file_path: Path, key: Tuple[int, int], data: any):
+        with self._lock:
+            self._cache[file_path] = (key, data)
+            self._cache.move_to_end(file_path)
+            while len(self._cache) > self.maxsize:
+                evicted, _ = self._cache.popitem(last=False)
+                self._path_locks.pop(evicted, None)
 
     def clear(self):
         """Clear all cached data."""
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
 
 
 class INIFileParser(ABC):
     """Base parser for INI-style AWS configuration files (DRY principle)."""
 
+    # Set by subclasses from the keys their _parse_field handles
+    _line_re: "re.Pattern[str]"
+
     def __init__(self, file_path: Path, cache: Optional[FileCache] = None):
         self.file_path = file_path
         self.cache = cache or FileCache()
@@ -64,7 +168,11 @@ class INIFileParser(ABC):
             )
             return cached_data
 
-        # Parse file
+        # Parse file, once even if several threads miss together
+        return self.cache.get_or_compute(self.file_path, self._parse_uncached)
+
+    def _parse_uncached(self) -> List[Dict]:
+        """Parse the file without consulting the cache."""
         if not self.file_path.exists():
             log_result(f"File not found: {self.file_path}")
             return []
@@ -72,50 +180,46 @@ class INIFileParser(ABC):
         log_operation(f"Parsing {self.file_path.name}")
         profiles = self._parse_file()
         log_result(f"Parsed {len(profiles)} profiles from {self.file_path.name}")
-
-        # Cache results
-        self.cache.set(self.file_path, profiles)
-
         return profiles
 
     def _parse_file(self) -> List[Dict]:
         """Parse the INI file into profile dictionaries."""
-        profiles = []
-        current_profile = None
-        profile_data = {}
+        return list(self._iter_profiles())
 
+    def _iter_profiles(self) -> Iterator[Dict]:
+        """Yield each included profile as soon as its section ends."""
         with open(self.file_path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-
-                # Check for section header
-                if self._is_section_header(line):
-                    # Save previous profile
-                    if current_profile and self._should_include_profile(profile_data):
-                        profiles.append(profile_data)
-
-                    # Start new profile
-                    current_profile = self._extract_profile_name(line)
-                    profile_data = self._create_profile_data(current_profile)
-
-                # Parse profile content
-                elif current_profile:
-                    profile_data = self._parse_line(line, profile_data)
-
-        # Save last profile
-        if current_profile and self._should_include_profile(profile_data):
-            profiles.append(profile_data)
-
-        return profiles
-
-    @staticmethod
-    def _is_section_header(line: str) -> bool:
-        """Check if line is a section header [...]."""
-        return line.startswith("[") and line.endswith("]")
+            text = f.read()
+
+        profile_data = None
+        # One clock reading per parse, so every expiry is judged against it
+        now = datetime.now(timezone.utc)
+
+        # Only headers, comments and relevant keys come back from the regex
+        for section, comment, key, value in self._line_re.findall(text):
+            # Parse profile content
+            if key:
+                if profile_data:
+                    self._parse_field(key, value, profile_data)
+            elif comment:
+                if profile_data:
+                    self._parse_comment(comment, profile_data, now)
+            else:
+                # Emit previous profile
+                if profile_data and self._should_include_profile(profile_data):
+                    yield profile_data
+
+                # Start new profile (an empty name starts none)
+                profile_name = self._extract_profile_name(section)
+                profile_data = self._create_profile_data(profile_name) if profile_name else None
+
+        # Emit last profile
+        if profile_data and self._should_include_profile(profile_data):
+            yield profile_data
 
     @abstractmethod
-    def _extract_profile_name(self, header: str) -> str:
-        """Extract profile name from header line."""
+    def _extract_profile_name(self, section: str) -> str:
+        """Extract profile name from the text between the header brackets."""
         pass
 
     @abstractmethod
@@ -124,10 +228,13 @@ class INIFileParser(ABC):
         pass
 
     @abstractmethod
-    def _parse_line(self, line: str, profile_data: Dict) -> Dict:
-        """Parse a line and update profile data."""
+    def _parse_field(self, key: str, value: str, profile_data: Dict) -> None:
+        """Update profile data from a key = value line."""
         pass
 
+    def _parse_comment(self, comment: str, profile_data: Dict, now: datetime) -> None:
+        """Update profile data from a # comment line, as of ``now``; ignored by default."""
+
     def _should_include_profile(self, profile_data: Dict) -> bool:
         """Determine if profile should be included in results."""
         return True
@@ -136,9 +243,11 @@ class INIFileParser(ABC):
 class CredentialsFileParser(INIFileParser):
     """Parser for ~/.aws/credentials file."""
 
-    def _extract_profile_name(self, header: str) -> str:
+    _line_re = _ini_line_re(_CREDENTIAL_KEYS)
+
+    def _extract_profile_name(self, section: str) -> str:
         """Extract profile name from [profile-name]."""
-        return header[1:-1]
+        return section
 
     def _create_profile_data(self, profile_name: str) -> Dict:
         """Create initial credentials profile data."""
@@ -149,47 +258,39 @@ class CredentialsFileParser(INIFileParser):
             "expired": False,
         }
 
-    def _parse_line(self, line: str, profile_data: Dict) -> Dict:
-        """Parse credentials file line."""
-        # Parse expiration comment
-        if line.startswith("#") and "Expires" in line:
-            expiration = self._parse_expiration(line)
+    def _parse_comment(self, comment: str, profile_data: Dict, now: datetime) -> None:
+        """Parse expiration comment."""
+        if "Expires" in comment:
+            expiration = self._parse_expiration(comment)
             if expiration:
-                log_operation(
-                    f"  → Found expiration: {expiration['expiration']} (expired={expiration['expired']})"
-                )
-                profile_data["expiration"] = expiration["expiration"]
-                profile_data["expired"] = expiration["expired"]
-
-        # Check for credentials
-        elif "=" in line:
-            key, value = line.split("=", 1)
-            key = key.strip()
-            if key in [
-                "aws_access_key_id",
-                "aws_secret_access_key",
-                "aws_session_token",
-            ]:
-                if not profile_data["has_credentials"]:
-                    log_operation(f"  → Found credential key: {key}")
-                profile_data["has_credentials"] = True
-
-        return profile_data
+                exp_time, exp_iso = expiration
+                expired = exp_time < now
+                if is_debug_enabled():
+                    log_operation(f"  → Found expiration: {exp_iso} (expired={expired})")
+                profile_data["expiration"] = exp_iso
+                profile_data["expired"] = expired
+
+    def _parse_field(self, key: str, value: str, profile_data: Dict) -> None:
+        """Check for credentials."""
+        if key in _CREDENTIAL_KEY_SET:
+            if not profile_data["has_credentials"] and is_debug_enabled():
+                log_operation(f"  → Found credential key: {key}")
+            profile_data["has_credentials"] = True
 
     @staticmethod
     @lru_cache(maxsize=128)
-    def _parse_expiration(comment: str) -> Optional[Dict]:
-        """Parse expiration timestamp from comment."""
-        # Format: # Expires 2024-11-10 15:30:00 UTC
-        match = re.search(r"Expires\s+(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})", comment)
+    def _parse_expiration(comment: str) -> Optional[Tuple[datetime, str]]:
+        """
+        Parse expiration timestamp from comment, as (time, ISO string).
+
+        Memoized per comment, so it must not depend on the clock; whether the
+        time has passed is decided by the caller.
+        """
+        match = _EXPIRES_RE.search(comment)
         if match:
             try:
-                exp_time = datetime.strptime(match.group(1), "%Y-%m-%d %H:%M:%S")
-                exp_time = exp_time.replace(tzinfo=timezone.utc)
-                return {
-                    "expiration": exp_time.isoformat(),
-                    "expired": exp_time < datetime.now(timezone.utc),
-                }
+                exp_time = datetime(*map(int, match.groups()), tzinfo=timezone.utc)
+                return exp_time, exp_time.isoformat()
             except ValueError:
                 pass
         return None
@@ -198,9 +299,11 @@ class CredentialsFileParser(INIFileParser):
 class ConfigFileParser(INIFileParser):
     """Parser for ~/.aws/config file."""
 
-    def _extract_profile_name(self, header: str) -> str:
+    _line_re = _ini_line_re(tuple(_CONFIG_FIELDS))
+
+    def _extract_profile_name(self, section: str) -> str:
         """Extract profile name from [profile name] or [default]."""
-        profile_name = header[1:-1]
+        profile_name = section
         # Strip 'profile ' prefix if present
         if profile_name.startswith("profile "):
             profile_name = profile_name[8:]
@@ -216,96 +319,91 @@ class ConfigFileParser(INIFileParser):
             "is_sso": False,
         }
 
-    def _parse_line(self, line: str, profile_data: Dict) -> Dict:
-        """Parse config file line."""
-        if "=" not in line:
-            return profile_data
-
-        key, value = line.split("=", 1)
-        key = key.strip()
-        value = value.strip()
-
-        # Parse SSO configuration
-        if key == "sso_start_url":
-            log_operation(f"  → Found SSO marker: sso_start_url = {value}")
+    def _parse_field(self, key: str, value: str, profile_data: Dict) -> None:
+        """Parse config file key = value line."""
+        field, marks_sso = _CONFIG_FIELDS[key]
+        if is_debug_enabled():
+            kind = "SSO marker" if marks_sso else "field"
+            log_operation(f"  → Found {kind}: {key} = {value}")
+        if marks_sso:
             profile_data["is_sso"] = True
-            profile_data["sso_start_url"] = value
-        elif key == "sso_session":
-            log_operation(f"  → Found SSO marker: sso_session = {value}")
-            profile_data["is_sso"] = True
-            profile_data["sso_session"] = value
-        elif key == "sso_region":
-            log_operation(f"  → Found SSO field: sso_region = {value}")
-            profile_data["sso_region"] = value
-        elif key == "sso_account_id":
-            log_operation(f"  → Found SSO field: sso_account_id = {value}")
-            profile_data["sso_account_id"] = value
-        elif key == "sso_role_name":
-            log_operation(f"  → Found SSO field: sso_role_name = {value}")
-            profile_data["sso_role_name"] = value
-        elif key == "region":
-            log_operation(f"  → Found region: {value}")
-            profile_data["aws_region"] = value
-
-        return profile_data
+        profile_data[field] = value
 
     def _should_include_profile(self, profile_data: Dict) -> bool:
         """Only include SSO profiles."""
         is_sso = profile_data.get("is_sso", False)
-        if is_sso:
-            log_result(f"  ✓ Including SSO profile: {profile_data['name']}")
-        else:
-            log_operation(f"  → Skipping non-SSO profile: {profile_data['name']}")
+        if is_debug_enabled():
+            if is_sso:
+                log_result(f"  ✓ Including SSO profile: {profile_data['name']}")
+            else:
+                log_operation(f"  → Skipping non-SSO profile: {profile_data['name']}")
         return is_sso
 
 
 class ProfileConfigReader:
     """Reads individual profile configuration from AWS files."""
 
-    def __init__(self, credentials_file: Path, config_file: Path):
+    def __init__(
+        self, credentials_file: Path, config_file: Path, cache: Optional[FileCache] = None
+    ):
         self.credentials_file = credentials_file
         self.config_file = config_file
+        # Holds {section: {key: value}} per file, so it must not be shared with
+        # the INIFileParsers, which cache profile lists under the same paths
+        self.cache = cache or FileCache()
+
+    def _sections(
+        self, file_path: Path, strip_prefix: bool
+    ) -> Optional[Dict[str, Dict[str, str]]]:
+        """
+        Every section of ``file_path`` as {name: {key: value}}, or None if the
+        file doesn't exist.
+
+        The file is scanned once and the index reused until its mtime changes,
+        so per-profile lookups no longer rescan the file for each profile.
+        """
+        return self.cache.get_or_compute(
+            file_path, lambda: self._index_file(file_path, strip_prefix)
+        )
+
+    @staticmethod
+    def _index_file(file_path: Path, strip_prefix: bool) -> Optional[Dict[str, Dict[str, str]]]:
+        """Scan ``file_path`` into {section: {key: value}}; None if it doesn't exist."""
+        if not file_path.exists():
+            return None
+
+        log_operation(f"Indexing {file_path.name}")
+        with open(file_path, "r", encoding="utf-8") as f:
+            text = f.read()
+
+        sections = {}
+        current = None
+        for section, comment, key, value in _ANY_KEY_LINE_RE.findall(text):
+            if key:
+                if current is not None:
+                    current[key] = value
+            elif not comment:
+                name = section
+                if strip_prefix and name.startswith("profile "):
+                    name = name[8:]
+                # Repeated sections merge, later keys winning, as in botocore
+                current = sections.setdefault(name, {})
+
+        return sections
 
     @timer()
     def get_credentials(self, profile_name: str) -> Optional[Dict[str, str]]:
         """Extract credentials for a specific profile."""
-        if not self.credentials_file.exists():
+        sections = self._sections(self.credentials_file, strip_prefix=False)
+        if sections is None:
             log_result(
                 f"Credentials file not found for profile: {profile_name}", success=False
             )
             return None
 
         log_operation(f"Reading credentials for profile: {profile_name}")
-        credentials = {}
-        in_profile = False
-
-        with open(self.credentials_file, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-
-                # Check if we're in the target profile
-                if line == f"[{profile_name}]":
-                    in_profile = True
-                    continue
-
-                # Check if we've moved to another profile
-                if line.startswith("[") and line.endswith("]"):
-                    if in_profile:
-                        break
-                    in_profile = False
-                    continue
-
-                # Parse credentials
-                if in_profile and "=" in line:
-                    key, value = line.split("=", 1)
-                    key = key.strip()
-                    value = value.strip()
-                    if key in [
-                        "aws_access_key_id",
-                        "aws_secret_access_key",
-                        "aws_session_token",
-                    ]:
-                        credentials[key] = value
+        section = sections.get(profile_name, {})
+        credentials = {key: section[key] for key in _CREDENTIAL_KEYS if key in section}
 
         if credentials:
             log_result(f"Found credentials for profile: {profile_name}")
@@ -319,47 +417,24 @@ class ProfileConfigReader:
     @timer()
     def get_config(self, profile_name: str) -> Optional[Dict[str, str]]:
         """Get profile configuration from config file."""
-        if not self.config_file.exists():
+        sections = self._sections(self.config_file, strip_prefix=True)
+        if sections is None:
             log_result(
                 f"Config file not found for profile: {profile_name}", success=False
             )
             return None
 
         log_operation(f"Reading config for profile: {profile_name}")
-        profile_config = {}
-        in_profile = False
-
-        with open(self.config_file, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-
-                # Check profile headers
-                if line.startswith("[") and line.endswith("]"):
-                    current = line[1:-1]
-                    if current.startswith("profile "):
-                        current = current[8:]
-
-                    if current == profile_name:
-                        in_profile = True
-                        log_operation(f"  → Found profile section [{current}]")
-                        continue
-                    elif in_profile:
-                        break
-                    in_profile = False
-                    continue
-
-                # Parse config
-                if in_profile and "=" in line:
-                    key, value = line.split("=", 1)
-                    key = key.strip()
-                    value = value.strip()
-                    profile_config[key] = value
+        # A copy, as callers may annotate the result
+        profile_config = dict(sections.get(profile_name, {}))
 
+        if profile_config:
+            if is_debug_enabled():
+                log_operation(f"  → Found profile section [{profile_name}]")
+                for key, value in profile_config.items():
                     # Log SSO-specific keys
                     if key.startswith("sso_"):
                         log_operation(f"    • {key} = {value}")
-
-        if profile_config:
             log_result(
                 f"Found config for profile: {profile_name} ({len(profile_config)} keys)"
             )
@@ -3,16 +3,14 @@
 Console URL Cache
 
 In-memory cache for AWS console URLs to prevent regeneration and tab logouts.
-Uses TinyDB with in-memory storage.
+Entries are kept in a dict keyed by profile name.
 """
 
+import threading
 import time
 from datetime import datetime
 from typing import Dict, Optional
 
-from tinydb import Query, TinyDB
-from tinydb.storages import MemoryStorage
-
 
 class ConsoleURLCache:
     """
@@ -31,7 +29,8 @@ class ConsoleURLCache:
         Args:
             default_ttl: Time-to-live in seconds (default: 12 hours)
         """
-        self.db = TinyDB(storage=MemoryStorage)
+        self._entries: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
         self.default_ttl = default_ttl
 
     def get(self, profile_name: str, current_expiry: Optional[datetime] = None) -> Optional[str]:
@@ -45,27 +44,24 @@ class ConsoleURLCache:
         Returns:
             Console URL if cached and valid, None otherwise
         """
-        Profile = Query()
-        result = self.db.search(Profile.name == profile_name)
-        
-        if not result:
-            return None
-            
-        entry = result[0]
-        
-        # Check if credentials changed (different expiry time)
-        if current_expiry and entry.get("credential_expiry"):
-            cached_expiry = datetime.fromisoformat(entry["credential_expiry"])
-            if cached_expiry != current_expiry:
-                self.db.remove(Profile.name == profile_name)
+        with self._lock:
+            entry = self._entries.get(profile_name)
+            if entry is None:
                 return None
-        
-        # Check if expired
-        if time.time() > entry["expires_at"]:
-            self.db.remove(Profile.name == profile_name)
-            return None
-            
-        return entry["url"]
+
+            # Check if credentials changed (different expiry time)
+            cached_expiry_ts = entry["credential_expiry_ts"]
+            if current_expiry and cached_expiry_ts is not None:
+                if cached_expiry_ts != current_expiry.timestamp():
+                    del self._entries[profile_name]
+                    return None
+
+            # Check if expired
+            if time.time() > entry["expires_at"]:
+                del self._entries[profile_name]
+                return None
+
+            return entry["url"]
 
     def set(self, profile_name: str, url: str, credential_expiry: Optional[datetime] = None) -> None:
         """
@@ -76,25 +72,22 @@ class ConsoleURLCache:
             url: Console URL to cache
             credential_expiry: Credential expiry time (if available)
         """
-        Profile = Query()
-        
         # Use credential expiry if available, otherwise use default TTL
         if credential_expiry:
             expires_at = credential_expiry.timestamp()
         else:
             expires_at = time.time() + self.default_ttl
         
-        # Upsert entry
-        self.db.upsert(
-            {
-                "name": profile_name,
-                "url": url,
-                "expires_at": expires_at,
-                "cached_at": time.time(),
-                "credential_expiry": credential_expiry.isoformat() if credential_expiry else None,
-            },
-            Profile.name == profile_name,
-        )
+        entry = {
+            "name": profile_name,
+            "url": url,
+            "expires_at": expires_at,
+            "cached_at": time.time(),
+            # A float, so lookups compare timestamps rather than parsing ISO strings
+            "credential_expiry_ts": credential_expiry.timestamp() if credential_expiry else None,
+        }
+        with self._lock:
+            self._entries[profile_name] = entry
 
     def invalidate(self, profile_name: str) -> None:
         """
@@ -103,23 +96,25 @@ class ConsoleURLCache:
         Args:
             profile_name: AWS profile name
         """
-        Profile = Query()
-        self.db.remove(Profile.name == profile_name)
+        with self._lock:
+            self._entries.pop(profile_name, None)
 
     def clear(self) -> None:
         """Clear all cached URLs."""
-        self.db.truncate()
+        with self._lock:
+            self._entries.clear()
 
     def get_stats(self) -> Dict[str, int]:
         """Get cache statistics."""
         now = time.time()
-        all_entries = self.db.all()
-        
-        valid = sum(1 for e in all_entries if e["expires_at"] > now)
-        expired = len(all_entries) - valid
-        
+        with self._lock:
+            expiries = [e["expires_at"] for e in self._entries.values()]
+
+        valid = sum(1 for expires_at in expiries if expires_at > now)
+        expired = len(expiries) - valid
+
         return {
-            "total": len(all_entries),
+            "total": len(expiries),
             "valid": valid,
             "expired": expired,
         }
@@ -15,13 +15,14 @@ async def validate_extension_origin(request: Request, call_next):
     if request.url.path == "/health":
         return await call_next(request)
 
-    origin = request.headers.get("origin", "")
-    if (
-        origin
-        and origin.startswith("moz-extension://")
-        and ALLOWED_EXTENSION_ID not in request.headers.get("user-agent", "")
+    headers = request.headers
+    origin = headers.get("origin", "")
+    # The user agent is only looked up for extension origins; an empty origin
+    # fails startswith on its own
+    if origin.startswith("moz-extension://") and ALLOWED_EXTENSION_ID not in headers.get(
+        "user-agent", ""
     ):
-        logger.warning(f"Unauthorized extension origin: {origin}")
+        logger.warning("Unauthorized extension origin: %s", origin)
         return JSONResponse(
             status_code=status.HTTP_403_FORBIDDEN,
             content={"detail": "Unauthorized extension origin"},
@@ -1,7 +1,7 @@
 """Request logging middleware."""
 
 import time
-import uuid
+import secrets
 import logging
 from fastapi import Request
 
@@ -9,22 +9,30 @@ logger = logging.getLogger(__name__)
 
 
 async def log_requests(request: Request, call_next):
-    """Log all requests with timing and request ID."""
-    request_id = uuid.uuid4().hex[:8]
-    start_time = time.time()
-
-    logger.info(f"[{request_id}] → {request.method} {request.url.path}")
+    """Log each request once, on completion, with timing and request ID."""
+    # 8 hex chars from 4 random bytes; perf_counter is monotonic and high resolution
+    request_id = secrets.token_hex(4)
+    start_time = time.perf_counter()
 
     try:
         response = await call_next(request)
-        duration_ms = (time.time() - start_time) * 1000
-
-        logger.info(f"[{request_id}] ← {response.status_code} ({duration_ms:.2f}ms)")
-
-        response.headers["X-Request-ID"] = request_id
-        return response
-
     except Exception as e:
-        duration_ms = (time.time() - start_time) * 1000
-        logger.exception(f"[{request_id}] ! Error after {duration_ms:.2f}ms: {e}")
+        duration_ms = (time.perf_counter() - start_time) * 1000
+        logger.exception("[%s] ! Error after %.2fms: %s", request_id, duration_ms, e)
         raise
+
+    duration_ms = (time.perf_counter() - start_time) * 1000
+
+    # One record per request, formatted only if INFO is emitted
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "[%s] %s %s → %d (%.2fms)",
+            request_id,
+            request.method,
+            request.url.path,
+            response.status_code,
+            duration_ms,
+        )
+
+    response.headers["X-Request-ID"] = request_id
+    return response
@@ -318,6 +318,11 @@ def set_debug_enabled(enabled: bool, log_file: Optional[Path] = None):
         _logger.enabled = enabled
 
 
+def is_debug_enabled() -> bool:
+    """Whether debug logging is on; lets hot paths skip building log messages."""
+    return get_logger().enabled
+
+
 def get_log_file_path() -> Optional[Path]:
     """Get the current log file path."""
     logger = get_logger()
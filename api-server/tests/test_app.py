@@ -1,12 +1,16 @@
 """Test suite for API server - Python 3.12+"""
 
 from collections.abc import AsyncGenerator
+from unittest.mock import Mock, patch
+
 import pytest
-from httpx import AsyncClient, ASGITransport
 from fastapi import status
-from unittest.mock import Mock, patch
+from httpx import ASGITransport, AsyncClient
+from starlette.routing import Route
 
+from aws_profile_bridge.api.health_interceptor import HealthCheckInterceptor
 from aws_profile_bridge.app import create_app
+from aws_profile_bridge.core.bridge import AWSProfileBridge
 
 # Configure pytest-asyncio
 pytest_plugins = ("pytest_asyncio",)
@@ -17,9 +21,13 @@ pytest_plugins = ("pytest_asyncio",)
 async def client() -> AsyncGenerator[AsyncClient, None]:
     """Create test client for API."""
     # Mock authenticator to bypass auth in tests
-    with patch("aws_profile_bridge.api.profiles.authenticator") as mock_auth:
+    # Lifespan does not run under ASGITransport, so wire the bridge here
+    with (
+        patch("aws_profile_bridge.api.profiles.authenticator") as mock_auth,
+        patch("aws_profile_bridge.api.profiles.bridge", AWSProfileBridge()),
+    ):
         mock_auth.authenticate.return_value = None
-        app = create_app()
+        app = HealthCheckInterceptor(create_app())
         transport = ASGITransport(app=app)
         async with AsyncClient(transport=transport, base_url="http://test") as ac:
             yield ac
@@ -86,6 +94,24 @@ async def test_uptime_in_health(client: AsyncClient) -> None:
     assert data["uptime_seconds"] >= 0
 
 
+@pytest.mark.asyncio
+async def test_health_rejects_non_get(client: AsyncClient) -> None:
+    """Test health interceptor answers other methods with 405."""
+    response = await client.post("/health")
+
+    assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
+    assert response.headers["allow"] == "GET"
+
+
+@pytest.mark.asyncio
+async def test_health_bypasses_middleware(client: AsyncClient) -> None:
+    """Test health is answered before the logging middleware runs."""
+    response = await client.get("/health")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert "x-request-id" not in response.headers
+
+
 @pytest.mark.asyncio
 async def test_authentication_required(client: AsyncClient) -> None:
     """Test that endpoints require authentication."""
@@ -161,15 +187,125 @@ async def test_options_requests(client: AsyncClient) -> None:
     response = await client.options("/profiles/test-profile/console-url")
     assert response.status_code == status.HTTP_200_OK
 
+    response = await client.options("/regions")
+    assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.asyncio
+async def test_preflight_cors_headers(client: AsyncClient) -> None:
+    """Test preflights are answered with CORS headers without authentication."""
+    with patch("aws_profile_bridge.api.profiles.authenticator") as mock_auth:
+        response = await client.options(
+            "/profiles",
+            headers={
+                "Origin": "moz-extension://abc",
+                "Access-Control-Request-Method": "POST",
+            },
+        )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["access-control-allow-origin"] == "*"
+    assert "X-API-Token" in response.headers["access-control-allow-headers"]
+    assert response.headers["access-control-max-age"] == "86400"
+    mock_auth.authenticate.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_health_and_version_cors_headers(client: AsyncClient) -> None:
+    """Test cross-origin GETs to /health and /version get Access-Control-Allow-Origin."""
+    for path in ("/health", "/version"):
+        response = await client.get(path, headers={"Origin": "moz-extension://abc"})
+        assert response.headers["access-control-allow-origin"] == "*"
+
+        response = await client.get(path)
+        assert "access-control-allow-origin" not in response.headers
+
+
+def test_health_cors_echoes_allowed_origin() -> None:
+    """Test an allow-listed origin is echoed and others get no CORS header."""
+    with patch("aws_profile_bridge.config.settings.CORS_ORIGINS", ["moz-extension://abc"]):
+        interceptor = HealthCheckInterceptor(None)
+
+    allowed = dict(interceptor._cors_for({"headers": [(b"origin", b"moz-extension://abc")]}))
+    assert allowed[b"access-control-allow-origin"] == b"moz-extension://abc"
+    assert allowed[b"vary"] == b"Origin"
+    assert interceptor._cors_for({"headers": [(b"origin", b"https://evil.example")]}) == []
+
+
+@pytest.mark.asyncio
+async def test_non_preflight_options_reaches_app(client: AsyncClient) -> None:
+    """Test OPTIONS without preflight headers is routed by the app, not the interceptor."""
+    response = await client.options("/profiles", headers={"Origin": "moz-extension://abc"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert "access-control-max-age" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_options_unknown_path_is_not_found(client: AsyncClient) -> None:
+    """Test OPTIONS on a path the app does not route gets the app's 404."""
+    response = await client.options("/no-such-route")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_preflight_passes_through_unless_routed_and_allowed() -> None:
+    """Test preflights for unknown paths or disallowed origins are left to the app."""
+    inner = Mock(routes=[Route("/profiles", Mock(), methods=["POST"])])
+    forwarded = []
+
+    async def app(scope, receive, send):
+        forwarded.append(scope["path"])
+
+    with patch("aws_profile_bridge.config.settings.CORS_ORIGINS", ["moz-extension://abc"]):
+        interceptor = HealthCheckInterceptor(inner)
+    interceptor.app = app
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    def preflight(path: str, origin: bytes) -> dict:
+        headers = [(b"origin", origin), (b"access-control-request-method", b"POST")]
+        return {"type": "http", "method": "OPTIONS", "path": path, "headers": headers}
+
+    await interceptor(preflight("/unknown", b"moz-extension://abc"), None, send)
+    await interceptor(preflight("/profiles", b"https://evil.example"), None, send)
+    assert forwarded == ["/unknown", "/profiles"]
+    assert sent == []
+
+    await interceptor(preflight("/profiles", b"moz-extension://abc"), None, send)
+    assert forwarded == ["/unknown", "/profiles"]
+    assert sent[0]["status"] == 200
+
+
+def test_preflight_origin_regex() -> None:
+    """Test preflights echo origins matching CORS_ORIGIN_REGEX."""
+    with (
+        patch("aws_profile_bridge.config.settings.CORS_ORIGINS", ["http://localhost:3000"]),
+        patch("aws_profile_bridge.config.settings.CORS_ORIGIN_REGEX", r"moz-extension://[\w-]+"),
+    ):
+        interceptor = HealthCheckInterceptor(None)
+
+    def allow_origin(origin: bytes) -> bytes | None:
+        headers = dict(interceptor._preflight_for({"headers": [(b"origin", origin)]}))
+        return headers.get(b"access-control-allow-origin")
+
+    assert allow_origin(b"moz-extension://abc-123") == b"moz-extension://abc-123"
+    assert allow_origin(b"http://localhost:3000") == b"http://localhost:3000"
+    assert allow_origin(b"moz-extension://abc/evil") is None
+    assert allow_origin(b"https://example.com") is None
+
 
 @pytest.mark.asyncio
 async def test_profile_list_timeout(client: AsyncClient) -> None:
     """Test timeout handling for profile list."""
     with patch("aws_profile_bridge.api.profiles.authenticator") as mock_auth:
         mock_auth.authenticate.return_value = None
-        with patch("aws_profile_bridge.api.profiles.asyncio.wait_for") as mock_wait:
-            import asyncio
-            mock_wait.side_effect = asyncio.TimeoutError()
+        with patch("aws_profile_bridge.api.profiles.bridge") as mock_bridge:
+            mock_bridge.message_handler._handle_get_profiles.side_effect = TimeoutError()
             response = await client.post("/profiles", headers={"X-API-Token": "test-token"})
 
     assert response.status_code == status.HTTP_200_OK
@@ -183,8 +319,8 @@ async def test_profile_list_exception(client: AsyncClient) -> None:
     """Test exception handling for profile list."""
     with patch("aws_profile_bridge.api.profiles.authenticator") as mock_auth:
         mock_auth.authenticate.return_value = None
-        with patch("aws_profile_bridge.api.profiles.AWSProfileBridge") as mock_bridge:
-            mock_bridge.side_effect = Exception("Test error")
+        with patch("aws_profile_bridge.api.profiles.bridge") as mock_bridge:
+            mock_bridge.message_handler._handle_get_profiles.side_effect = Exception("Test error")
             response = await client.post("/profiles", headers={"X-API-Token": "test-token"})
 
     assert response.status_code == status.HTTP_200_OK
@@ -198,9 +334,8 @@ async def test_enrich_timeout(client: AsyncClient) -> None:
     """Test timeout handling for profile enrichment."""
     with patch("aws_profile_bridge.api.profiles.authenticator") as mock_auth:
         mock_auth.authenticate.return_value = None
-        with patch("aws_profile_bridge.api.profiles.asyncio.wait_for") as mock_wait:
-            import asyncio
-            mock_wait.side_effect = asyncio.TimeoutError()
+        with patch("aws_profile_bridge.api.profiles.bridge") as mock_bridge:
+            mock_bridge.message_handler._handle_enrich_sso_profiles.side_effect = TimeoutError()
             response = await client.post("/profiles/enrich", headers={"X-API-Token": "test-token"})
 
     assert response.status_code == status.HTTP_200_OK
@@ -214,8 +349,9 @@ async def test_enrich_exception(client: AsyncClient) -> None:
     """Test exception handling for profile enrichment."""
     with patch("aws_profile_bridge.api.profiles.authenticator") as mock_auth:
         mock_auth.authenticate.return_value = None
-        with patch("aws_profile_bridge.api.profiles.AWSProfileBridge") as mock_bridge:
-            mock_bridge.side_effect = Exception("Test error")
+        with patch("aws_profile_bridge.api.profiles.bridge") as mock_bridge:
+            handler = mock_bridge.message_handler
+            handler._handle_enrich_sso_profiles.side_effect = Exception("Test error")
             response = await client.post("/profiles/enrich", headers={"X-API-Token": "test-token"})
 
     assert response.status_code == status.HTTP_200_OK
@@ -229,10 +365,11 @@ async def test_console_url_timeout(client: AsyncClient) -> None:
     """Test timeout handling for console URL generation."""
     with patch("aws_profile_bridge.api.profiles.authenticator") as mock_auth:
         mock_auth.authenticate.return_value = None
-        with patch("aws_profile_bridge.api.profiles.asyncio.wait_for") as mock_wait:
-            import asyncio
-            mock_wait.side_effect = asyncio.TimeoutError()
-            response = await client.post("/profiles/test-profile/console-url", headers={"X-API-Token": "test-token"})
+        with patch("aws_profile_bridge.api.profiles.bridge") as mock_bridge:
+            mock_bridge.message_handler._handle_open_profile.side_effect = TimeoutError()
+            response = await client.post(
+                "/profiles/test-profile/console-url", headers={"X-API-Token": "test-token"}
+            )
 
     assert response.status_code == status.HTTP_200_OK
     data = response.json()
@@ -245,9 +382,11 @@ async def test_console_url_exception(client: AsyncClient) -> None:
     """Test exception handling for console URL generation."""
     with patch("aws_profile_bridge.api.profiles.authenticator") as mock_auth:
         mock_auth.authenticate.return_value = None
-        with patch("aws_profile_bridge.api.profiles.AWSProfileBridge") as mock_bridge:
-            mock_bridge.side_effect = Exception("Test error")
-            response = await client.post("/profiles/test-profile/console-url", headers={"X-API-Token": "test-token"})
+        with patch("aws_profile_bridge.api.profiles.bridge") as mock_bridge:
+            mock_bridge.message_handler._handle_open_profile.side_effect = Exception("Test error")
+            response = await client.post(
+                "/profiles/test-profile/console-url", headers={"X-API-Token": "test-token"}
+            )
 
     assert response.status_code == status.HTTP_200_OK
     data = response.json()
@@ -258,9 +397,155 @@ async def test_console_url_exception(client: AsyncClient) -> None:
 @pytest.mark.asyncio
 async def test_set_authenticator() -> None:
     """Test authenticator can be set."""
-    from aws_profile_bridge.api import profiles
     from unittest.mock import Mock
 
+    from aws_profile_bridge.api import profiles
+
     mock_authenticator = Mock()
     profiles.set_authenticator(mock_authenticator)
     assert profiles.authenticator is mock_authenticator
+
+
+@pytest.mark.asyncio
+async def test_set_executors() -> None:
+    """Test fast and slow executors can be set."""
+    from aws_profile_bridge.api import profiles
+
+    fast, slow = Mock(), Mock()
+    with (
+        patch.object(profiles, "fast_executor", None),
+        patch.object(profiles, "slow_executor", None),
+    ):
+        profiles.set_executors(fast, slow)
+        assert profiles.fast_executor is fast
+        assert profiles.slow_executor is slow
+
+
+@pytest.mark.asyncio
+async def test_set_bridge() -> None:
+    """Test shared bridge can be set."""
+    from aws_profile_bridge.api import profiles
+
+    mock_bridge = Mock()
+    with patch.object(profiles, "bridge", None):
+        profiles.set_bridge(mock_bridge)
+        assert profiles.bridge is mock_bridge
+
+
+@pytest.mark.asyncio
+async def test_console_url_invalid_profile_name(client: AsyncClient) -> None:
+    """Test validation errors are not swallowed by the timed handler."""
+    with patch("aws_profile_bridge.api.profiles.authenticator") as mock_auth:
+        mock_auth.authenticate.return_value = None
+        response = await client.post(
+            "/profiles/bad;name/console-url", headers={"X-API-Token": "test-token"}
+        )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_cached_time_formatter_reuses_timestamp_within_second() -> None:
+    """Test asctime is rendered once per second and refreshed after."""
+    import logging
+
+    from aws_profile_bridge.app import CachedTimeFormatter
+
+    formatter = CachedTimeFormatter(fmt="{asctime}", style="{", datefmt="%Y-%m-%d %H:%M:%S")
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, "msg", (), None)
+
+    with patch("logging.Formatter.formatTime", return_value="first") as format_time:
+        record.created = 100.1
+        assert formatter.format(record) == "first"
+        record.created = 100.9
+        assert formatter.format(record) == "first"
+        assert format_time.call_count == 1
+
+        format_time.return_value = "second"
+        record.created = 101.0
+        assert formatter.format(record) == "second"
+        assert format_time.call_count == 2
+
+
+def test_signal_ready_writes_to_inherited_pipe(monkeypatch) -> None:
+    """Test startup readiness is reported on the fd named in the environment."""
+    import os
+
+    from aws_profile_bridge.app import signal_ready
+    from aws_profile_bridge.config import settings
+
+    read_fd, write_fd = os.pipe()
+    monkeypatch.setenv(settings.SERVER_READY_FD_ENV, str(write_fd))
+    try:
+        signal_ready()
+        assert os.read(read_fd, 1) == b"1"
+        assert settings.SERVER_READY_FD_ENV not in os.environ
+    finally:
+        os.close(read_fd)
+
+
+def test_serve_signals_ready_only_after_listening(monkeypatch) -> None:
+    """Test readiness is signalled after uvicorn binds, and not when binding fails."""
+    import socket
+
+    import uvicorn
+
+    from aws_profile_bridge import app as app_module
+
+    signalled = []
+    monkeypatch.setattr(app_module, "signal_ready", lambda: signalled.append(True))
+
+    async def noop_app(scope, receive, send):
+        pass
+
+    def config(port: int) -> uvicorn.Config:
+        return uvicorn.Config(
+            noop_app, host="127.0.0.1", port=port, lifespan="off", log_level="critical"
+        )
+
+    with socket.socket() as busy:
+        busy.bind(("127.0.0.1", 0))
+        busy.listen()
+        with pytest.raises(SystemExit):
+            app_module._serve(config(busy.getsockname()[1]))
+    assert signalled == []
+
+    original_main_loop = uvicorn.Server.main_loop
+
+    async def stop_immediately(self):
+        self.should_exit = True
+        await original_main_loop(self)
+
+    monkeypatch.setattr(uvicorn.Server, "main_loop", stop_immediately)
+    app_module._serve(config(0))
+    assert signalled == [True]
+
+
+@pytest.mark.asyncio
+async def test_lifespan_can_run_twice(monkeypatch, tmp_path) -> None:
+    """Test a second lifespan cycle restarts the log listener instead of crashing."""
+    import asyncio
+
+    from aws_profile_bridge import app as app_module
+    from aws_profile_bridge.api import profiles, regions
+    from aws_profile_bridge.config import settings
+
+    async def no_refresh():
+        pass
+
+    # Lifespan rewires these module globals; restore them for later tests
+    for name in ("authenticator", "bridge", "fast_executor", "slow_executor"):
+        monkeypatch.setattr(profiles, name, getattr(profiles, name))
+    monkeypatch.setattr(regions, "authenticator", regions.authenticator)
+    monkeypatch.setattr(regions, "regions_cache", regions.regions_cache)
+
+    monkeypatch.setattr(settings, "CONFIG_FILE", tmp_path / "config.json")
+    monkeypatch.setattr(settings, "REGIONS_CACHE_FILE", tmp_path / "regions.json")
+    monkeypatch.setattr(regions, "refresh_regions_loop", no_refresh)
+    monkeypatch.setattr(asyncio.get_running_loop(), "add_signal_handler", lambda *args: None)
+
+    for _ in range(2):
+        async with app_module.lifespan(app_module.fastapi_app):
+            assert app_module.log_listener._thread is not None
+        assert app_module.log_listener._thread is None
+
+    app_module.start_log_listener()
@@ -3,6 +3,10 @@
 Unit tests for credentials module.
 """
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from unittest.mock import Mock, patch
 from pathlib import Path
@@ -66,6 +70,44 @@ class TestCredentialProvider:
         assert result is not None
         assert result["aws_access_key_id"] == "SSO_KEY"
 
+    def test_iter_profiles_with_creds_parses_file_once(self, tmp_path):
+        """Test static credentials come from one parse and others fall back."""
+        creds_file = tmp_path / "credentials"
+        creds_file.write_text(
+            "[static]\naws_access_key_id = KEY\naws_secret_access_key = SECRET\n"
+            "[empty]\nregion = us-east-1\n"
+        )
+
+        provider = CredentialProvider(creds_file, tmp_path / "config", Mock(), Mock())
+
+        with patch.object(provider, "get_credentials", return_value=None) as mock_get:
+            result = dict(provider.iter_profiles_with_creds(["static", "empty"]))
+
+        assert result["static"] == {"aws_access_key_id": "KEY", "aws_secret_access_key": "SECRET"}
+        assert result["empty"] is None
+        mock_get.assert_called_once_with("empty")
+
+    def test_get_all_credentials(self, tmp_path):
+        """Test all static credentials are returned by profile name."""
+        creds_file = tmp_path / "credentials"
+        creds_file.write_text(
+            "[a]\naws_access_key_id = A\naws_secret_access_key = SA\n"
+            "[b]\naws_access_key_id = B\naws_secret_access_key = SB\naws_session_token = T\n"
+        )
+
+        provider = CredentialProvider(creds_file, tmp_path / "config", Mock(), Mock())
+
+        result = provider.get_all_credentials()
+
+        assert set(result) == {"a", "b"}
+        assert result["b"]["aws_session_token"] == "T"
+
+    def test_get_all_credentials_missing_file(self, tmp_path):
+        """Test a missing credentials file yields no credentials."""
+        provider = CredentialProvider(tmp_path / "missing", tmp_path / "config", Mock(), Mock())
+
+        assert provider.get_all_credentials() == {}
+
 
 class TestCredentialProviderBoto3:
     """Test CredentialProvider with boto3."""
@@ -120,6 +162,56 @@ class TestCredentialProviderBoto3:
         assert result is not None
         assert "aws_session_token" not in result
 
+    @patch("aws_profile_bridge.core.credentials.BOTO3_AVAILABLE", True)
+    @patch("aws_profile_bridge.core.credentials.boto3")
+    def test_get_credentials_reuses_session_per_profile(self, mock_boto3, tmp_path):
+        """Test the boto3 Session is reused per profile until the files change."""
+        mock_credentials = Mock(access_key="KEY", secret_key="SECRET", token=None)
+        mock_boto3.Session.return_value.get_credentials.return_value = mock_credentials
+
+        credentials_file = tmp_path / "credentials"
+        credentials_file.write_text("[a]\n")
+        provider = CredentialProvider(credentials_file, tmp_path / "config", Mock(), Mock())
+
+        provider.get_credentials("a")
+        provider.get_credentials("a")
+        provider.get_credentials("b")
+        assert mock_boto3.Session.call_count == 2
+
+        credentials_file.write_text("[a]\naws_access_key_id = NEW\n")
+        provider.get_credentials("a")
+        assert mock_boto3.Session.call_count == 3
+
+    @patch("aws_profile_bridge.core.credentials.BOTO3_AVAILABLE", True)
+    @patch("aws_profile_bridge.core.credentials.boto3")
+    def test_get_credentials_serializes_session_use_per_profile(self, mock_boto3, tmp_path):
+        """Test one profile's Session is never used by two threads at once."""
+        active = 0
+        overlapped = False
+        guard = threading.Lock()
+
+        def get_credentials():
+            nonlocal active, overlapped
+            with guard:
+                active += 1
+                overlapped |= active > 1
+            time.sleep(0.01)
+            with guard:
+                active -= 1
+            return Mock(access_key="KEY", secret_key="SECRET", token=None)
+
+        mock_boto3.Session.return_value.get_credentials.side_effect = get_credentials
+        provider = CredentialProvider(
+            tmp_path / "credentials", tmp_path / "config", Mock(), Mock()
+        )
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(provider.get_credentials, ["a"] * 8))
+
+        assert all(r["aws_access_key_id"] == "KEY" for r in results)
+        assert not overlapped
+        assert mock_boto3.Session.call_count == 1
+
     @patch("aws_profile_bridge.core.credentials.BOTO3_AVAILABLE", True)
     @patch("aws_profile_bridge.core.credentials.boto3")
     def test_get_credentials_boto3_fails_fallback(self, mock_boto3):
@@ -144,6 +236,29 @@ class TestCredentialProviderBoto3:
         assert result is not None
         assert result["aws_access_key_id"] == "FALLBACK_KEY"
 
+    @patch("aws_profile_bridge.core.credentials.log_error")
+    @patch("aws_profile_bridge.core.credentials.BOTO3_AVAILABLE", True)
+    @patch("aws_profile_bridge.core.credentials.boto3")
+    def test_get_credentials_profile_not_found_falls_back_quietly(self, mock_boto3, mock_log_error):
+        """Test an unknown profile falls back without logging, unlike unexpected errors."""
+        from botocore.exceptions import ProfileNotFound
+
+        mock_boto3.Session.side_effect = ProfileNotFound(profile="test-profile")
+        mock_config_reader = Mock()
+        mock_config_reader.get_credentials.return_value = None
+        mock_config_reader.get_config.return_value = None
+
+        provider = CredentialProvider(
+            Path("/fake/credentials"), Path("/fake/config"), Mock(), mock_config_reader
+        )
+
+        assert provider.get_credentials("test-profile") is None
+        mock_log_error.assert_not_called()
+
+        mock_boto3.Session.side_effect = RuntimeError("Boto3 error")
+        provider.get_credentials("test-profile")
+        mock_log_error.assert_called_once()
+
 
 class TestProfileAggregator:
     """Test ProfileAggregator class."""
@@ -159,6 +274,25 @@ class TestProfileAggregator:
 
         assert aggregator._should_skip_sso_profiles() is True
 
+    @patch("aws_profile_bridge.core.credentials.time.monotonic")
+    def test_should_skip_sso_profiles_reuses_recent_check(self, mock_monotonic):
+        """Test the .nosso check is reused within NOSSO_CHECK_TTL."""
+        mock_aws_dir = Mock(spec=Path)
+        mock_nosso_file = Mock(spec=Path)
+        mock_nosso_file.exists.return_value = False
+        mock_aws_dir.__truediv__ = Mock(return_value=mock_nosso_file)
+
+        aggregator = ProfileAggregator(Mock(), Mock(), Mock(), Mock(), mock_aws_dir)
+
+        mock_monotonic.return_value = 100.0
+        assert aggregator._should_skip_sso_profiles() is False
+        mock_nosso_file.exists.return_value = True
+        mock_monotonic.return_value = 100.5
+        assert aggregator._should_skip_sso_profiles() is False
+        mock_monotonic.return_value = 101.5
+        assert aggregator._should_skip_sso_profiles() is True
+        assert mock_nosso_file.exists.call_count == 2
+
     def test_should_not_skip_sso_profiles_when_nosso_missing(self):
         """Test that SSO profiles are not skipped when .nosso file is missing."""
         mock_aws_dir = Mock(spec=Path)
@@ -304,6 +438,96 @@ class TestProfileAggregator:
         assert len(result) == 1
         assert result[0]["name"] == "profile1"
 
+    @patch("aws_profile_bridge.core.credentials.BOTO3_AVAILABLE", True)
+    @patch("aws_profile_bridge.core.credentials.boto3")
+    def test_get_profiles_with_boto3_parses_credentials_once(self, mock_boto3):
+        """Test the credentials file is indexed once for all profiles."""
+        mock_session = Mock()
+        mock_session.available_profiles = ["profile1", "profile2", "profile3"]
+        mock_boto3.Session.return_value = mock_session
+
+        mock_cred_parser = Mock()
+        mock_cred_parser.parse.return_value = [
+            {"name": "profile1", "has_credentials": True},
+            {"name": "profile2", "has_credentials": True},
+        ]
+
+        mock_config_reader = Mock()
+        mock_config_reader.get_config.return_value = None
+
+        mock_aws_dir = Mock(spec=Path)
+        mock_nosso_file = Mock(spec=Path)
+        mock_nosso_file.exists.return_value = False
+        mock_aws_dir.__truediv__ = Mock(return_value=mock_nosso_file)
+
+        aggregator = ProfileAggregator(
+            mock_cred_parser,
+            Mock(),
+            Mock(),
+            mock_config_reader,
+            mock_aws_dir,
+        )
+
+        result = aggregator._get_profiles_with_boto3()
+
+        assert [p["has_credentials"] for p in result] == [True, True, False]
+        mock_cred_parser.parse.assert_called_once()
+
+    @patch("aws_profile_bridge.core.credentials.BOTO3_AVAILABLE", True)
+    @patch("aws_profile_bridge.core.credentials.boto3")
+    def test_get_profiles_with_boto3_sso_only_skips_credentials(self, mock_boto3):
+        """Test an all-SSO inventory never parses the credentials file."""
+        mock_session = Mock()
+        mock_session.available_profiles = ["sso1", "sso2"]
+        mock_boto3.Session.return_value = mock_session
+
+        mock_config_reader = Mock()
+        mock_config_reader.get_config.return_value = {
+            "sso_start_url": "https://example.com/start"
+        }
+
+        mock_aws_dir = Mock(spec=Path)
+        mock_nosso_file = Mock(spec=Path)
+        mock_nosso_file.exists.return_value = False
+        mock_aws_dir.__truediv__ = Mock(return_value=mock_nosso_file)
+
+        mock_cred_parser = Mock()
+
+        aggregator = ProfileAggregator(
+            mock_cred_parser,
+            Mock(),
+            Mock(),
+            mock_config_reader,
+            mock_aws_dir,
+        )
+
+        result = aggregator._get_profiles_with_boto3()
+
+        assert [p["is_sso"] for p in result] == [True, True]
+        mock_cred_parser.parse.assert_not_called()
+
+    @patch("aws_profile_bridge.core.credentials.boto3")
+    def test_available_profiles_cached_until_files_change(self, mock_boto3, tmp_path):
+        """Test boto3's profile list is reused until an AWS file changes."""
+        mock_boto3.Session.return_value.available_profiles = ["profile1"]
+
+        config_file = tmp_path / "config"
+        config_file.write_text("[profile profile1]\n")
+        mock_cred_parser = Mock(file_path=tmp_path / "credentials")
+        mock_config_parser = Mock(file_path=config_file)
+
+        aggregator = ProfileAggregator(
+            mock_cred_parser, mock_config_parser, Mock(), Mock(), tmp_path
+        )
+
+        assert aggregator._available_profiles() == ["profile1"]
+        assert aggregator._available_profiles() == ["profile1"]
+        assert mock_boto3.Session.call_count == 1
+
+        config_file.write_text("[profile profile1]\n[profile profile2]\n")
+        aggregator._available_profiles()
+        assert mock_boto3.Session.call_count == 2
+
     def test_build_profile_info_sso_profile(self):
         """Test building profile info for SSO profile."""
         mock_config_reader = Mock()
@@ -573,6 +797,40 @@ class TestProfileAggregator:
         assert len(result) == 1
         assert result[0]["name"] == "profile1"
 
+    @patch("aws_profile_bridge.core.credentials.BOTO3_AVAILABLE", True)
+    @patch("aws_profile_bridge.core.credentials.boto3")
+    def test_get_all_profiles_checks_nosso_once(self, mock_boto3):
+        """Test ~/.aws/.nosso is checked once, not once per SSO profile."""
+        mock_session = Mock()
+        mock_session.available_profiles = ["sso1", "sso2", "sso3"]
+        mock_boto3.Session.return_value = mock_session
+
+        mock_config_reader = Mock()
+        mock_config_reader.get_config.return_value = {
+            "sso_start_url": "https://example.com/start"
+        }
+
+        mock_aws_dir = Mock(spec=Path)
+        mock_nosso_file = Mock(spec=Path)
+        mock_nosso_file.exists.return_value = True
+        mock_aws_dir.__truediv__ = Mock(return_value=mock_nosso_file)
+
+        mock_cred_parser = Mock()
+        mock_cred_parser.parse.return_value = []
+
+        aggregator = ProfileAggregator(
+            mock_cred_parser,
+            Mock(),
+            Mock(),
+            mock_config_reader,
+            mock_aws_dir,
+        )
+
+        result = aggregator.get_all_profiles()
+
+        assert result == []
+        mock_nosso_file.exists.assert_called_once()
+
     def test_build_profile_info_no_credentials_in_file(self):
         """Test building profile when credentials file has no actual credentials."""
         mock_config_reader = Mock()
@@ -9,6 +9,12 @@ from fastapi.responses import Response
 from aws_profile_bridge.middleware.logging import log_requests
 
 
+def _rendered(call):
+    """The message a mocked logger call would have emitted."""
+    fmt, *args = call[0]
+    return fmt % tuple(args)
+
+
 class TestLoggingMiddleware:
     """Test request logging middleware."""
 
@@ -31,18 +37,14 @@ class TestLoggingMiddleware:
             # Verify response is returned
             assert result is response
 
-            # Verify logging calls
-            assert mock_logger.info.call_count == 2
+            # Verify a single log record per request
+            assert mock_logger.info.call_count == 1
 
-            # Check request log
-            first_call = mock_logger.info.call_args_list[0][0][0]
-            assert "GET" in first_call
-            assert "/profiles" in first_call
-
-            # Check response log
-            second_call = mock_logger.info.call_args_list[1][0][0]
-            assert "200" in second_call
-            assert "ms" in second_call
+            message = _rendered(mock_logger.info.call_args)
+            assert "GET" in message
+            assert "/profiles" in message
+            assert "200" in message
+            assert "ms" in message
 
     @pytest.mark.asyncio
     async def test_log_requests_adds_request_id_header(self):
@@ -78,8 +80,7 @@ class TestLoggingMiddleware:
                 await log_requests(request, call_next)
 
                 # Verify method is in log
-                first_call = mock_logger.info.call_args_list[0][0][0]
-                assert method in first_call
+                assert method in _rendered(mock_logger.info.call_args)
 
     @pytest.mark.asyncio
     async def test_log_requests_different_status_codes(self):
@@ -98,8 +99,7 @@ class TestLoggingMiddleware:
                 await log_requests(request, call_next)
 
                 # Verify status code is in log
-                second_call = mock_logger.info.call_args_list[1][0][0]
-                assert str(status_code) in second_call
+                assert str(status_code) in _rendered(mock_logger.info.call_args)
 
     @pytest.mark.asyncio
     async def test_log_requests_exception_handling(self):
@@ -119,7 +119,7 @@ class TestLoggingMiddleware:
 
             # Verify exception was logged
             mock_logger.exception.assert_called_once()
-            exception_call = mock_logger.exception.call_args[0][0]
+            exception_call = _rendered(mock_logger.exception.call_args)
             assert "Error" in exception_call
             assert "ms" in exception_call
 
@@ -142,3 +142,19 @@ class TestLoggingMiddleware:
 
         # All request IDs should be unique
         assert len(request_ids) == 10
+
+    @pytest.mark.asyncio
+    async def test_log_requests_skips_formatting_when_info_disabled(self):
+        """Test nothing is logged when INFO is disabled."""
+        request = Mock(spec=Request)
+        request.method = "GET"
+        request.url.path = "/test"
+
+        call_next = AsyncMock(return_value=Response(status_code=200))
+
+        with patch("aws_profile_bridge.middleware.logging.logger") as mock_logger:
+            mock_logger.isEnabledFor.return_value = False
+            result = await log_requests(request, call_next)
+
+            mock_logger.info.assert_not_called()
+            assert "X-Request-ID" in result.headers
@@ -65,6 +65,22 @@ class TestKeywordMetadataRule:
         assert rule.matches("Prod-Account") is True
         assert rule.matches("prod-account") is True
 
+    def test_matches_keywords_literally(self):
+        """Test keywords are matched as plain text, and no keywords match nothing."""
+        rule = KeywordMetadataRule(["a.b", "c+"], "red", "briefcase")
+
+        assert rule.matches("x-a.b-y") is True
+        assert rule.matches("c+-account") is True
+        assert rule.matches("axb") is False
+        assert KeywordMetadataRule([], "red", "briefcase").matches("anything") is False
+
+    def test_matches_lower_with_mixed_case_keywords(self):
+        """Test keywords are lowercased so matches_lower sees them on lowered names."""
+        rule = KeywordMetadataRule(["PROD"], "red", "briefcase")
+
+        assert rule.matches_lower("my-prod-account") is True
+        assert rule.matches("MY-PROD-ACCOUNT") is True
+
     def test_get_color_returns_configured_color(self):
         """Test get_color returns the configured color."""
         rule = KeywordMetadataRule(["prod"], "red", "briefcase")
@@ -130,6 +146,50 @@ class TestProfileMetadataProvider:
         assert result["icon"] == "briefcase"
         assert result["name"] == "prod-account"  # Original data preserved
 
+    def test_get_metadata_returns_color_and_icon(self):
+        """Test get_metadata returns the (color, icon) pair in one lookup."""
+        rule1 = KeywordMetadataRule(["prod"], "red", "briefcase")
+
+        provider = ProfileMetadataProvider([rule1], default_color="blue", default_icon="circle")
+
+        assert provider.get_metadata("prod-account") == ("red", "briefcase")
+        assert provider.get_metadata("random-account") == ("blue", "circle")
+
+    def test_add_rule_applies_to_later_lookups(self):
+        """Test add_rule appends a lower-priority rule and drops cached results."""
+        provider = ProfileMetadataProvider([KeywordMetadataRule(["prod"], "red", "briefcase")])
+        assert provider.get_metadata("dev-prod") == ("red", "briefcase")
+        assert provider.get_metadata("dev-account") == ("blue", "circle")
+
+        provider.add_rule(KeywordMetadataRule(["dev"], "green", "fingerprint"))
+
+        assert provider.get_metadata("dev-prod") == ("red", "briefcase")
+        assert provider.get_metadata("dev-account") == ("green", "fingerprint")
+
+    def test_add_rule_only_resets_its_own_provider(self):
+        """Test cached lookups are per provider, so add_rule leaves other providers alone."""
+        first = ProfileMetadataProvider([KeywordMetadataRule(["prod"], "red", "briefcase")])
+        second = ProfileMetadataProvider([])
+        assert first.get_metadata("dev-account") == ("blue", "circle")
+        assert second.get_metadata("dev-account") == ("blue", "circle")
+
+        second.add_rule(KeywordMetadataRule(["dev"], "green", "fingerprint"))
+
+        assert second.get_metadata("dev-account") == ("green", "fingerprint")
+        assert first._metadata_cache == {"dev-account": ("blue", "circle")}
+
+    def test_custom_rule_is_matched_on_original_name(self):
+        """Test rules without matches_lower are called through matches with the raw name."""
+        rule = Mock(spec=["matches", "get_color", "get_icon"])
+        rule.matches.side_effect = lambda name: name == "Prod"
+        rule.get_color.return_value = "red"
+        rule.get_icon.return_value = "briefcase"
+
+        provider = ProfileMetadataProvider([rule])
+
+        assert provider.get_metadata("Prod") == ("red", "briefcase")
+        assert provider.get_metadata("prod") == ("blue", "circle")
+
     def test_rules_are_evaluated_in_order(self):
         """Test rules are evaluated in order and first match wins."""
         # Both rules would match 'prod-dev', but first should win
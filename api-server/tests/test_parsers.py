@@ -5,6 +5,9 @@ Unit tests for file_parsers module.
 Uses mocks extensively to avoid file system dependencies.
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from unittest.mock import Mock, mock_open, patch, MagicMock
 from pathlib import Path
@@ -42,7 +45,8 @@ class TestFileCache:
         mock_path = Mock(spec=Path)
         mock_path.exists.return_value = True
         mock_stat = Mock()
-        mock_stat.st_mtime = 12345.0
+        mock_stat.st_mtime_ns = 12345000000000
+        mock_stat.st_size = 100
         mock_path.stat.return_value = mock_stat
 
         # Set data
@@ -61,7 +65,8 @@ class TestFileCache:
 
         # First mtime
         mock_stat1 = Mock()
-        mock_stat1.st_mtime = 12345.0
+        mock_stat1.st_mtime_ns = 12345000000000
+        mock_stat1.st_size = 100
         mock_path.stat.return_value = mock_stat1
 
         test_data = [{"name": "test"}]
@@ -69,7 +74,8 @@ class TestFileCache:
 
         # Change mtime
         mock_stat2 = Mock()
-        mock_stat2.st_mtime = 67890.0
+        mock_stat2.st_mtime_ns = 67890000000000
+        mock_stat2.st_size = 100
         mock_path.stat.return_value = mock_stat2
 
         # Should return None (cache invalidated)
@@ -82,7 +88,8 @@ class TestFileCache:
         mock_path = Mock(spec=Path)
         mock_path.exists.return_value = True
         mock_stat = Mock()
-        mock_stat.st_mtime = 12345.0
+        mock_stat.st_mtime_ns = 12345000000000
+        mock_stat.st_size = 100
         mock_path.stat.return_value = mock_stat
 
         cache.set(mock_path, [{"name": "test"}])
@@ -91,6 +98,43 @@ class TestFileCache:
         result = cache.get(mock_path)
         assert result is None
 
+    def test_get_or_compute_runs_producer_once_for_concurrent_misses(self, tmp_path):
+        """Test concurrent misses on one file share a single producer call."""
+        cache = FileCache()
+        path = tmp_path / "config"
+        path.write_text("[default]\n")
+        calls = []
+        release = threading.Event()
+
+        def producer():
+            calls.append(1)
+            release.wait(1)
+            return ["parsed"]
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(cache.get_or_compute, path, producer) for _ in range(4)]
+            release.set()
+            results = [f.result() for f in futures]
+
+        assert results == [["parsed"]] * 4
+        assert len(calls) == 1
+
+    def test_cache_evicts_least_recently_used(self, tmp_path):
+        """Test cache keeps only the most recently used files."""
+        cache = FileCache(maxsize=2)
+        paths = [tmp_path / name for name in ("a", "b", "c")]
+        for path in paths:
+            path.write_text(path.name)
+
+        cache.set(paths[0], "a")
+        cache.set(paths[1], "b")
+        assert cache.get(paths[0]) == "a"  # a is now more recent than b
+        cache.set(paths[2], "c")
+
+        assert cache.get(paths[0]) == "a"
+        assert cache.get(paths[1]) is None
+        assert cache.get(paths[2]) == "c"
+
 
 class TestCredentialsFileParser:
     """Test CredentialsFileParser class."""
@@ -114,7 +158,7 @@ aws_secret_access_key = wJalrXUtnFEMI/K7MDENG/bPxRfiCYEXAMPLEKEY
         mock_path = Mock(spec=Path)
         mock_path.exists.return_value = True
         mock_stat = Mock()
-        mock_stat.st_mtime = 12345.0
+        mock_stat.st_mtime_ns = 12345000000000
         mock_path.stat.return_value = mock_stat
 
         parser = CredentialsFileParser(mock_path)
@@ -140,7 +184,7 @@ aws_secret_access_key = SECRET2
         mock_path = Mock(spec=Path)
         mock_path.exists.return_value = True
         mock_stat = Mock()
-        mock_stat.st_mtime = 12345.0
+        mock_stat.st_mtime_ns = 12345000000000
         mock_path.stat.return_value = mock_stat
 
         parser = CredentialsFileParser(mock_path)
@@ -164,7 +208,7 @@ aws_session_token = TOKEN
         mock_path = Mock(spec=Path)
         mock_path.exists.return_value = True
         mock_stat = Mock()
-        mock_stat.st_mtime = 12345.0
+        mock_stat.st_mtime_ns = 12345000000000
         mock_path.stat.return_value = mock_stat
 
         parser = CredentialsFileParser(mock_path)
@@ -176,6 +220,46 @@ aws_session_token = TOKEN
         assert result[0]["expiration"] is not None
         assert "2024-12-31" in result[0]["expiration"]
 
+    def test_parser_rechecks_expiry_on_each_parse(self, tmp_path):
+        """Test memoized expiration comments are still judged against the current time."""
+        credentials_file = tmp_path / "credentials"
+        credentials_file.write_text("[temp]\n# Expires 2030-01-01 00:00:00 UTC\n")
+
+        def parse_at(now):
+            class FrozenDatetime(datetime):
+                @classmethod
+                def now(cls, tz=None):
+                    return now
+
+            with patch("aws_profile_bridge.core.parsers.datetime", FrozenDatetime):
+                return CredentialsFileParser(credentials_file).parse()
+
+        assert parse_at(datetime(2029, 1, 1, tzinfo=timezone.utc))[0]["expired"] is False
+        assert parse_at(datetime(2031, 1, 1, tzinfo=timezone.utc))[0]["expired"] is True
+
+    def test_interleaved_parses_keep_their_own_reference_time(self, tmp_path):
+        """Test two in-progress parses on one parser each judge expiry by their own clock."""
+        credentials_file = tmp_path / "credentials"
+        credentials_file.write_text(
+            "[a]\n# Expires 2030-01-01 00:00:00 UTC\n[b]\n# Expires 2030-01-01 00:00:00 UTC\n"
+        )
+        parser = CredentialsFileParser(credentials_file)
+        readings = iter(
+            [datetime(2029, 1, 1, tzinfo=timezone.utc), datetime(2031, 1, 1, tzinfo=timezone.utc)]
+        )
+
+        class SteppingDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return next(readings)
+
+        with patch("aws_profile_bridge.core.parsers.datetime", SteppingDatetime):
+            early = parser._iter_profiles()
+            assert next(early)["expired"] is False
+            late = parser._iter_profiles()
+            assert next(late)["expired"] is True
+            assert next(early)["expired"] is False
+
     def test_parser_uses_cache(self):
         """Test parser uses cache for repeated calls."""
         credentials_content = """[default]
@@ -185,11 +269,12 @@ aws_secret_access_key = SECRET
         mock_path = Mock(spec=Path)
         mock_path.exists.return_value = True
         mock_stat = Mock()
-        mock_stat.st_mtime = 12345.0
+        mock_stat.st_mtime_ns = 12345000000000
         mock_path.stat.return_value = mock_stat
 
         mock_cache = Mock(spec=FileCache)
         mock_cache.get.return_value = None  # First call
+        mock_cache.get_or_compute.side_effect = lambda path, producer: producer()
 
         parser = CredentialsFileParser(mock_path, mock_cache)
 
@@ -198,7 +283,7 @@ aws_secret_access_key = SECRET
 
         # Verify cache was used
         mock_cache.get.assert_called_once()
-        mock_cache.set.assert_called_once()
+        mock_cache.get_or_compute.assert_called_once()
 
         # Second call should use cache
         mock_cache.get.return_value = result1
@@ -206,6 +291,7 @@ aws_secret_access_key = SECRET
 
         assert result1 == result2
         assert mock_cache.get.call_count == 2
+        mock_cache.get_or_compute.assert_called_once()
 
     def test_parser_handles_profile_without_credentials(self):
         """Test parser handles profile sections without actual credentials."""
@@ -215,7 +301,7 @@ region = us-east-1
         mock_path = Mock(spec=Path)
         mock_path.exists.return_value = True
         mock_stat = Mock()
-        mock_stat.st_mtime = 12345.0
+        mock_stat.st_mtime_ns = 12345000000000
         mock_path.stat.return_value = mock_stat
 
         parser = CredentialsFileParser(mock_path)
@@ -252,7 +338,7 @@ region = us-west-2
         mock_path = Mock(spec=Path)
         mock_path.exists.return_value = True
         mock_stat = Mock()
-        mock_stat.st_mtime = 12345.0
+        mock_stat.st_mtime_ns = 12345000000000
         mock_path.stat.return_value = mock_stat
 
         parser = ConfigFileParser(mock_path)
@@ -281,7 +367,7 @@ sso_role_name = Admin
         mock_path = Mock(spec=Path)
         mock_path.exists.return_value = True
         mock_stat = Mock()
-        mock_stat.st_mtime = 12345.0
+        mock_stat.st_mtime_ns = 12345000000000
         mock_path.stat.return_value = mock_stat
 
         parser = ConfigFileParser(mock_path)
@@ -305,7 +391,7 @@ sso_role_name = Admin
         mock_path = Mock(spec=Path)
         mock_path.exists.return_value = True
         mock_stat = Mock()
-        mock_stat.st_mtime = 12345.0
+        mock_stat.st_mtime_ns = 12345000000000
         mock_path.stat.return_value = mock_stat
 
         parser = ConfigFileParser(mock_path)
@@ -413,3 +499,26 @@ sso_role_name = Admin
         result = reader.get_config("test-profile")
 
         assert result is None
+
+    def test_reads_each_file_once_for_many_lookups(self):
+        """Test lookups for several profiles share one scan of each file."""
+        config_content = """[profile a]
+region = us-west-2
+
+[profile b]
+sso_start_url = https://example.com/start
+"""
+        mock_cred_path = Mock(spec=Path)
+        mock_cred_path.exists.return_value = False
+        mock_config_path = Mock(spec=Path)
+        mock_config_path.exists.return_value = True
+        mock_config_path.stat.return_value = Mock(st_mtime_ns=12345000000000, st_size=100)
+
+        reader = ProfileConfigReader(mock_cred_path, mock_config_path)
+
+        with patch("builtins.open", mock_open(read_data=config_content)) as m:
+            assert reader.get_config("a") == {"region": "us-west-2"}
+            assert reader.get_config("b") == {"sso_start_url": "https://example.com/start"}
+            assert reader.get_config("c") is None
+
+        m.assert_called_once()
@@ -48,8 +48,8 @@ class TestRateLimiterTokenHashing:
         limiter = RateLimiter(max_attempts=3, window_seconds=60)
 
         hash_none = limiter._hash_token(None)
-        assert isinstance(hash_none, str)
-        assert len(hash_none) == 64  # SHA256 hex digest length
+        assert isinstance(hash_none, bytes)
+        assert len(hash_none) == 16  # BLAKE2b-128 digest length
 
 
 class TestRateLimiterFailureRecording:
@@ -182,6 +182,25 @@ class TestRateLimiterCleanup:
         token_id = limiter._hash_token(token)
         assert len(limiter._attempts[token_id]) == 1
 
+    def test_cleanup_drops_empty_buckets(self):
+        """Test that buckets with no recent attempts are removed."""
+        limiter = RateLimiter(max_attempts=3, window_seconds=1)
+        token = "test-token"
+
+        limiter.record_failure(token)
+        time.sleep(1.1)
+        limiter.is_rate_limited(token)
+
+        assert limiter._hash_token(token) not in limiter._attempts
+
+    def test_unknown_token_check_does_not_create_bucket(self):
+        """Test that checking an unseen token doesn't grow the attempts dict."""
+        limiter = RateLimiter(max_attempts=3, window_seconds=60)
+
+        limiter.is_rate_limited("never-failed")
+
+        assert limiter._attempts == {}
+
     def test_rate_limit_resets_after_window(self):
         """Test that rate limit resets after window expires."""
         limiter = RateLimiter(max_attempts=2, window_seconds=1)
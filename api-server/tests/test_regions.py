@@ -0,0 +1,138 @@
+"""Tests for the stale-while-revalidate regions cache."""
+
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+
+from aws_profile_bridge.api import regions
+
+
+@pytest.fixture
+def cache_file(tmp_path):
+    """Point the regions cache at a temporary file and reset memory state."""
+    path = tmp_path / "regions.json"
+    with (
+        patch.object(regions.settings, "REGIONS_CACHE_FILE", path),
+        patch.object(regions, "regions_cache", []),
+    ):
+        yield path
+
+
+class TestRefreshRegions:
+    """Test background refresh behaviour."""
+
+    def test_refresh_replaces_cache_and_persists(self, cache_file):
+        """Test successful refresh updates memory and disk."""
+        fetched = [{"code": "us-east-1", "name": "us-east-1"}]
+
+        with patch.object(regions, "fetch_aws_regions", return_value=fetched):
+            assert regions.refresh_regions() is True
+
+        assert regions.regions_cache == fetched
+        assert json.loads(cache_file.read_text()) == fetched
+
+    def test_refresh_failure_keeps_stale_data(self, cache_file):
+        """Test failed refresh leaves the previous regions in place."""
+        stale = [{"code": "eu-west-1", "name": "eu-west-1"}]
+        regions.regions_cache = stale
+
+        with patch.object(regions, "fetch_aws_regions", return_value=None):
+            assert regions.refresh_regions() is False
+
+        assert regions.regions_cache == stale
+        assert not cache_file.exists()
+
+
+class TestFetchRegions:
+    """Test fetching regions through the shared EC2 client."""
+
+    def test_fetch_sorts_regions(self):
+        """Test regions are returned sorted by code."""
+        with patch.object(regions, "_ec2_client") as mock_ec2:
+            mock_ec2.describe_regions.return_value = {
+                "Regions": [{"RegionName": "us-west-2"}, {"RegionName": "eu-west-1"}]
+            }
+            result = regions.fetch_aws_regions()
+
+        assert [r["code"] for r in result] == ["eu-west-1", "us-west-2"]
+
+    def test_fetch_failure_returns_none(self):
+        """Test API errors are reported as None."""
+        with patch.object(regions, "_ec2_client") as mock_ec2:
+            mock_ec2.describe_regions.side_effect = Exception("network down")
+
+            assert regions.fetch_aws_regions() is None
+
+    def test_client_created_once(self):
+        """Test the EC2 client is built once and reused."""
+        with (
+            patch.object(regions, "_ec2_client", None),
+            patch("boto3.client") as mock_client,
+        ):
+            first = regions.get_ec2_client()
+            second = regions.get_ec2_client()
+
+        assert first is second
+        mock_client.assert_called_once_with("ec2", region_name="us-east-1")
+
+
+class TestLoadCachedRegions:
+    """Test seeding the cache from disk."""
+
+    def test_load_from_disk(self, cache_file):
+        """Test last known regions are loaded at startup."""
+        saved = [{"code": "ap-south-1", "name": "ap-south-1"}]
+        cache_file.write_text(json.dumps(saved))
+
+        regions.load_cached_regions()
+
+        assert regions.regions_cache == saved
+
+    def test_load_missing_file(self, cache_file):
+        """Test missing cache file leaves the cache empty."""
+        regions.load_cached_regions()
+
+        assert regions.regions_cache == []
+
+    def test_load_corrupt_file(self, cache_file):
+        """Test unreadable cache file is ignored."""
+        cache_file.write_text("{not json")
+
+        regions.load_cached_regions()
+
+        assert regions.regions_cache == []
+
+
+class TestListRegions:
+    """Test the /regions handler on a cold cache."""
+
+    @pytest.mark.asyncio
+    async def test_empty_cache_is_filled_in_request(self, cache_file):
+        """Test the first request without a cache fetches regions instead of returning []."""
+        fetched = [{"code": "us-east-1", "name": "us-east-1"}]
+
+        with (
+            patch.object(regions, "authenticator"),
+            patch.object(regions, "fetch_aws_regions", return_value=fetched) as fetch,
+        ):
+            assert await regions.list_regions("token") == {"regions": fetched}
+            assert await regions.list_regions("token") == {"regions": fetched}
+
+        fetch.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_cold_fill_is_bounded(self, cache_file):
+        """Test a slow fetch does not hold the request past REGIONS_COLD_FILL_TIMEOUT."""
+
+        def slow_fetch():
+            time.sleep(0.2)
+            return None
+
+        with (
+            patch.object(regions, "authenticator"),
+            patch.object(regions.settings, "REGIONS_COLD_FILL_TIMEOUT", 0.01),
+            patch.object(regions, "fetch_aws_regions", side_effect=slow_fetch),
+        ):
+            assert await regions.list_regions("token") == {"regions": []}
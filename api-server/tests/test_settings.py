@@ -0,0 +1,57 @@
+"""Tests for lazily resolved settings paths."""
+
+from pathlib import Path
+
+import pytest
+
+from aws_profile_bridge.config import settings
+
+
+@pytest.fixture
+def fresh_settings(monkeypatch):
+    """Forget every resolved lazy path for the duration of a test."""
+    for name in settings._LAZY_PATHS:
+        monkeypatch.delitem(vars(settings), name, raising=False)
+    return settings
+
+
+def test_derived_paths_follow_overridden_config_file(fresh_settings, tmp_path):
+    """Test paths derived from CONFIG_FILE use an override set before first access."""
+    config_file = tmp_path / "cfg.json"
+    fresh_settings.CONFIG_FILE = config_file
+
+    assert fresh_settings.SERVER_PID_FILE == tmp_path / "profile_bridge_server.pid"
+    assert fresh_settings.QR_CACHE_FILE == tmp_path / "profile_bridge_token.qr"
+    assert fresh_settings.CONFIG_FILE == config_file
+
+
+def test_derived_paths_follow_overridden_log_dir(fresh_settings, tmp_path):
+    """Test paths derived from LOG_DIR use an override set before first access."""
+    fresh_settings.LOG_DIR = tmp_path
+
+    assert fresh_settings.LOG_FILE == tmp_path / "aws_profile_bridge_api.log"
+    assert fresh_settings.REGIONS_CACHE_FILE == tmp_path / "regions.json"
+    assert fresh_settings.LOG_DIR == tmp_path
+
+
+def test_aws_files_follow_overridden_aws_dir(fresh_settings, tmp_path):
+    """Test the AWS config and credentials paths resolve under an overridden AWS_DIR."""
+    fresh_settings.AWS_DIR = tmp_path
+
+    assert fresh_settings.AWS_CONFIG_FILE == tmp_path / "config"
+    assert fresh_settings.AWS_CREDENTIALS_FILE == tmp_path / "credentials"
+
+
+
+def test_app_files_follow_overridden_aws_dir(fresh_settings, tmp_path):
+    """Test the log, config and PID paths resolve under an overridden AWS_DIR."""
+    fresh_settings.AWS_DIR = tmp_path
+
+    assert fresh_settings.LOG_FILE == tmp_path / "logs" / "aws_profile_bridge_api.log"
+    assert fresh_settings.CONFIG_FILE == tmp_path / "profile_bridge_config.json"
+    assert fresh_settings.SERVER_PID_FILE == tmp_path / "profile_bridge_server.pid"
+
+
+def test_paths_default_under_home_aws_dir(fresh_settings):
+    """Test unset paths resolve under ~/.aws."""
+    assert fresh_settings.SERVER_PID_FILE == Path.home() / ".aws" / "profile_bridge_server.pid"
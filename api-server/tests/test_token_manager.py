@@ -34,16 +34,22 @@ class TestTokenGeneration:
         assert TokenManager.validate_format(token) is True
 
     def test_base62_encoding(self):
-        """Test Base62 encoding."""
-        # Test zero
-        assert TokenManager._encode_base62(b"\x00") == "0"
+        """Test fixed-width Base62 encoding."""
+        # Test zero pads to full width
+        assert TokenManager._encode_base62_32(b"\x00" * 32) == b"0" * 43
+        assert TokenManager._encode_base62_4(0) == "000000"
 
         # Test small number
-        result = TokenManager._encode_base62(b"\x00\x00\x00\x01")
-        assert result.isalnum()
+        assert TokenManager._encode_base62_4(61) == "00000z"
+        assert TokenManager._encode_base62_4(62) == "000010"
 
-        # Test all bytes generate valid Base62
-        result = TokenManager._encode_base62(b"\xff" * 4)
+        # Test maximum inputs still fit and generate valid Base62
+        result = TokenManager._encode_base62_32(b"\xff" * 32).decode("ascii")
+        assert len(result) == 43
+        assert all(c in TokenManager.BASE62_ALPHABET for c in result)
+
+        result = TokenManager._encode_base62_4(0xFFFFFFFF)
+        assert len(result) == 6
         assert all(c in TokenManager.BASE62_ALPHABET for c in result)
 
     def test_checksum_calculation(self):
@@ -56,6 +62,14 @@ class TestTokenGeneration:
         assert len(checksum1) == 6
         assert all(c in TokenManager.BASE62_ALPHABET for c in checksum1)
 
+    def test_checksum_same_for_str_and_bytes(self):
+        """Test checksum over ASCII bytes matches checksum over the string."""
+        data = "abcDEF0123456789abcDEF0123456789abcDEF01234"
+
+        assert TokenManager._calculate_checksum(data.encode("ascii")) == (
+            TokenManager._calculate_checksum(data)
+        )
+
     def test_checksum_different_for_different_data(self):
         """Test that different data produces different checksums."""
         data1 = "random_part_1" + "0" * 30
@@ -139,6 +153,13 @@ class TestTokenValidation:
         assert TokenManager.LEGACY_PATTERN.match("a" * 31) is None  # Too short
         assert TokenManager.LEGACY_PATTERN.match("a" * 65) is None  # Too long
 
+    def test_classify(self):
+        """Test tokens are classified as new, legacy or invalid."""
+        assert TokenManager.classify(TokenManager.generate_token()) == "new"
+        assert TokenManager.classify("a" * 32) == "legacy"
+        assert TokenManager.classify("awspc_" + "A" * 43 + "_000000") == "invalid"
+        assert TokenManager.classify("") == "invalid"
+
 
 class TestTokenManager:
     """Test TokenManager class functionality."""
@@ -215,6 +236,12 @@ class TestTokenManager:
             # None
             assert manager.validate(None) is False
 
+    def test_validate_without_loaded_token(self):
+        """Test that validate rejects everything before a token is loaded."""
+        manager = TokenManager(Path("/nonexistent/config.json"))
+
+        assert manager.validate(TokenManager.generate_token()) is False
+
     def test_config_file_permissions(self):
         """Test that config file has correct permissions."""
         with tempfile.TemporaryDirectory() as tmpdir:
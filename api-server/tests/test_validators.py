@@ -66,6 +66,7 @@ class TestValidateProfileName:
             "profile)name",  # )
             "../profile",  # Path traversal
             "profile\x00name",  # Null byte
+            "profile\n",  # Trailing newline
         ]
 
         for name in invalid_names: